@@ -0,0 +1,6 @@
+"""
+Benchmarks for lattices, in the format of airspeed velocity (asv).
+
+Run them with `asv run`, and compare two commits with `asv compare`; the timings
+and peak memory usage are recorded as JSON under `.asv/results`.
+"""
@@ -0,0 +1,54 @@
+"""
+Benchmarks of constructing lattices.
+"""
+
+from lattices.lattices import free_distributive_lattice, partition_lattice, powerset_lattice
+
+
+FAMILIES = {
+    'powerset': powerset_lattice,
+    'partition': partition_lattice,
+    'free_distributive': free_distributive_lattice,
+}
+
+
+class Construction(object):
+    """
+    Construct the standard families of lattices.
+    """
+
+    params = (sorted(FAMILIES), [2, 3, 4])
+    param_names = ['family', 'size']
+
+    def time_construction(self, family, size):
+        """
+        Time constructing the lattice.
+        """
+        FAMILIES[family](range(size))
+
+    def peakmem_construction(self, family, size):
+        """
+        Record the peak memory of constructing the lattice.
+        """
+        FAMILIES[family](range(size))
+
+
+class LargePowerset(object):
+    """
+    Construct larger powerset lattices.
+    """
+
+    params = [6, 7, 8]
+    param_names = ['size']
+
+    def time_construction(self, size):
+        """
+        Time constructing the lattice.
+        """
+        powerset_lattice(range(size))
+
+    def peakmem_construction(self, size):
+        """
+        Record the peak memory of constructing the lattice.
+        """
+        powerset_lattice(range(size))
@@ -0,0 +1,13 @@
+"""
+Benchmarks of importing the package.
+"""
+
+
+def timeraw_import_lattices():
+    """
+    Time importing `lattices.lattices` in a fresh interpreter, which also
+    constructs M3 and N5.
+    """
+    return """
+    import lattices.lattices
+    """
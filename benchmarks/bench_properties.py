@@ -0,0 +1,61 @@
+"""
+Benchmarks of checking properties of a lattice.
+"""
+
+from lattices.lattices import M3, N5, free_distributive_lattice, partition_lattice, powerset_lattice
+
+
+FAMILIES = {
+    'M3': lambda: M3,
+    'N5': lambda: N5,
+    'powerset': lambda: powerset_lattice(range(4)),
+    'partition': lambda: partition_lattice(range(4)),
+    'free_distributive': lambda: free_distributive_lattice(range(3)),
+}
+
+
+class Properties(object):
+    """
+    Check distributivity and modularity, and find complements and chains.
+    """
+
+    params = sorted(FAMILIES)
+    param_names = ['family']
+
+    def setup(self, family):
+        """
+        Construct the lattice.
+        """
+        self.lattice = FAMILIES[family]()
+
+    def time_distributive(self, family):
+        """
+        Time checking distributivity.
+        """
+        self.lattice.distributive
+
+    def time_modular(self, family):
+        """
+        Time checking modularity.
+        """
+        self.lattice.modular
+
+    def time_complement(self, family):
+        """
+        Time finding the complements of every node.
+        """
+        for node in self.lattice:
+            self.lattice.complement(node)
+
+    def time_chains(self, family):
+        """
+        Time enumerating the maximal chains.
+        """
+        for _ in self.lattice.chains():
+            pass
+
+    def peakmem_distributive(self, family):
+        """
+        Record the peak memory of checking distributivity.
+        """
+        self.lattice.distributive
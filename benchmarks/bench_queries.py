@@ -0,0 +1,67 @@
+"""
+Benchmarks of queries on a constructed lattice.
+"""
+
+from itertools import product
+
+from lattices.lattices import free_distributive_lattice, partition_lattice, powerset_lattice
+
+
+FAMILIES = {
+    'powerset': lambda: powerset_lattice(range(6)),
+    'partition': lambda: partition_lattice(range(4)),
+    'free_distributive': lambda: free_distributive_lattice(range(4)),
+}
+
+
+class Queries(object):
+    """
+    Join, meet and reachability over every pair of nodes.
+    """
+
+    params = sorted(FAMILIES)
+    param_names = ['family']
+
+    def setup(self, family):
+        """
+        Construct the lattice and the pairs of nodes.
+        """
+        self.lattice = FAMILIES[family]()
+        self.nodes = list(self.lattice)
+        self.pairs = list(product(self.nodes, repeat=2))
+
+    def time_join(self, family):
+        """
+        Time the join of every pair.
+        """
+        join = self.lattice.join
+        for a, b in self.pairs:
+            join(a, b)
+
+    def time_meet(self, family):
+        """
+        Time the meet of every pair.
+        """
+        meet = self.lattice.meet
+        for a, b in self.pairs:
+            meet(a, b)
+
+    def time_join_many(self, family):
+        """
+        Time the batched join of every pair.
+        """
+        self.lattice.join_many(self.pairs)
+
+    def time_ascendants(self, family):
+        """
+        Time the ascendants of every node.
+        """
+        for node in self.nodes:
+            self.lattice.ascendants(node)
+
+    def time_descendants(self, family):
+        """
+        Time the descendants of every node.
+        """
+        for node in self.nodes:
+            self.lattice.descendants(node)
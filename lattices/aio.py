@@ -0,0 +1,88 @@
+"""
+An asyncio layer over the construction of lattices and their heavier queries.
+
+The work itself is done by an executor, by default the event loop's, so the
+event loop stays free to run other coroutines. Cancelling the awaiting task
+cancels a construction at its next check, through a `CancellationToken`; see
+`lattices.progress`. Cancellation reaches the worker only through a shared
+token, so it needs a thread pool rather than a process pool.
+
+`Lattice.ajoin`, `Lattice.ameet` and `Lattice.achains` are the awaitable
+counterparts of `join`, `meet` and `chains`.
+"""
+
+import asyncio
+from functools import partial
+
+from .lattice import Lattice
+from .progress import CancellationToken
+
+
+__all__ = [
+    'build_lattice',
+    'run',
+]
+
+
+async def run(func, *args, executor=None, **kwargs):
+    """
+    Call `func` in `executor`, without blocking the event loop; for example
+    `await run(lambda: lattice.distributive)`.
+
+    Parameters
+    ----------
+    func : func
+        The function to call.
+    args : tuple
+        Its positional arguments.
+    executor : concurrent.futures.Executor, None
+        The executor in which to call it. If None, the event loop's default.
+    kwargs : dict
+        Its keyword arguments.
+
+    Returns
+    -------
+    result : object
+        What `func` returns.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+async def build_lattice(*args, constructor=Lattice, executor=None, token=None, **kwargs):
+    """
+    Construct a lattice in `executor`, without blocking the event loop.
+
+    Parameters
+    ----------
+    args : tuple
+        The positional arguments of `constructor`; for `Lattice`, the nodes
+        and their relationship.
+    constructor : func
+        The constructor to call: `Lattice`, or any of those in
+        `lattices.lattices` which accept a `token`.
+    executor : concurrent.futures.Executor, None
+        The executor in which to construct the lattice. If None, the event
+        loop's default.
+    token : CancellationToken, None
+        A token through which to cancel the construction. One is created if
+        None, and it is cancelled if the awaiting task is.
+    kwargs : dict
+        The keyword arguments of `constructor`, such as `progress`.
+
+    Returns
+    -------
+    lattice : Lattice
+        The lattice constructed.
+
+    Raises
+    ------
+    Cancelled
+        Raised if `token` cancels the construction.
+    """
+    token = CancellationToken() if token is None else token
+    try:
+        return await run(constructor, *args, executor=executor, token=token, **kwargs)
+    except asyncio.CancelledError:
+        token.cancel()
+        raise
@@ -0,0 +1,637 @@
+"""
+Storage backends for the cover relation and reachability of a lattice.
+
+Every backend indexes the nodes by their position in a topological order, top
+first, and provides the upper and lower covers of each index along with the
+up-set and down-set of each index as int bitsets. They differ in how these are
+stored:
+
+- `NetworkXBackend` keeps an `nx.DiGraph` of the nodes and every bitset; it is
+  the only one which can be modified. The other backends build a graph only
+  when one is asked for, and do not keep it.
+- `BitMatrixBackend` keeps the covers as lists and the reachability as packed
+  NumPy bit matrices, from which bitsets are unpacked on demand.
+- `CSRBackend` keeps the covers as compressed sparse rows, and finds each
+  bitset by a search of the covers when it is first needed, so nothing
+  quadratic in the size of the lattice is stored up front.
+"""
+
+from collections import OrderedDict
+
+import networkx as nx
+import numpy as np
+
+
+__all__ = [
+    'Backend',
+    'NetworkXBackend',
+    'BitMatrixBackend',
+    'CSRBackend',
+    'BACKENDS',
+    'select_backend',
+]
+
+
+# The largest lattices for which each backend is chosen automatically.
+NETWORKX_SIZE = 2**12
+BITMATRIX_SIZE = 2**14
+
+
+class Backend(object):
+    """
+    The interface of a lattice backend.
+
+    Attributes
+    ----------
+    up : sequence
+        The up-set of each index, as an int bitset.
+    down : sequence
+        The down-set of each index, as an int bitset.
+    """
+
+    name = None
+
+    # Whether `packed` should only be asked for the rows in use, since the whole
+    # matrix may not fit in memory.
+    streamed = False
+
+    def __init__(self, nodes, index):
+        """
+        Parameters
+        ----------
+        nodes : list
+            The nodes, in topological order from the top.
+        index : dict
+            The position of each node in `nodes`.
+        """
+        self.nodes = nodes
+        self.index = index
+
+    @classmethod
+    def from_edges(cls, nodes, index, edges):
+        """
+        Construct the backend from the cover relation.
+
+        Parameters
+        ----------
+        nodes : list
+            The nodes, in topological order from the top.
+        index : dict
+            The position of each node in `nodes`.
+        edges : iterable
+            The pairs (upper, lower) of indices of the cover relation.
+
+        Returns
+        -------
+        backend : Backend
+            The backend.
+        """
+        raise NotImplementedError
+
+    def lowers(self, i):
+        """
+        Parameters
+        ----------
+        i : int
+            The index of a node.
+
+        Returns
+        -------
+        lowers : sequence
+            The indices of the nodes covered by node `i`.
+        """
+        raise NotImplementedError
+
+    def uppers(self, i):
+        """
+        Parameters
+        ----------
+        i : int
+            The index of a node.
+
+        Returns
+        -------
+        uppers : sequence
+            The indices of the nodes covering node `i`.
+        """
+        raise NotImplementedError
+
+    def edges(self):
+        """
+        Yields
+        ------
+        edge : (int, int)
+            Each pair (upper, lower) of indices of the cover relation.
+        """
+        for i in range(len(self.nodes)):
+            for j in self.lowers(i):
+                yield i, int(j)
+
+    def graph(self):
+        """
+        The cover relation as a graph of the nodes, constructed on each call so
+        that it is not held alongside the backend's own storage.
+
+        Returns
+        -------
+        graph : nx.DiGraph
+            The cover relation, with edges pointing from each node to the
+            nodes it covers.
+        """
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.nodes)
+        graph.add_edges_from((self.nodes[i], self.nodes[j]) for i, j in self.edges())
+        return graph
+
+    def packed(self, direction, rows=None):
+        """
+        Pack the up-sets or down-sets into a byte matrix.
+
+        Parameters
+        ----------
+        direction : 'up', 'down'
+            Which bitsets to pack.
+        rows : np.ndarray, None
+            The indices whose bitsets to pack. If None, all of them.
+
+        Returns
+        -------
+        matrix : np.ndarray
+            An array whose row `k` holds the bitset of the `k`th of `rows` in
+            little-endian bytes.
+        """
+        bitsets = self.up if direction == 'up' else self.down
+        rows = range(len(self.nodes)) if rows is None else rows.tolist()
+        size = (len(self.nodes) + 7) // 8
+        data = b''.join(bitsets[i].to_bytes(size, 'little') for i in rows)
+        return np.frombuffer(data, dtype=np.uint8).reshape(len(rows), size)
+
+
+class NetworkXBackend(Backend):
+    """
+    A backend storing the cover relation as an `nx.DiGraph` of the nodes, and
+    the bitsets as lists.
+    """
+
+    name = 'networkx'
+
+    def __init__(self, nodes, index, graph):
+        """
+        Parameters
+        ----------
+        nodes : list
+            The nodes, in topological order from the top.
+        index : dict
+            The position of each node in `nodes`.
+        graph : nx.DiGraph
+            The cover relation, with edges pointing from each node to the
+            nodes it covers.
+        """
+        super().__init__(nodes, index)
+        self._graph = graph
+
+        self.up = []
+        for i, node in enumerate(nodes):
+            up = 1 << i
+            for parent in graph.pred[node]:
+                up |= self.up[index[parent]]
+            self.up.append(up)
+
+        self.down = [0] * len(nodes)
+        for i in reversed(range(len(nodes))):
+            down = 1 << i
+            for child in graph[nodes[i]]:
+                down |= self.down[index[child]]
+            self.down[i] = down
+
+    @classmethod
+    def from_edges(cls, nodes, index, edges):
+        """
+        Construct the backend from the cover relation.
+
+        Parameters
+        ----------
+        nodes : list
+            The nodes, in topological order from the top.
+        index : dict
+            The position of each node in `nodes`.
+        edges : iterable
+            The pairs (upper, lower) of indices of the cover relation.
+
+        Returns
+        -------
+        backend : NetworkXBackend
+            The backend.
+        """
+        graph = nx.DiGraph()
+        graph.add_nodes_from(nodes)
+        graph.add_edges_from((nodes[i], nodes[j]) for i, j in edges)
+        return cls(nodes, index, graph)
+
+    def lowers(self, i):
+        """
+        Parameters
+        ----------
+        i : int
+            The index of a node.
+
+        Returns
+        -------
+        lowers : [int]
+            The indices of the nodes covered by node `i`.
+        """
+        return [self.index[node] for node in self._graph[self.nodes[i]]]
+
+    def uppers(self, i):
+        """
+        Parameters
+        ----------
+        i : int
+            The index of a node.
+
+        Returns
+        -------
+        uppers : [int]
+            The indices of the nodes covering node `i`.
+        """
+        return [self.index[node] for node in self._graph.pred[self.nodes[i]]]
+
+    def graph(self):
+        """
+        The cover relation as a graph of the nodes, which is this backend's
+        storage.
+
+        Returns
+        -------
+        graph : nx.DiGraph
+            The cover relation, with edges pointing from each node to the
+            nodes it covers.
+        """
+        return self._graph
+
+
+class _Rows(object):
+    """
+    The rows of a packed bit matrix, unpacked into int bitsets when first
+    accessed.
+    """
+
+    def __init__(self, matrix):
+        """
+        Parameters
+        ----------
+        matrix : np.ndarray
+            A matrix of little-endian bytes, one bitset per row.
+        """
+        self._matrix = matrix
+        self._rows = [None] * len(matrix)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, i):
+        row = self._rows[i]
+        if row is None:
+            row = self._rows[i] = int.from_bytes(self._matrix[i].tobytes(), 'little')
+        return row
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class BitMatrixBackend(Backend):
+    """
+    A backend storing the covers as lists, and the up-sets and down-sets as
+    packed NumPy bit matrices.
+    """
+
+    name = 'bitmatrix'
+
+    def __init__(self, nodes, index, lowers, uppers):
+        """
+        Parameters
+        ----------
+        nodes : list
+            The nodes, in topological order from the top.
+        index : dict
+            The position of each node in `nodes`.
+        lowers : [[int]]
+            The lower covers of each index.
+        uppers : [[int]]
+            The upper covers of each index.
+        """
+        super().__init__(nodes, index)
+        self._lowers = lowers
+        self._uppers = uppers
+
+        n = len(nodes)
+        identity = np.zeros((n, (n + 7) // 8), dtype=np.uint8)
+        identity[np.arange(n), np.arange(n) // 8] = 1 << np.arange(n) % 8
+        self.up_matrix = identity.copy()
+        for i in range(n):
+            if uppers[i]:
+                self.up_matrix[i] |= np.bitwise_or.reduce(self.up_matrix[uppers[i]], axis=0)
+        self.down_matrix = identity
+        for i in reversed(range(n)):
+            if lowers[i]:
+                self.down_matrix[i] |= np.bitwise_or.reduce(self.down_matrix[lowers[i]], axis=0)
+
+        self.up = _Rows(self.up_matrix)
+        self.down = _Rows(self.down_matrix)
+
+    @classmethod
+    def from_edges(cls, nodes, index, edges):
+        """
+        Construct the backend from the cover relation.
+
+        Parameters
+        ----------
+        nodes : list
+            The nodes, in topological order from the top.
+        index : dict
+            The position of each node in `nodes`.
+        edges : iterable
+            The pairs (upper, lower) of indices of the cover relation.
+
+        Returns
+        -------
+        backend : BitMatrixBackend
+            The backend.
+        """
+        lowers = [[] for _ in nodes]
+        uppers = [[] for _ in nodes]
+        for i, j in edges:
+            lowers[i].append(j)
+            uppers[j].append(i)
+        return cls(nodes, index, lowers, uppers)
+
+    def lowers(self, i):
+        """
+        Parameters
+        ----------
+        i : int
+            The index of a node.
+
+        Returns
+        -------
+        lowers : [int]
+            The indices of the nodes covered by node `i`.
+        """
+        return self._lowers[i]
+
+    def uppers(self, i):
+        """
+        Parameters
+        ----------
+        i : int
+            The index of a node.
+
+        Returns
+        -------
+        uppers : [int]
+            The indices of the nodes covering node `i`.
+        """
+        return self._uppers[i]
+
+    def packed(self, direction, rows=None):
+        """
+        Share the packed up-sets or down-sets, which are this backend's storage.
+
+        Parameters
+        ----------
+        direction : 'up', 'down'
+            Which bitsets to return.
+        rows : np.ndarray, None
+            The indices whose bitsets to return. If None, all of them.
+
+        Returns
+        -------
+        matrix : np.ndarray
+            An array whose row `k` holds the bitset of the `k`th of `rows` in
+            little-endian bytes.
+        """
+        matrix = self.up_matrix if direction == 'up' else self.down_matrix
+        return matrix if rows is None else matrix[rows]
+
+
+class _Reach(object):
+    """
+    The nodes reachable from each index along a sparse adjacency, found by a
+    search when first accessed.
+    """
+
+    def __init__(self, indptr, indices, cache_size=None):
+        """
+        Parameters
+        ----------
+        indptr : np.ndarray
+            The offsets of each index's neighbors in `indices`.
+        indices : np.ndarray
+            The neighbors of every index, concatenated.
+        cache_size : int, None
+            The most rows to keep, the least recently used being discarded.
+            None for no limit.
+        """
+        self._indptr = indptr
+        self._indices = indices
+        self._rows = OrderedDict()
+        self._cache_size = cache_size
+
+    def __len__(self):
+        return len(self._indptr) - 1
+
+    def __getitem__(self, i):
+        if i in self._rows:
+            if self._cache_size is not None:
+                self._rows.move_to_end(i)
+        else:
+            seen = bytearray((len(self) + 7) // 8)
+            seen[i >> 3] |= 1 << (i & 7)
+            stack = [i]
+            while stack:
+                j = stack.pop()
+                for k in self._indices[self._indptr[j]:self._indptr[j + 1]].tolist():
+                    if not seen[k >> 3] >> (k & 7) & 1:
+                        seen[k >> 3] |= 1 << (k & 7)
+                        stack.append(k)
+            self._rows[i] = int.from_bytes(seen, 'little')
+            if self._cache_size is not None and len(self._rows) > self._cache_size:
+                self._rows.popitem(last=False)
+        return self._rows[i]
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+def _csr(size, pairs):
+    """
+    Compress an adjacency into sparse rows.
+
+    Parameters
+    ----------
+    size : int
+        The number of indices.
+    pairs : np.ndarray
+        An array of shape (k, 2) of pairs (source, target).
+
+    Returns
+    -------
+    indptr : np.ndarray
+        The offsets of each source's targets in `indices`.
+    indices : np.ndarray
+        The targets, grouped by source.
+    """
+    order = np.argsort(pairs[:, 0], kind='stable')
+    indices = pairs[order, 1]
+    indptr = np.zeros(size + 1, dtype=np.intp)
+    np.cumsum(np.bincount(pairs[:, 0], minlength=size), out=indptr[1:])
+    return indptr, indices
+
+
+class CSRBackend(Backend):
+    """
+    A backend storing the covers as compressed sparse rows in both directions,
+    and searching for each up-set or down-set when it is first needed.
+    """
+
+    name = 'csr'
+
+    streamed = True
+
+    def __init__(self, nodes, index, edges):
+        """
+        Parameters
+        ----------
+        nodes : list
+            The nodes, in topological order from the top.
+        index : dict
+            The position of each node in `nodes`.
+        edges : np.ndarray
+            An array of shape (k, 2) of the pairs (upper, lower) of indices of
+            the cover relation.
+        """
+        super().__init__(nodes, index)
+        self._set_rows(_csr(len(nodes), edges), _csr(len(nodes), edges[:, ::-1]))
+
+    def _set_rows(self, lower, upper, cache_size=None):
+        """
+        Install the compressed sparse rows.
+
+        Parameters
+        ----------
+        lower : (np.ndarray, np.ndarray)
+            The offsets and indices of the lower covers of each index.
+        upper : (np.ndarray, np.ndarray)
+            The offsets and indices of the upper covers of each index.
+        cache_size : int, None
+            The most up-sets and down-sets to keep at once. None for no limit.
+        """
+        self.lower_indptr, self.lower_indices = lower
+        self.upper_indptr, self.upper_indices = upper
+        self.up = _Reach(self.upper_indptr, self.upper_indices, cache_size)
+        self.down = _Reach(self.lower_indptr, self.lower_indices, cache_size)
+
+    @classmethod
+    def from_edges(cls, nodes, index, edges):
+        """
+        Construct the backend from the cover relation.
+
+        Parameters
+        ----------
+        nodes : list
+            The nodes, in topological order from the top.
+        index : dict
+            The position of each node in `nodes`.
+        edges : iterable
+            The pairs (upper, lower) of indices of the cover relation.
+
+        Returns
+        -------
+        backend : CSRBackend
+            The backend.
+        """
+        edges = np.array(list(edges), dtype=np.intp).reshape(-1, 2)
+        return cls(nodes, index, edges)
+
+    @classmethod
+    def from_rows(cls, nodes, index, lower, upper, cache_size=None):
+        """
+        Construct the backend from compressed sparse rows, which may be
+        memory-mapped.
+
+        Parameters
+        ----------
+        nodes : list
+            The nodes, in topological order from the top.
+        index : dict
+            The position of each node in `nodes`.
+        lower : (np.ndarray, np.ndarray)
+            The offsets and indices of the lower covers of each index.
+        upper : (np.ndarray, np.ndarray)
+            The offsets and indices of the upper covers of each index.
+        cache_size : int, None
+            The most up-sets and down-sets to keep at once. None for no limit.
+
+        Returns
+        -------
+        backend : CSRBackend
+            The backend.
+        """
+        backend = cls.__new__(cls)
+        Backend.__init__(backend, nodes, index)
+        backend._set_rows(lower, upper, cache_size)
+        return backend
+
+    def lowers(self, i):
+        """
+        Parameters
+        ----------
+        i : int
+            The index of a node.
+
+        Returns
+        -------
+        lowers : [int]
+            The indices of the nodes covered by node `i`.
+        """
+        return self.lower_indices[self.lower_indptr[i]:self.lower_indptr[i + 1]].tolist()
+
+    def uppers(self, i):
+        """
+        Parameters
+        ----------
+        i : int
+            The index of a node.
+
+        Returns
+        -------
+        uppers : [int]
+            The indices of the nodes covering node `i`.
+        """
+        return self.upper_indices[self.upper_indptr[i]:self.upper_indptr[i + 1]].tolist()
+
+
+BACKENDS = {backend.name: backend for backend in [NetworkXBackend, BitMatrixBackend, CSRBackend]}
+
+
+def select_backend(size):
+    """
+    Choose a backend for a lattice of `size` nodes.
+
+    Parameters
+    ----------
+    size : int
+        The number of nodes.
+
+    Returns
+    -------
+    name : str
+        'networkx' for small lattices, 'bitmatrix' for mid-size ones and 'csr'
+        for large ones.
+    """
+    if size <= NETWORKX_SIZE:
+        return 'networkx'
+    elif size <= BITMATRIX_SIZE:
+        return 'bitmatrix'
+    else:
+        return 'csr'
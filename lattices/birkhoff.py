@@ -0,0 +1,287 @@
+"""
+Distributive lattices represented by their join-irreducibles.
+
+By Birkhoff's representation theorem, a finite distributive lattice is
+isomorphic to the lattice of down-sets of its poset of join-irreducibles,
+ordered by inclusion. Storing only that poset, each element is a bitmask over
+the join-irreducibles, its join and meet are bitwise or and and, and a lattice
+with millions of elements needs only a few dozen join-irreducibles.
+"""
+
+from itertools import combinations
+
+import networkx as nx
+
+from .lattice import Lattice, _bits
+
+
+__all__ = [
+    'BirkhoffLattice',
+]
+
+
+class BirkhoffLattice(object):
+    """
+    The distributive lattice of down-sets of a poset.
+
+    Elements are int bitmasks over the poset, bit `i` standing for
+    `irreducibles[i]`.
+    """
+
+    def __init__(self, irreducibles, relationship):
+        """
+        Parameters
+        ----------
+        irreducibles : collection
+            The elements of the poset; the join-irreducibles of the lattice.
+        relationship : func
+            A function implementing the partial order among `irreducibles`.
+        """
+        irreducibles = list(dict.fromkeys(irreducibles))
+        belows = {j: {j} for j in irreducibles}
+        for a, b in combinations(irreducibles, 2):
+            if relationship(a, b):
+                belows[b].add(a)
+            elif relationship(b, a):
+                belows[a].add(b)
+
+        # Ordering by the number of elements below gives a linear extension, so
+        # every element is indexed after those below it.
+        self.irreducibles = sorted(irreducibles, key=lambda j: len(belows[j]))
+        self._relationship = relationship
+        self._index = {j: i for i, j in enumerate(self.irreducibles)}
+        self._below = [sum(1 << self._index[k] for k in belows[j]) for j in self.irreducibles]
+        self._above = [sum(1 << k for k, below in enumerate(self._below) if below >> i & 1)
+                       for i in range(len(self.irreducibles))]
+        self._lattice = None
+
+        self.top = (1 << len(self.irreducibles)) - 1
+        self.bottom = 0
+
+    @classmethod
+    def from_lattice(cls, lattice):
+        """
+        Represent a distributive lattice by its join-irreducibles.
+
+        Parameters
+        ----------
+        lattice : Lattice
+            A distributive lattice.
+
+        Returns
+        -------
+        birkhoff : BirkhoffLattice
+            The lattice of down-sets of the join-irreducibles of `lattice`,
+            which can `encode` and `decode` the nodes of `lattice`.
+
+        Raises
+        ------
+        ValueError
+            Raised if `lattice` is not distributive.
+        """
+        birkhoff = cls(lattice.join_irreducibles(), lattice._relationship)
+        birkhoff._lattice = lattice
+
+        # Every element is the join of the join-irreducibles below it, so the
+        # encoding is an isomorphism exactly when it preserves the joins of
+        # elements with join-irreducibles.
+        codes = {node: birkhoff.encode(node) for node in lattice}
+        for node in lattice:
+            for j, below in zip(birkhoff.irreducibles, birkhoff._below):
+                if codes[lattice.join(node, j)] != codes[node] | below:
+                    msg = "The lattice is not distributive."
+                    raise ValueError(msg)
+
+        return birkhoff
+
+    def encode(self, node):
+        """
+        Find the element representing a node of the original lattice.
+
+        Parameters
+        ----------
+        node : {elements}
+            A node of the lattice this was constructed `from_lattice`.
+
+        Returns
+        -------
+        element : int
+            The bitmask of the join-irreducibles below `node`.
+        """
+        down = self._lattice._down[self._lattice._index[node]]
+        return sum(1 << i for i, j in enumerate(self.irreducibles) if down >> self._lattice._index[j] & 1)
+
+    def decode(self, element):
+        """
+        Find the node of the original lattice represented by an element.
+
+        Parameters
+        ----------
+        element : int
+            A down-set bitmask.
+
+        Returns
+        -------
+        node : {elements}
+            The join of the join-irreducibles in `element`, in the lattice this
+            was constructed `from_lattice`.
+        """
+        if not element:
+            return self._lattice.bottom
+        return self._lattice.join(*(self.irreducibles[i] for i in _bits(element)))
+
+    def __contains__(self, element):
+        """
+        Parameters
+        ----------
+        element : int
+            A bitmask over the join-irreducibles.
+
+        Returns
+        -------
+        contains : bool
+            Whether `element` is a down-set.
+        """
+        return 0 <= element <= self.top and all(not self._below[i] & ~element for i in _bits(element))
+
+    def __iter__(self):
+        """
+        Iterate over the down-sets, deciding for each join-irreducible in turn
+        whether to include it. Since those below it have already been decided,
+        every choice leads to a down-set.
+
+        Yields
+        ------
+        element : int
+            Each down-set bitmask.
+        """
+        n = len(self.irreducibles)
+        stack = [(0, 0)]
+        while stack:
+            k, element = stack.pop()
+            if k == n:
+                yield element
+                continue
+            stack.append((k + 1, element))
+            if not self._below[k] & ~element & ~(1 << k):
+                stack.append((k + 1, element | 1 << k))
+
+    def le(self, a, b):
+        """
+        Parameters
+        ----------
+        a : int
+            A down-set bitmask.
+        b : int
+            A down-set bitmask.
+
+        Returns
+        -------
+        le : bool
+            Whether `a` is contained in `b`.
+        """
+        return not a & ~b
+
+    def join(self, *elements):
+        """
+        Parameters
+        ----------
+        elements : int
+            Down-set bitmasks.
+
+        Returns
+        -------
+        join : int
+            The union of `elements`.
+        """
+        join = self.bottom
+        for element in elements:
+            join |= element
+        return join
+
+    def meet(self, *elements):
+        """
+        Parameters
+        ----------
+        elements : int
+            Down-set bitmasks.
+
+        Returns
+        -------
+        meet : int
+            The intersection of `elements`.
+        """
+        meet = self.top
+        for element in elements:
+            meet &= element
+        return meet
+
+    def join_irreducibles(self):
+        """
+        The join-irreducible elements; the principal down-sets.
+
+        Returns
+        -------
+        jis : [int]
+            The down-set of each join-irreducible.
+        """
+        return list(self._below)
+
+    def covers(self, element):
+        """
+        The elements covered by `element`; those missing one of its maximal
+        join-irreducibles.
+
+        Parameters
+        ----------
+        element : int
+            A down-set bitmask.
+
+        Returns
+        -------
+        covers : [int]
+            The lower covers of `element`.
+        """
+        return [element ^ 1 << i for i in _bits(element) if self._above[i] & element == 1 << i]
+
+    def upper_covers(self, element):
+        """
+        The elements covering `element`; those adding one minimal
+        join-irreducible outside it.
+
+        Parameters
+        ----------
+        element : int
+            A down-set bitmask.
+
+        Returns
+        -------
+        covers : [int]
+            The upper covers of `element`.
+        """
+        return [element | 1 << i for i in _bits(self.top & ~element) if self._below[i] & ~element == 1 << i]
+
+    def to_lattice(self):
+        """
+        Construct the lattice explicitly, with each element labeled by the
+        frozenset of its join-irreducibles.
+
+        Returns
+        -------
+        lattice : Lattice
+            The lattice of down-sets ordered by inclusion.
+        """
+        elements = sorted(self, key=lambda element: bin(element).count('1'), reverse=True)
+        labels = {element: frozenset(self.irreducibles[i] for i in _bits(element)) for element in elements}
+
+        hasse = nx.DiGraph()
+        hasse.add_nodes_from(labels[element] for element in elements)
+        hasse.add_edges_from((labels[element], labels[cover]) for element in elements for cover in self.covers(element))
+
+        def downset_le(a, b):
+            """
+            a <= b --> a is contained in b.
+            """
+            return a <= b
+
+        return Lattice._from_hasse(hasse, downset_le, ts=[labels[element] for element in elements])
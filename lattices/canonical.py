@@ -0,0 +1,176 @@
+"""
+Canonical labeling of lattices by color refinement and backtracking.
+
+Nodes are colored by their height, and the coloring is refined by the colors of
+each node's covers until it is stable. Remaining ties are broken by trying each
+node of the first tied cell in turn, and the smallest resulting relabeling of
+the cover relation is canonical. Relabelings which give the same cover relation
+reveal automorphisms, which are used to skip equivalent branches.
+"""
+
+__all__ = [
+    'canonical_form',
+]
+
+
+def _refine(colors, lowers, uppers):
+    """
+    Refine `colors` until the colors of each node's covers are determined by
+    its own color.
+
+    Parameters
+    ----------
+    colors : [int]
+        The color of each node.
+    lowers : [[int]]
+        The lower covers of each node.
+    uppers : [[int]]
+        The upper covers of each node.
+
+    Returns
+    -------
+    colors : [int]
+        The stable coloring, with colors 0, 1, ... ordered consistently with
+        the given ones.
+    """
+    n_colors = len(set(colors))
+    while True:
+        signatures = [(colors[v],
+                       tuple(sorted(colors[c] for c in lowers[v])),
+                       tuple(sorted(colors[p] for p in uppers[v])))
+                      for v in range(len(colors))]
+        ranks = {signature: i for i, signature in enumerate(sorted(set(signatures)))}
+        colors = [ranks[signature] for signature in signatures]
+        if len(ranks) == n_colors:
+            return colors
+        n_colors = len(ranks)
+
+
+def _individualize(colors, v):
+    """
+    Give `v` a color of its own, just after the rest of its cell.
+
+    Parameters
+    ----------
+    colors : [int]
+        The color of each node.
+    v : int
+        The node to individualize.
+
+    Returns
+    -------
+    colors : [int]
+        The new coloring.
+    """
+    colors = [2 * color for color in colors]
+    colors[v] += 1
+    return colors
+
+
+def canonical_form(lattice):
+    """
+    Compute a canonical form of the cover relation of `lattice`.
+
+    Parameters
+    ----------
+    lattice : Lattice
+        The lattice to label.
+
+    Returns
+    -------
+    edges : tuple
+        The sorted cover pairs (upper, lower) under the canonical numbering of
+        the nodes; two lattices are isomorphic exactly when these are equal.
+    automorphisms : [[int]]
+        Automorphisms found during the search, each as a permutation of the
+        positions of the nodes in `lattice`'s topological order.
+    """
+    nodes = list(lattice)
+    index = {node: i for i, node in enumerate(nodes)}
+    lowers = [[index[lattice._nodes[c]] for c in lattice._lowers(lattice._index[node])] for node in nodes]
+    uppers = [[index[lattice._nodes[p]] for p in lattice._uppers(lattice._index[node])] for node in nodes]
+
+    heights = [0] * len(nodes)
+    for v in reversed(range(len(nodes))):
+        heights[v] = max((heights[c] + 1 for c in lowers[v]), default=0)
+
+    best = {'edges': None, 'inverse': None}
+    automorphisms = []
+
+    def leaf(colors):
+        """
+        Compare the discrete coloring `colors` against the best found so far.
+        """
+        edges = tuple(sorted((colors[u], colors[c]) for u in range(len(nodes)) for c in lowers[u]))
+        if best['edges'] is None or edges < best['edges']:
+            best['edges'] = edges
+            best['inverse'] = sorted(range(len(nodes)), key=colors.__getitem__)
+        elif edges == best['edges']:
+            automorphism = [best['inverse'][colors[v]] for v in range(len(nodes))]
+            if automorphism != list(range(len(nodes))):
+                automorphisms.append(automorphism)
+
+    def search(colors, prefix):
+        """
+        Explore the individualizations of the first non-singleton cell.
+        """
+        cells = {}
+        for v, color in enumerate(colors):
+            cells.setdefault(color, []).append(v)
+        targets = [cell for _, cell in sorted(cells.items()) if len(cell) > 1]
+        if not targets:
+            leaf(colors)
+            return
+
+        explored = []
+        for v in targets[0]:
+            if explored and _in_orbit(v, explored, prefix, automorphisms, len(nodes)):
+                continue
+            explored.append(v)
+            search(_refine(_individualize(colors, v), lowers, uppers), prefix + [v])
+
+    search(_refine(heights, lowers, uppers), [])
+
+    return best['edges'], automorphisms
+
+
+def _in_orbit(v, explored, prefix, automorphisms, size):
+    """
+    Determine whether `v` is equivalent to an explored node under the found
+    automorphisms which fix every node of `prefix`.
+
+    Parameters
+    ----------
+    v : int
+        The candidate node.
+    explored : [int]
+        The nodes already explored at this level.
+    prefix : [int]
+        The nodes individualized above this level.
+    automorphisms : [[int]]
+        The automorphisms found so far.
+    size : int
+        The number of nodes.
+
+    Returns
+    -------
+    in_orbit : bool
+        Whether exploring `v` would repeat an explored branch.
+    """
+    parent = list(range(size))
+
+    def find(i):
+        """
+        Find the representative of the orbit of `i`.
+        """
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for automorphism in automorphisms:
+        if all(automorphism[p] == p for p in prefix):
+            for i, j in enumerate(automorphism):
+                parent[find(i)] = find(j)
+
+    return any(find(v) == find(w) for w in explored)
@@ -0,0 +1,87 @@
+"""
+Closure of a set of elements under a join and a meet.
+"""
+
+from functools import partial
+
+
+__all__ = [
+    'closure',
+]
+
+
+def _combine(join, meet, pairs):
+    """
+    Compute the join and meet of each pair.
+
+    Parameters
+    ----------
+    join : func
+        The binary join.
+    meet : func
+        The binary meet.
+    pairs : [(element, element)]
+        The pairs to combine.
+
+    Returns
+    -------
+    results : [element]
+        The join and the meet of each pair, in turn.
+    """
+    results = []
+    for a, b in pairs:
+        results.append(join(a, b))
+        results.append(meet(a, b))
+    return results
+
+
+def closure(generators, join, meet, executor=None, chunksize=1024):
+    """
+    Generate the closure of `generators` under `join` and `meet`.
+
+    Elements are processed in rounds: each round combines the elements found in
+    the previous round with every element known so far, so each pair is
+    combined exactly once. Elements are deduplicated by hashing, and yielded as
+    soon as they are discovered.
+
+    Parameters
+    ----------
+    generators : collection
+        The hashable elements to close.
+    join : func
+        A function computing the join of two elements.
+    meet : func
+        A function computing the meet of two elements.
+    executor : concurrent.futures.Executor, None
+        If given, each round is split into chunks which are combined by the
+        executor. For a process pool, `join` and `meet` must be picklable.
+    chunksize : int
+        The number of pairs to combine in each task submitted to `executor`.
+
+    Yields
+    ------
+    element : object
+        Each element of the closure, generators first.
+    """
+    known = list(dict.fromkeys(generators))
+    seen = set(known)
+    yield from known
+
+    combine = partial(_combine, join, meet)
+    start = 0
+    while start < len(known):
+        end = len(known)
+        pairs = ((known[i], known[j]) for i in range(start, end) for j in range(i + 1))
+        if executor is None:
+            batches = [(c for a, b in pairs for c in (join(a, b), meet(a, b)))]
+        else:
+            pairs = list(pairs)
+            chunks = [pairs[k:k + chunksize] for k in range(0, len(pairs), chunksize)]
+            batches = executor.map(combine, chunks)
+        for batch in batches:
+            for element in batch:
+                if element not in seen:
+                    seen.add(element)
+                    known.append(element)
+                    yield element
+        start = end
@@ -0,0 +1,128 @@
+"""
+Concept lattices of formal contexts.
+
+A formal context is a binary relation between objects and attributes, given as
+a boolean matrix whose rows are objects and whose columns are attributes. Its
+concepts are the pairs (extent, intent) which determine one another, and they
+form a lattice when ordered by inclusion of extents.
+"""
+
+from collections import Counter, namedtuple
+
+import networkx as nx
+import numpy as np
+
+from .lattice import Lattice, _bits
+
+
+__all__ = [
+    'Concept',
+    'concept_lattice',
+]
+
+
+Concept = namedtuple('Concept', ['extent', 'intent'])
+
+
+def _pack(matrix):
+    """
+    Pack the rows of a boolean matrix into integer bitsets.
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        A two dimensional boolean array.
+
+    Returns
+    -------
+    bitsets : [int]
+        For each row, an int whose bit `j` is set when column `j` is True.
+    """
+    packed = np.packbits(matrix, axis=1, bitorder='little')
+    return [int.from_bytes(row.tobytes(), 'little') for row in packed]
+
+
+def concept_lattice(context, objects=None, attributes=None):
+    """
+    Construct the concept lattice of a formal context.
+
+    Intents are enumerated with NextClosure over the bit-packed columns of
+    `context`, and the cover relation is found by Lindig's neighbor test, so the
+    concepts never need to be compared pairwise.
+
+    Parameters
+    ----------
+    context : array_like
+        A two dimensional boolean array; `context[g, m]` is True when object
+        `g` has attribute `m`.
+    objects : collection, None
+        Labels for the rows of `context`. Defaults to their indices.
+    attributes : collection, None
+        Labels for the columns of `context`. Defaults to their indices.
+
+    Returns
+    -------
+    lattice : Lattice
+        The concept lattice, whose nodes are `Concept`s ordered by extent.
+    """
+    context = np.asarray(context, dtype=bool)
+    n_objects, n_attributes = context.shape
+    objects = list(range(n_objects)) if objects is None else list(objects)
+    attributes = list(range(n_attributes)) if attributes is None else list(attributes)
+
+    extents = _pack(context.T)
+    intents = _pack(context)
+    all_objects = (1 << n_objects) - 1
+    all_attributes = (1 << n_attributes) - 1
+
+    def closure(intent):
+        """
+        Compute the extent of `intent`, and the intent of that extent.
+        """
+        extent = all_objects
+        for m in _bits(intent):
+            extent &= extents[m]
+        intent = all_attributes
+        for g in _bits(extent):
+            intent &= intents[g]
+        return extent, intent
+
+    # NextClosure: visit the closed intents in lectic order.
+    concepts = {}
+    extent, intent = closure(0)
+    while True:
+        concepts[intent] = extent
+        for m in reversed(range(n_attributes)):
+            bit = 1 << m
+            if intent & bit:
+                continue
+            prefix = intent & (bit - 1)
+            next_extent, next_intent = closure(prefix | bit)
+            if next_intent & (bit - 1) == prefix:
+                extent, intent = next_extent, next_intent
+                break
+        else:
+            break
+
+    nodes = {intent: Concept(frozenset(objects[g] for g in _bits(extent)),
+                             frozenset(attributes[m] for m in _bits(intent)))
+             for intent, extent in concepts.items()}
+
+    hasse = nx.DiGraph()
+    hasse.add_nodes_from(nodes.values())
+
+    # Lindig: a candidate intent generated by adding an attribute is a lower
+    # neighbor exactly when every one of its new attributes generates it.
+    for intent in concepts:
+        candidates = Counter(closure(intent | 1 << m)[1] for m in range(n_attributes) if not intent & 1 << m)
+        for lower, count in candidates.items():
+            if count == bin(lower & ~intent).count('1'):
+                hasse.add_edge(nodes[intent], nodes[lower])
+
+    def concept_le(a, b):
+        """
+        a <= b --> the extent of a is contained in the extent of b.
+        """
+        return a.extent <= b.extent
+
+    return Lattice._from_hasse(hasse, concept_le)
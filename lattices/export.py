@@ -0,0 +1,239 @@
+"""
+Streaming export of the cover relation of lattices, and a layered layout of
+their Hasse diagrams.
+
+The exporters write each node and each cover edge to a file handle as it is
+visited, through the backend's index-based covers, so no graph of the lattice
+is built and nothing but the labels is held in memory. Nodes are identified by
+their position in the topological order of the lattice, from the top.
+"""
+
+import json
+from xml.sax.saxutils import escape
+
+
+__all__ = [
+    'to_dot',
+    'to_graphml',
+    'to_json_lines',
+    'to_edgelist',
+    'hasse_layout',
+]
+
+
+def _ids(lattice):
+    """
+    Number the nodes of `lattice`.
+
+    Parameters
+    ----------
+    lattice : Lattice
+        The lattice.
+
+    Returns
+    -------
+    ids : dict
+        The number of each node index, in topological order from the top.
+    """
+    return {lattice._index[node]: k for k, node in enumerate(lattice)}
+
+
+def _edges(lattice, ids):
+    """
+    Iterate over the cover relation of `lattice`.
+
+    Parameters
+    ----------
+    lattice : Lattice
+        The lattice.
+    ids : dict
+        The number of each node index.
+
+    Yields
+    ------
+    edge : (int, int)
+        The numbers of each node and of a node it covers.
+    """
+    for i, k in ids.items():
+        for j in lattice._lowers(i):
+            yield k, ids[j]
+
+
+def _escape(label):
+    """
+    Quote a label for DOT.
+
+    Parameters
+    ----------
+    label : str
+        The label.
+
+    Returns
+    -------
+    quoted : str
+        The label in double quotes, with quotes and backslashes escaped.
+    """
+    return '"{}"'.format(label.replace('\\', '\\\\').replace('"', '\\"'))
+
+
+def to_dot(lattice, f, layout=None):
+    """
+    Write the Hasse diagram of `lattice` in the DOT language, with edges
+    pointing from each node to the nodes it covers.
+
+    Parameters
+    ----------
+    lattice : Lattice
+        The lattice to export.
+    f : file
+        A text file handle to write to.
+    layout : dict, None
+        The position of each node, as from `hasse_layout`, written as pinned
+        `pos` attributes. If None, positions are left to the renderer.
+    """
+    ids = _ids(lattice)
+    labels = lattice.labels
+    f.write('digraph lattice {\n')
+    for node, k in zip(lattice, ids.values()):
+        attributes = 'label={}'.format(_escape(labels[node]))
+        if layout is not None:
+            attributes += ', pos="{:g},{:g}!"'.format(*layout[node])
+        f.write('  {} [{}];\n'.format(k, attributes))
+    for k, m in _edges(lattice, ids):
+        f.write('  {} -> {};\n'.format(k, m))
+    f.write('}\n')
+
+
+def to_graphml(lattice, f):
+    """
+    Write the Hasse diagram of `lattice` as GraphML, with edges pointing from
+    each node to the nodes it covers.
+
+    Parameters
+    ----------
+    lattice : Lattice
+        The lattice to export.
+    f : file
+        A text file handle to write to.
+    """
+    ids = _ids(lattice)
+    labels = lattice.labels
+    f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+    f.write('  <key id="label" for="node" attr.name="label" attr.type="string"/>\n')
+    f.write('  <graph id="lattice" edgedefault="directed">\n')
+    for node, k in zip(lattice, ids.values()):
+        f.write('    <node id="n{}"><data key="label">{}</data></node>\n'.format(k, escape(labels[node])))
+    for k, m in _edges(lattice, ids):
+        f.write('    <edge source="n{}" target="n{}"/>\n'.format(k, m))
+    f.write('  </graph>\n')
+    f.write('</graphml>\n')
+
+
+def to_json_lines(lattice, f):
+    """
+    Write the Hasse diagram of `lattice` as JSON lines: an object
+    `{"node": id, "label": label}` for each node, then an object
+    `{"source": id, "target": id}` for each node and a node it covers.
+
+    Parameters
+    ----------
+    lattice : Lattice
+        The lattice to export.
+    f : file
+        A text file handle to write to.
+    """
+    ids = _ids(lattice)
+    labels = lattice.labels
+    for node, k in zip(lattice, ids.values()):
+        f.write(json.dumps({'node': k, 'label': labels[node]}, ensure_ascii=False) + '\n')
+    for k, m in _edges(lattice, ids):
+        f.write('{{"source": {}, "target": {}}}\n'.format(k, m))
+
+
+def to_edgelist(lattice, f, delimiter='\t', labels=True):
+    """
+    Write the cover relation of `lattice` as an edge list, one line per node
+    and a node it covers.
+
+    Parameters
+    ----------
+    lattice : Lattice
+        The lattice to export.
+    f : file
+        A text file handle to write to.
+    delimiter : str
+        The separator of the two nodes on each line.
+    labels : bool
+        Whether to write the labels of the nodes, or their numbers in
+        topological order from the top.
+    """
+    ids = _ids(lattice)
+    names = [lattice.labels[node] for node in lattice] if labels else list(range(len(ids)))
+    for k, m in _edges(lattice, ids):
+        f.write('{}{}{}\n'.format(names[k], delimiter, names[m]))
+
+
+def hasse_layout(lattice, sweeps=4):
+    """
+    Lay out the Hasse diagram of `lattice` in layers.
+
+    Each node is placed on the layer of its height; the length of the longest
+    chain down to the bottom. Within each layer, nodes are ordered to reduce
+    crossings by the barycenter heuristic: alternately downward and upward,
+    each layer is sorted by the mean position of its covers in the layer just
+    visited. Each sweep takes time linear in the number of covers, up to the
+    sorting of each layer.
+
+    Parameters
+    ----------
+    lattice : Lattice
+        The lattice to lay out.
+    sweeps : int
+        The number of downward and upward sweeps of crossing reduction.
+
+    Returns
+    -------
+    layout : dict
+        The position (x, y) of each node, where y is its height and x is
+        centered on zero within each layer.
+    """
+    indices = [lattice._index[node] for node in lattice]
+    lowers = {i: list(lattice._lowers(i)) for i in indices}
+    uppers = {i: list(lattice._uppers(i)) for i in indices}
+
+    # The nodes are in topological order from the top, so visiting them in
+    # reverse finds the height of each node's covers before its own.
+    height = {}
+    for i in reversed(indices):
+        height[i] = 1 + max((height[j] for j in lowers[i]), default=-1)
+
+    layers = [[] for _ in range(max(height.values()) + 1)]
+    for i in indices:
+        layers[height[i]].append(i)
+    position = {i: x for layer in layers for x, i in enumerate(layer)}
+
+    def reorder(layer, neighbors):
+        """
+        Sort `layer` by the mean position of each node's neighbors, keeping the
+        position of nodes without any.
+        """
+        def barycenter(i):
+            """
+            The mean position of the neighbors of `i`.
+            """
+            if not neighbors[i]:
+                return position[i]
+            return sum(position[j] for j in neighbors[i]) / len(neighbors[i])
+
+        layer.sort(key=barycenter)
+        for x, i in enumerate(layer):
+            position[i] = x
+
+    for _ in range(sweeps):
+        for layer in reversed(layers[:-1]):
+            reorder(layer, uppers)
+        for layer in layers[1:]:
+            reorder(layer, lowers)
+
+    return {lattice._nodes[i]: (position[i] - (len(layers[height[i]]) - 1) / 2, height[i]) for i in indices}
@@ -0,0 +1,258 @@
+"""
+Opt-in instrumentation of the hot paths of lattices.
+
+While an `instrument` block is active, lattices count their relationship
+evaluations, joins and meets, traversals and cache hits and misses, and time the
+phases of their construction. Each event is recorded in the `Stats` of every
+active block, and in those of the lattice it concerns, which `Lattice.stats`
+returns. Blocks are local to the thread which opens them, so events in other
+threads are not recorded in them. When no block is active, each instrumented
+site costs a single check of an empty tuple.
+"""
+
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from threading import local
+from time import perf_counter
+
+
+__all__ = [
+    'Stats',
+    'instrument',
+]
+
+
+class _Recorders(local):
+    """
+    The `Stats` of the active `instrument` blocks of each thread.
+
+    Attributes
+    ----------
+    stack : (Stats)
+        The recorders of the current thread, innermost last.
+    """
+
+    stack = ()
+
+
+_recorders = _Recorders()
+
+
+class Stats(object):
+    """
+    Counters and accumulated timings of instrumented events.
+    """
+
+    def __init__(self, callback=None):
+        """
+        Parameters
+        ----------
+        callback : func, None
+            If given, called as `callback(kind, name, value)` for each event,
+            where `kind` is 'count' or 'span'.
+        """
+        self.counters = Counter()
+        self.spans = defaultdict(float)
+        self.callback = callback
+
+    def count(self, name, n=1):
+        """
+        Increment a counter.
+
+        Parameters
+        ----------
+        name : str
+            The counter.
+        n : int
+            The amount to add.
+        """
+        self.counters[name] += n
+        if self.callback is not None:
+            self.callback('count', name, n)
+
+    def add_span(self, name, seconds):
+        """
+        Accumulate the duration of a span.
+
+        Parameters
+        ----------
+        name : str
+            The span.
+        seconds : float
+            Its duration.
+        """
+        self.spans[name] += seconds
+        if self.callback is not None:
+            self.callback('span', name, seconds)
+
+    def as_dict(self):
+        """
+        Returns
+        -------
+        stats : dict
+            The counters and the total seconds spent in each span.
+        """
+        return {'counters': dict(self.counters), 'spans': dict(self.spans)}
+
+    def __repr__(self):
+        """
+        Show the counters and spans.
+        """
+        return 'Stats({!r})'.format(self.as_dict())
+
+
+@contextmanager
+def instrument(callback=None):
+    """
+    Record the events within the block.
+
+    Parameters
+    ----------
+    callback : func, None
+        If given, called as `callback(kind, name, value)` for each event.
+
+    Yields
+    ------
+    stats : Stats
+        The events recorded within the block.
+    """
+    stats = Stats(callback)
+    outer = _recorders.stack
+    _recorders.stack = outer + (stats,)
+    try:
+        yield stats
+    finally:
+        _recorders.stack = outer
+
+
+def _targets(lattice):
+    """
+    Find the `Stats` in which to record an event concerning `lattice`.
+
+    Parameters
+    ----------
+    lattice : Lattice, None
+        The lattice concerned, whose own `Stats` are created if need be.
+
+    Returns
+    -------
+    targets : [Stats]
+        The active recorders, and those of `lattice`.
+    """
+    targets = list(_recorders.stack)
+    if lattice is not None:
+        if getattr(lattice, '_stats', None) is None:
+            lattice._stats = Stats()
+        targets.append(lattice._stats)
+    return targets
+
+
+def count(lattice, name, n=1):
+    """
+    Record `n` occurrences of an event, if instrumentation is active.
+
+    Parameters
+    ----------
+    lattice : Lattice, None
+        The lattice concerned.
+    name : str
+        The event.
+    n : int
+        The number of occurrences.
+    """
+    if _recorders.stack:
+        for stats in _targets(lattice):
+            stats.count(name, n)
+
+
+@contextmanager
+def _timed(lattice, name):
+    """
+    Time the block as a span.
+    """
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        seconds = perf_counter() - start
+        for stats in _targets(lattice):
+            stats.add_span(name, seconds)
+
+
+class _Untimed(object):
+    """
+    A context manager which does nothing.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+_UNTIMED = _Untimed()
+
+
+def span(lattice, name):
+    """
+    Time a block as a span, if instrumentation is active.
+
+    Parameters
+    ----------
+    lattice : Lattice, None
+        The lattice concerned.
+    name : str
+        The span.
+
+    Returns
+    -------
+    context : context manager
+        A context manager timing its block.
+    """
+    return _timed(lattice, name) if _recorders.stack else _UNTIMED
+
+
+def counted(lattice, name, func):
+    """
+    Wrap `func` to count its calls, if instrumentation is active.
+
+    The calls are counted locally, and recorded by calling `flush` on the
+    wrapper.
+
+    Parameters
+    ----------
+    lattice : Lattice, None
+        The lattice concerned.
+    name : str
+        The event.
+    func : func
+        The function to count calls of.
+
+    Returns
+    -------
+    wrapper : func
+        `func` itself if instrumentation is inactive, otherwise a counting
+        wrapper.
+    """
+    if not _recorders.stack:
+        return func
+
+    calls = [0]
+
+    def wrapper(*args):
+        """
+        Count the call.
+        """
+        calls[0] += 1
+        return func(*args)
+
+    def flush():
+        """
+        Record the calls made since the last flush.
+        """
+        count(lattice, name, calls[0])
+        calls[0] = 0
+
+    wrapper.flush = flush
+    return wrapper
@@ -0,0 +1,205 @@
+"""
+Interning of the members of set-valued nodes.
+
+Nodes such as partitions, dependencies and antichains of them are sets of
+inner sets, and the same inner sets recur across many nodes. An `InternTable`
+keeps one canonical object for each distinct inner item, and the constructors
+build their nodes from those objects, so that each inner set is held once
+however many nodes contain it, and comparing or hashing members of nodes finds
+the very same objects. The table numbers its items, and records as bitsets
+over those numbers which items lie below and above each other; it looks the
+members of nodes up by identity, so orders defined member-wise, like
+refinement and antichain containment, reduce to a few integer operations.
+"""
+
+from operator import le
+
+
+__all__ = [
+    'InternTable',
+]
+
+
+class InternTable(object):
+    """
+    The canonical members of nodes, numbered and ordered by `le`.
+
+    Attributes
+    ----------
+    items : list
+        The canonical items, by number.
+    canonical : dict
+        The canonical item equal to each item seen.
+    ids : dict
+        The number of each canonical item, keyed by its `id`.
+    below : [int]
+        For each item, the bitset of the items less than or equal to it.
+    above : [int]
+        For each item, the bitset of the items greater than or equal to it.
+    """
+
+    def __init__(self, le=le):
+        """
+        Parameters
+        ----------
+        le : func
+            The order among the members of nodes. Defaults to <=.
+        """
+        self.le = le
+        self.items = []
+        self.canonical = {}
+        self.ids = {}
+        self.below = []
+        self.above = []
+
+    def __len__(self):
+        """
+        The number of distinct items interned.
+        """
+        return len(self.items)
+
+    def intern(self, item):
+        """
+        Find the canonical item equal to `item`, making `item` itself canonical
+        and comparing it with every other canonical item the first time such an
+        item is seen.
+
+        Parameters
+        ----------
+        item : object
+            A hashable member of a node.
+
+        Returns
+        -------
+        canonical : object
+            The canonical item equal to `item`.
+        """
+        canonical = self.canonical.get(item)
+        if canonical is None:
+            canonical = self.canonical[item] = item
+            i = self.ids[id(item)] = len(self.items)
+            below = above = 1 << i
+            for j, other in enumerate(self.items):
+                if self.le(other, item):
+                    below |= 1 << j
+                    self.above[j] |= 1 << i
+                if self.le(item, other):
+                    above |= 1 << j
+                    self.below[j] |= 1 << i
+            self.items.append(item)
+            self.below.append(below)
+            self.above.append(above)
+        return canonical
+
+    def node(self, members):
+        """
+        Build a node from the canonical items equal to `members`.
+
+        Parameters
+        ----------
+        members : collection
+            The hashable members of a node.
+
+        Returns
+        -------
+        node : frozenset
+            A node equal to `members`, whose members are canonical.
+        """
+        return frozenset(self.intern(member) for member in members)
+
+    def number(self, item):
+        """
+        Parameters
+        ----------
+        item : object
+            A member of a node, looked up by identity if it is canonical.
+
+        Returns
+        -------
+        id : int
+            The number of the canonical item equal to `item`.
+        """
+        i = self.ids.get(id(item))
+        if i is None:
+            i = self.ids[id(self.intern(item))]
+        return i
+
+    def encode(self, node):
+        """
+        Encode a node as the bitset of its members.
+
+        Parameters
+        ----------
+        node : collection
+            A collection of hashable items.
+
+        Returns
+        -------
+        code : int
+            The bitset of the numbers of the members of `node`.
+        """
+        ids = self.ids
+        code = 0
+        for item in node:
+            i = ids.get(id(item))
+            code |= 1 << (self.number(item) if i is None else i)
+        return code
+
+    def decode(self, code):
+        """
+        Recover a node from its code.
+
+        Parameters
+        ----------
+        code : int
+            A bitset of item numbers.
+
+        Returns
+        -------
+        node : frozenset
+            The canonical items numbered in `code`.
+        """
+        members = []
+        while code:
+            low = code & -code
+            members.append(self.items[low.bit_length() - 1])
+            code ^= low
+        return frozenset(members)
+
+    def downset(self, node):
+        """
+        Parameters
+        ----------
+        node : collection
+            The node.
+
+        Returns
+        -------
+        down : int
+            The bitset of the items below some member of `node`.
+        """
+        ids, bitsets = self.ids, self.below
+        down = 0
+        for item in node:
+            i = ids.get(id(item))
+            down |= bitsets[self.number(item) if i is None else i]
+        return down
+
+    def upset(self, node):
+        """
+        Parameters
+        ----------
+        node : collection
+            The node.
+
+        Returns
+        -------
+        up : int
+            The bitset of the items above some member of `node`.
+        """
+        ids, bitsets = self.ids, self.above
+        up = 0
+        for item in node:
+            i = ids.get(id(item))
+            up |= bitsets[self.number(item) if i is None else i]
+        return up
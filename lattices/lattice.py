@@ -2,14 +2,26 @@
 The fundimental Lattice class.
 """
 
+import asyncio
 from collections.abc import Iterable
-from copy import deepcopy
-from itertools import combinations, permutations
+from functools import partial
+from itertools import combinations, islice, permutations, product
 
 import networkx as nx
+import numpy as np
+
+from .backends import BACKENDS, Backend, NetworkXBackend, select_backend
+from .canonical import canonical_form
+from .closure import closure
+from .export import hasse_layout, to_dot, to_edgelist, to_graphml, to_json_lines
+from .instrumentation import _recorders, count, counted, span
+from .orderings import refinement_le
+from .progress import _Monitor
 
 __all__ = [
+    'Cut',
     'Lattice',
+    'LatticeView',
 ]
 
 
@@ -31,6 +43,9 @@ def stringify(symbols='•꞉⋮'):
         """
         Convert a set (of sets [of sets {...}]) into a string.
 
+        The nesting is walked with an explicit stack rather than by recursion,
+        so arbitrarily deep sets can be stringified.
+
         Parameters
         ----------
         things : (frozen)set
@@ -41,31 +56,143 @@ def stringify(symbols='•꞉⋮'):
         string : str
             The string representation of `things`.
         """
-        try:
-            things = list(things)
-        except TypeError:  # pragma: no cover
-            return str(things)
-
-        try:
-            if isinstance(things[0], Iterable) and not isinstance(things[0], str):
-                stringer = stringify(symbols[1:])
-                string = symbols[0].join(sorted((stringer(thing) for thing in things), key=lambda t: (-len(t), t)))
+        result = []
+        # Each frame holds the remaining members of a set at some depth, the
+        # strings of those already visited, and where to put its own string.
+        stack = []
+
+        def visit(thing, depth, out):
+            """
+            Stringify `thing` into `out` if it is flat, and otherwise push a
+            frame for its members.
+            """
+            try:
+                members = list(thing)
+            except TypeError:  # pragma: no cover
+                out.append(str(thing))
+                return
+            nested = members and depth < len(symbols) and isinstance(members[0], Iterable)
+            if nested and not isinstance(members[0], str):
+                stack.append((iter(members), depth, [], out))
+            else:
+                out.append(''.join(map(str, sorted(members))) or '∅')
+
+        visit(things, 0, result)
+        while stack:
+            members, depth, strings, out = stack[-1]
+            for member in members:
+                height = len(stack)
+                visit(member, depth + 1, strings)
+                if len(stack) > height:
+                    break
             else:
-                raise IndexError
-        except IndexError:
-            string = ''.join(map(str, sorted(things)))
+                stack.pop()
+                out.append(symbols[depth].join(sorted(strings, key=lambda t: (-len(t), t))) or '∅')
 
-        return string if string else '∅'
+        return result[0]
 
     return stringifier
 
 
+def _bits(bitset):
+    """
+    Iterate over the indices of the set bits of `bitset`.
+
+    Parameters
+    ----------
+    bitset : int
+        The bitset.
+
+    Yields
+    ------
+    index : int
+        The position of each set bit, from least to most significant.
+    """
+    while bitset:
+        low = bitset & -bitset
+        yield low.bit_length() - 1
+        bitset ^= low
+
+
+# Lattices with at most this many nodes tabulate their join and meet for
+# `join_many` and `meet_many`; larger ones use the bitset kernel.
+_TABLE_SIZE = 2048
+
+# The words of indices and results, and the rows of packed bitsets, held for
+# each pair of a chunk by `join_many` and `meet_many`.
+_PAIR_WORDS = 6
+_PAIR_ROWS = 4
+
+# The further rows held for each pair when the bitsets of a chunk are packed
+# from a streamed backend rather than gathered from a whole packed matrix.
+_STREAM_ROWS = 2
+
+# The number of nodes between successive progress reports during construction.
+_ROW_REPORT_EVERY = 16
+
+# The highest and lowest set bit of each byte, or -1 for zero.
+_HIGH_BITS = np.array([b.bit_length() - 1 for b in range(256)], dtype=np.intp)
+_LOW_BITS = np.array([(b & -b).bit_length() - 1 for b in range(256)], dtype=np.intp)
+
+
+class Cut(object):
+    """
+    A node added by the Dedekind-MacNeille completion, labeled by the original
+    nodes in its cut.
+
+    Cuts only compare equal to other cuts, so they can never be confused with an
+    original node, even when those nodes are themselves sets.
+    """
+
+    __slots__ = ('members',)
+
+    def __init__(self, members):
+        """
+        Parameters
+        ----------
+        members : collection
+            The original nodes lying below the cut.
+        """
+        self.members = frozenset(members)
+
+    def __eq__(self, other):
+        """
+        Cuts are equal when they have the same members.
+        """
+        return isinstance(other, Cut) and self.members == other.members
+
+    def __hash__(self):
+        """
+        Hash the cut by its members, distinctly from a frozenset of them.
+        """
+        return hash((Cut, self.members))
+
+    def __iter__(self):
+        """
+        Return an iterator over the members of the cut.
+        """
+        return iter(self.members)
+
+    def __len__(self):
+        """
+        Return the number of members of the cut.
+        """
+        return len(self.members)
+
+    def __repr__(self):
+        """
+        Represent the cut by its members.
+        """
+        return 'Cut({!r})'.format(set(self.members) if self.members else set())
+
+
 class Lattice(object):
     """
     A lattice.
     """
 
-    def __init__(self, nodes, relationship, symbols='•꞉⋮'):
+    def __init__(self, nodes, relationship, symbols='•꞉⋮', symmetries=None, backend=None, progress=None,
+                 token=None):
         """
         Given a set of nodes and an ordering, construct a lattice.
 
@@ -77,342 +204,1859 @@ class Lattice(object):
             A function implementing the ordering among `nodes`.
         symbols : str
             The symbols to use to separate elements of each node.
+        symmetries : [func], None
+            Functions mapping each node to its image under an automorphism of
+            the lattice, typically generators of the group of automorphisms.
+            Property checks evaluate only one pair of nodes per orbit under
+            these. Defaults to none.
+        backend : str, None
+            How to store the cover relation: 'networkx', 'bitmatrix' or 'csr';
+            see `lattices.backends`. If None, one is chosen by size.
+        progress : func, None
+            Called as `progress(phase, done, total)` as the 'comparison',
+            'sort' and 'reduction' phases proceed; see `lattices.progress`.
+        token : CancellationToken, None
+            A token through which to cancel the construction.
 
         Returns
         -------
         lattice : nx.DiGraph
             The lattice representing `relationship` over `nodes`.
+
+        Raises
+        ------
+        Cancelled
+            Raised if `token` cancels the construction.
         """
-        nodes = list(nodes)
-        lattice = nx.DiGraph()
-        lattice.add_nodes_from(nodes)
+        nodes = list(dict.fromkeys(nodes))
 
         self._relationship = relationship
 
         self._stringify = stringify(symbols=symbols)
 
-        for a, b in combinations(nodes, 2):
-            if relationship(a, b):
-                lattice.add_edge(b, a, weight=-1)
-            elif relationship(b, a):
-                lattice.add_edge(a, b, weight=-1)
+        pairs = []
+
+        def found():
+            """
+            The comparable pairs found so far.
+            """
+            order = nx.DiGraph()
+            order.add_nodes_from(nodes)
+            order.add_edges_from((nodes[i], nodes[j]) for i, j in pairs)
+            return order
+
+        monitor = _Monitor(progress, token)
+        monitor.start('comparison', len(nodes) * (len(nodes) - 1) // 2, partial=found, elements=len(nodes))
+
+        compare = counted(self, 'relationship', relationship)
+        with span(self, 'compare'):
+            # Each node is compared with those before it, so that the order
+            # found so far is complete on a prefix of the nodes.
+            for j, b in enumerate(nodes):
+                for i in range(j):
+                    a = nodes[i]
+                    if compare(a, b):
+                        pairs.append((j, i))
+                    elif compare(b, a):
+                        pairs.append((i, j))
+                if j and not j % _ROW_REPORT_EVERY:
+                    monitor.update(j * (j + 1) // 2)
+        if compare is not relationship:
+            compare.flush()
+        monitor.finish()
+
+        monitor.start('sort', len(nodes), partial=found)
+        with span(self, 'order'):
+            # A node lies above more nodes than anything below it does, so
+            # sorting by the number of descendants gives a topological order.
+            counts = [0] * len(nodes)
+            for i, _ in pairs:
+                counts[i] += 1
+            order = sorted(range(len(nodes)), key=counts.__getitem__, reverse=True)
+            position = {i: k for k, i in enumerate(order)}
+
+            downs = [1 << k for k in range(len(nodes))]
+            for i, j in pairs:
+                downs[position[i]] |= 1 << position[j]
+
+            ts = [nodes[i] for i in order]
+        monitor.finish()
+
+        monitor.start('reduction', len(nodes), partial=found)
+        with span(self, 'covers'):
+            # The lowest-indexed descendant not yet accounted for is always
+            # maximal, so the covers are found greedily.
+            edges = []
+            for k, down in enumerate(downs):
+                down &= ~(1 << k)
+                while down:
+                    low = down & -down
+                    j = low.bit_length() - 1
+                    edges.append((k, j))
+                    down &= ~downs[j]
+                if k and not k % _ROW_REPORT_EVERY:
+                    monitor.update(k)
+        monitor.finish()
+
+        self._set_covers(ts, edges, backend=backend)
+        self._symmetries = [self._permutation(symmetry) for symmetry in symmetries or ()]
+
+    @classmethod
+    def _from_hasse(cls, hasse, relationship, symbols='•꞉⋮', ts=None, backend=None):
+        """
+        Construct a lattice directly from its Hasse diagram, bypassing the
+        pairwise comparison of nodes.
 
-        longest_paths = nx.algorithms.all_pairs_bellman_ford_path_length(lattice)
+        Parameters
+        ----------
+        hasse : nx.DiGraph
+            The cover relation, with edges pointing from each node to the nodes
+            it covers.
+        relationship : func
+            A function implementing the ordering among the nodes of `hasse`.
+        symbols : str
+            The symbols to use to separate elements of each node.
+        ts : list, None
+            A topological order of `hasse`, from top to bottom. If None, one is
+            computed.
+        backend : str, None
+            How to store the cover relation. If None, one is chosen by size.
 
-        new_lattice = nx.DiGraph()
-        new_lattice.add_nodes_from(lattice.nodes())
+        Returns
+        -------
+        lattice : Lattice
+            The lattice with cover relation `hasse`.
+        """
+        lattice = cls.__new__(cls)
+        lattice._relationship = relationship
+        lattice._stringify = stringify(symbols=symbols)
+        lattice._set_hasse(hasse, ts=ts, backend=backend)
+        return lattice
 
-        for i, paths in longest_paths:
-            for j, weight in paths.items():
-                if weight == -1:
-                    new_lattice.add_edge(i, j)
+    def _set_hasse(self, hasse, ts=None, backend=None):
+        """
+        Install `hasse` as the cover relation of the lattice.
 
-        self._lattice = new_lattice
+        Parameters
+        ----------
+        hasse : nx.DiGraph
+            The cover relation, with edges pointing from each node to the nodes
+            it covers.
+        ts : list, None
+            A topological order of `hasse`, from top to bottom. If None, one is
+            computed.
+        backend : str, None
+            How to store the cover relation. If None, one is chosen by size.
+        """
+        if ts is None:
+            with span(self, 'order'):
+                ts = list(nx.topological_sort(hasse))
+        self._set_covers(ts, graph=hasse, backend=backend)
 
-        self._ts = list(nx.topological_sort(new_lattice))
+    def _set_covers(self, ts, edges=None, graph=None, backend=None):
+        """
+        Index the nodes, and store the cover relation in a backend.
 
-        self.top = self._ts[0]
-        self.bottom = self._ts[-1]
+        Each node is indexed by its position in the topological order, and the
+        nodes above and below it are recorded as bitsets over those indices.
+        Since every node precedes the nodes below it, the join of some nodes is
+        the highest set bit of the intersection of their up-sets, and their
+        meet is the lowest set bit of the intersection of their down-sets.
 
-    def __iter__(self):
+        Parameters
+        ----------
+        ts : list
+            The nodes, in topological order from top to bottom.
+        edges : iterable, None
+            The pairs (upper, lower) of indices into `ts` of the cover
+            relation. Either this or `graph` must be given.
+        graph : nx.DiGraph, None
+            The cover relation, with edges pointing from each node to the nodes
+            it covers.
+        backend : str, Backend, None
+            How to store the cover relation. If None, one is chosen by size. A
+            `Backend` already holding the cover relation of `ts` is used as is,
+            and neither `edges` nor `graph` need be given.
+
+        Raises
+        ------
+        ValueError
+            Raised if `backend` is not known.
         """
-        Return an iterator over the nodes of the lattice.
+        backend = select_backend(len(ts)) if backend is None else backend
+        if not isinstance(backend, Backend) and backend not in BACKENDS:
+            msg = "Unknown backend {!r}; choose from {}.".format(backend, sorted(BACKENDS))
+            raise ValueError(msg)
 
-        Returns
-        -------
-        iter : iterator
-            An iterator over `self._lattice`.
-        """
-        return iter(self._ts)
+        self._ts = ts
+        self._nodes = self._ts
+        self._mask = (1 << len(self._ts)) - 1
+        self._convex = True
+        self._closed = True
+        self._canonical = None
+        self._tables = {}
+        self._symmetries = []
+
+        with span(self, 'index'):
+            self._index = {node: i for i, node in enumerate(self._ts)}
+            if isinstance(backend, Backend):
+                self._backend = backend
+                self._backend.index = self._index
+            elif backend == 'networkx' and graph is not None:
+                self._backend = NetworkXBackend(self._ts, self._index, graph)
+            else:
+                if edges is None:
+                    edges = ((self._index[u], self._index[l]) for u, l in graph.edges())
+                self._backend = BACKENDS[backend].from_edges(self._ts, self._index, edges)
 
-    def _validate(self):
+        self._up = self._backend.up
+        self._down = self._backend.down
+
+        self.top = self._ts[0]
+        self.bottom = self._ts[-1]
+
+    @property
+    def _lattice(self):
         """
-        Validate that the elements and partial order form a lattice.
+        The cover relation, as a graph of the nodes.
 
         Returns
         -------
-        valid : bool
-            True if the partial order is a lattice, False otherwise.
+        hasse : nx.DiGraph
+            The cover relation, with edges pointing from each node to the nodes
+            it covers.
         """
-        def least_upper_bound(nodes):
-            for node in nodes:
-                if all(node in self.descendants(ub, include=True) for ub in nodes):
-                    return node
-
-        def greatest_lower_bound(nodes):
-            for node in nodes:
-                if all(node in self.ascendants(lb, include=True) for lb in nodes):
-                    return node
-
-        for a, b in combinations(self, 2):
-            upper_bounds = self.ascendants(a, include=True) & self.ascendants(b, include=True)
-            if not least_upper_bound(upper_bounds):
-                return False
-            lower_bounds = self.descendants(a, include=True) & self.descendants(b, include=True)
-            if not greatest_lower_bound(lower_bounds):
-                return False
-        else:
-            return True
+        return self._backend.graph()
 
     @property
-    def distributive(self):
+    def backend(self):
         """
-        Determine whether the lattice is distributive or not:
-            a ∨ (b ∧ c) = (a ∨ b) ∧ (a ∨ c)
+        The name of the backend storing the cover relation.
 
         Returns
         -------
-        distributed : bool
-            Whether the lattice is distributive or not.
+        backend : str
+            One of 'networkx', 'bitmatrix' or 'csr'.
         """
-        for a, b, c in permutations(self, 3):
-            left = self.join(a, self.meet(b, c))
-            right = self.meet(self.join(a, b), self.join(a, c))
-            if not left == right:
-                return False
-        else:
-            return True
+        return self._backend.name
 
     @property
-    def modular(self):
+    def labels(self):
         """
-        Determine whether the lattice is modular or not:
-            (a ∧ c) ∨ (b ∧ c) = ((a ∧ c) ∨ b) ∧ c.
+        The string label of each node, computed once per node and cached until
+        the nodes change.
 
         Returns
         -------
-        distributed : bool
-            Whether the lattice is modular or not.
+        labels : dict
+            The label of each node, in topological order from the top.
         """
-        for a, b, c in permutations(self, 3):
-            left = self.join(self.meet(a, c), self.meet(b, c))
-            right = self.meet(self.join(self.meet(a, c), b), c)
-            if not left == right:
-                return False
-        else:
-            return True
+        if 'labels' not in self._tables:
+            self._tables['labels'] = {node: self._stringify(node) for node in self}
+        return self._tables['labels']
 
-    def inverse(self):
+    def stats(self):
         """
-        Construct the inverse of the lattice.
+        The events concerning this lattice recorded while instrumentation was
+        active; see `lattices.instrumentation.instrument`.
 
         Returns
         -------
-        inverse : Lattice
-            The lattice inverse.
+        stats : dict
+            The 'counters' of relationship evaluations, joins, meets, traversals
+            and cache hits and misses, and the seconds spent in each of the
+            'spans' of construction: 'compare', 'order', 'covers' and 'index',
+            as well as 'canonical_form'.
         """
-        inverse = deepcopy(self)
-
-        inverse._lattice = inverse._lattice.reverse()
-        inverse._relationship = lambda a, b: self._relationship(b, a)
-        inverse._ts = list(nx.topological_sort(inverse._lattice))
-        inverse.top, inverse.bottom = inverse.bottom, inverse.top
+        stats = getattr(self, '_stats', None)
+        return stats.as_dict() if stats is not None else {'counters': {}, 'spans': {}}
 
-        return inverse
-
-    def ascendants(self, node, include=False):
+    def _lowers(self, i):
         """
-        Returns the nodes greater than `node`.
-
         Parameters
         ----------
-        node : {{elements}}
-            The node in the lattice.
-        include : bool
-            Whether `node` should be included or not.
+        i : int
+            The index of a node.
 
         Returns
         -------
-        nodes : {{{elements}}}
-            A list of nodes greater than `node` in the lattice.
+        lowers : [int]
+            The indices of the nodes covered by node `i`.
         """
-        nodes = list(nx.bfs_tree(self._lattice.reverse(), node))
-        if not include:
-            nodes.remove(node)
-        return set(nodes)
+        return self._backend.lowers(i)
 
-    def descendants(self, node, include=False):
+    def _uppers(self, i):
         """
-        Returns the nodes less than `node`.
-
         Parameters
         ----------
-        node : {{elements}}
-            The node in the lattice.
-        include : bool
-            Whether `node` should be included or not.
+        i : int
+            The index of a node.
 
         Returns
         -------
-        nodes : {{{elements}}}
-            A list of nodes less than `node` in the lattice.
+        uppers : [int]
+            The indices of the nodes covering node `i`.
         """
-        nodes = list(nx.bfs_tree(self._lattice, node))
-        if not include:
-            nodes.remove(node)
-        return set(nodes)
+        return self._backend.uppers(i)
 
-    def covers(self, node):
+    def _modifiable(self):
         """
-        Return the covers of `node`; the elements of the lattice immediately
-        less than `node`.
+        Move the cover relation into the networkx backend, which is the only one
+        which can be modified in place.
+        """
+        if self._backend.name != 'networkx':
+            self._backend = NetworkXBackend(self._ts, self._index, self._lattice)
+            self._up = self._backend.up
+            self._down = self._backend.down
+            self._tables = {}
+
+    @classmethod
+    def generate(cls, generators, join, meet, relationship=None, symbols='•꞉⋮', executor=None):
+        """
+        Construct the lattice generated by `generators` under `join` and `meet`;
+        for example a sublattice of an ambient lattice too large to construct.
 
         Parameters
         ----------
-        node : {elements}
-            The node of interest.
+        generators : collection
+            The hashable elements generating the lattice.
+        join : func
+            A function computing the join of two elements.
+        meet : func
+            A function computing the meet of two elements.
+        relationship : func, None
+            A function implementing the ordering among the elements. If None,
+            a <= b when the join of a and b is b.
+        symbols : str
+            The symbols to use to separate elements of each node.
+        executor : concurrent.futures.Executor, None
+            An executor with which to compute joins and meets in parallel.
 
         Returns
         -------
-        covers : {{elements}}
-            The covers.
+        lattice : Lattice
+            The generated lattice.
+
+        See Also
+        --------
+        lattices.closure.closure : Stream the elements as they are found.
         """
-        return self._lattice[node]
+        if relationship is None:
+            def relationship(a, b):
+                """
+                a <= b --> a ∨ b = b.
+                """
+                return join(a, b) == b
 
-    def join(self, *nodes, predicate=None):
+        return cls(closure(generators, join, meet, executor=executor), relationship, symbols=symbols)
+
+    @classmethod
+    def completion(cls, nodes, relationship, symbols='•꞉⋮'):
         """
-        Return the join of `nodes`, that is the least element which is greater
-        than all `nodes`.
+        Construct the Dedekind-MacNeille completion of a partial order; that is,
+        the smallest lattice into which it embeds.
+
+        The cuts of the completion are the intersections of principal down-sets,
+        each stored as a bitset over `nodes`. Cuts which are the down-set of an
+        original node are labeled by that node, while the new nodes are labeled
+        by a `Cut` of the original nodes below them.
 
         Parameters
         ----------
-        nodes : {{elements}}
-            The nodes to compute the join of.
-        predicate : func
-            A function for which the found join must satisfy.
+        nodes : collection
+            A collection of elements which are partially ordered by
+            `relationship`.
+        relationship : func
+            A function implementing the ordering among `nodes`.
+        symbols : str
+            The symbols to use to separate elements of each node.
 
         Returns
         -------
-        join : {{elements}}
-            The join of `nodes`.
+        completion : Lattice
+            The Dedekind-MacNeille completion of `nodes` under `relationship`.
         """
-        parentss = [self.ascendants(node, include=True) for node in nodes]
-        joins = {n for n in self._ts if all(n in parents for parents in parentss)}
-        if predicate is not None:
-            joins = {n for n in joins if predicate(n)}
-        aboves = {n for n in joins if any(n in self.ascendants(ub) for ub in joins)}
-        joins = list(joins - aboves)
-
-        if joins:
-            return joins[0]
-        else:
-            msg = "Join could not be found satisfying the predicate."
-            raise ValueError(msg)
+        nodes = list(nodes)
 
-    def meet(self, *nodes, predicate=None):
+        downs = [1 << i for i in range(len(nodes))]
+        for (i, a), (j, b) in combinations(enumerate(nodes), 2):
+            if relationship(a, b):
+                downs[j] |= 1 << i
+            elif relationship(b, a):
+                downs[i] |= 1 << j
+
+        # Every cut is the intersection of some principal down-sets, the full
+        # set being the empty intersection.
+        cuts = {(1 << len(nodes)) - 1}
+        for down in downs:
+            cuts |= {cut & down for cut in cuts}
+        cuts = sorted(cuts, key=lambda cut: bin(cut).count('1'))
+
+        principals = {down: node for node, down in zip(nodes, downs)}
+        labels = [principals[cut] if cut in principals else Cut(nodes[i] for i in _bits(cut)) for cut in cuts]
+
+        hasse = nx.DiGraph()
+        hasse.add_nodes_from(labels)
+
+        # Visiting the cuts in order of size, the subcuts of each cut are
+        # collected as a bitset over cut indices; its lower covers are then
+        # found greedily from the largest subcut down.
+        belows = []
+        for i, cut in enumerate(cuts):
+            below = 0
+            for j in range(i):
+                if cuts[j] & ~cut == 0:
+                    below |= 1 << j
+            belows.append(below | 1 << i)
+            while below:
+                j = below.bit_length() - 1
+                hasse.add_edge(labels[i], labels[j])
+                below &= ~belows[j]
+
+        index = dict(zip(labels, cuts))
+
+        def cut_le(a, b):
+            """
+            a <= b --> the cut of a is contained in the cut of b.
+            """
+            return index[a] & ~index[b] == 0
+
+        return cls._from_hasse(hasse, cut_le, symbols=symbols)
+
+    @classmethod
+    def product(cls, *lattices, symbols='•꞉⋮'):
         """
-        Return the meet of `nodes`, that is the greatest element which is less
-        than all `nodes`.
+        Construct the direct product of `lattices`, ordered componentwise.
+
+        A tuple covers another exactly when they differ in a single coordinate,
+        where one covers the other, so the cover relation is read off the
+        factors' covers without comparing any tuples.
 
         Parameters
         ----------
-        nodes : {{elements}}
-            The nodes to compute the meet of.
-        predicate : func
-            A function for which the found meet must satisfy.
+        lattices : Lattice
+            The factors of the product.
+        symbols : str
+            The symbols to use to separate elements of each node.
 
         Returns
         -------
-        meet : {{elements}}
-            The meet of `nodes`.
+        product : Lattice
+            The lattice of tuples of nodes of `lattices`.
         """
-        childrens = [self.descendants(node, include=True) for node in nodes]
-        meets = {n for n in self._ts if all(n in children for children in childrens)}
-        if predicate is not None:
-            meets = {n for n in meets if predicate(n)}
-        belows = {n for n in meets if any(n in self.descendants(ub) for ub in meets)}
-        meets = list(meets - belows)
-
-        if meets:
-            return meets[0]
-        else:
-            msg = "Meet could not be found satisfying the predicate."
-            raise ValueError(msg)
-
-    def complement(self, node):
+        # Lexicographic order over the factors' topological orders is itself a
+        # topological order of the product.
+        ts = list(product(*(lattice._ts for lattice in lattices)))
+
+        hasse = nx.DiGraph()
+        hasse.add_nodes_from(ts)
+        for node in ts:
+            for k, lattice in enumerate(lattices):
+                for cover in lattice._lattice[node[k]]:
+                    hasse.add_edge(node, node[:k] + (cover,) + node[k + 1:])
+
+        def product_le(a, b):
+            """
+            a <= b --> each coordinate of a is below that of b.
+            """
+            return all(lattice._down[lattice._index[y]] >> lattice._index[x] & 1
+                       for lattice, x, y in zip(lattices, a, b))
+
+        return cls._from_hasse(hasse, product_le, symbols=symbols, ts=ts)
+
+    @classmethod
+    def ordinal_sum(cls, *lattices, symbols='•꞉⋮'):
         """
-        Find the complement(s) of `node`.
+        Construct the ordinal sum of `lattices`, stacking each lattice above
+        the one before it.
 
         Parameters
         ----------
-        node : {{elements}}
-            The node to find the complement(s) of.
+        lattices : Lattice
+            The summands, from bottom to top. Their nodes must be disjoint.
+        symbols : str
+            The symbols to use to separate elements of each node.
 
         Returns
         -------
-        complement : {{{elements}}}
-            The complement(s) of `node`.
+        ordinal_sum : Lattice
+            The lattice in which each node of a summand lies below every node
+            of the summands after it.
+
+        Raises
+        ------
+        ValueError
+            If the summands share a node.
         """
-        return {n for n in self._lattice if (self.join(n, node) == self.top) and
-                                            (self.meet(n, node) == self.bottom)}
+        place = {}
+        for k, lattice in enumerate(lattices):
+            for node in lattice:
+                if node in place:
+                    msg = "The summands share the node {!r}.".format(node)
+                    raise ValueError(msg)
+                place[node] = k
+
+        hasse = nx.DiGraph()
+        ts = []
+        for lower, upper in zip((None,) + lattices, lattices):
+            hasse.add_edges_from(upper._lattice.edges())
+            hasse.add_nodes_from(upper._ts)
+            if lower is not None:
+                hasse.add_edge(upper.bottom, lower.top)
+            ts[:0] = upper._ts
+
+        def sum_le(a, b):
+            """
+            a <= b --> a is in an earlier summand than b, or below it in theirs.
+            """
+            if place[a] != place[b]:
+                return place[a] < place[b]
+            lattice = lattices[place[a]]
+            return bool(lattice._down[lattice._index[b]] >> lattice._index[a] & 1)
+
+        return cls._from_hasse(hasse, sum_le, symbols=symbols, ts=ts)
 
-    def join_irreducibles(self):
+    def __iter__(self):
         """
-        The join-irreducible elements of the lattice.
+        Return an iterator over the nodes of the lattice.
 
         Returns
         -------
-        jis : {{{elements}}}
-            The list of join-irreducible elements of the lattice.
+        iter : iterator
+            An iterator over `self._lattice`.
         """
-        return {n for n in self._lattice if len(self._lattice[n]) == 1}
+        return iter(self._ts)
 
-    def meet_irreducibles(self):
+    def canonical_form(self):
         """
-        The meet-irreducible elements of the lattice.
+        Compute the canonical form of the lattice; a relabeling of its cover
+        relation which is the same for all isomorphic lattices.
+
+        The form is hashable, so it can key lattices up to isomorphism in sets
+        and dicts. Lattices themselves hash by identity, since they can be
+        modified.
 
         Returns
         -------
-        mis : {{{elements}}}
-            The list of meet-irreducible elements of the lattice.
+        edges : tuple
+            The sorted pairs (upper, lower) of the cover relation, with nodes
+            numbered canonically.
         """
-        reverse = self._lattice.reverse()
-        return {n for n in reverse if len(reverse[n]) == 1}
+        if self._canonical is None:
+            count(self, 'cache_miss')
+            with span(self, 'canonical_form'):
+                self._canonical = canonical_form(self)
+        else:
+            count(self, 'cache_hit')
+        return self._canonical[0]
 
-    def irreducibles(self):
+    def isomorphic(self, other):
         """
-        The irreducible elements of the lattice.
+        Determine whether the lattice is isomorphic to `other`.
+
+        Parameters
+        ----------
+        other : Lattice
+            The lattice to compare with.
 
         Returns
         -------
-        irrs : {{{elements}}}
-
+        isomorphic : bool
+            Whether there is an order isomorphism between the two lattices.
         """
-        return self.join_irreducibles() & self.meet_irreducibles()
+        return len(self._ts) == len(other._ts) and self.canonical_form() == other.canonical_form()
 
-    def chains(self):
+    def _permutation(self, symmetry):
         """
-        Yield all the maximal chains of the lattice.
+        Convert a symmetry of the nodes into a permutation of their positions.
 
-        Yields
+        Parameters
+        ----------
+        symmetry : func
+            A function mapping each node to its image.
+
+        Returns
+        -------
+        permutation : [int]
+            The position of the image of each node.
+
+        Raises
         ------
-        chain : list
-            A maximal chain from bottom to top.
+        ValueError
+            Raised if `symmetry` does not permute the nodes while preserving
+            the cover relation.
         """
-        yield from nx.all_simple_paths(self._lattice.reverse(), self.bottom, self.top)
+        try:
+            permutation = [self._index[symmetry(node)] for node in self._ts]
+        except KeyError:
+            msg = "Symmetries must map nodes to nodes."
+            raise ValueError(msg)
+        hasse = self._lattice
+        if len(set(permutation)) != len(permutation) or \
+           any(not hasse.has_edge(self._ts[permutation[self._index[u]]], self._ts[permutation[self._index[l]]])
+               for u, l in hasse.edges()):
+            msg = "Symmetries must be automorphisms of the lattice."
+            raise ValueError(msg)
+        return permutation
 
-    def _pretty_lattice(self):  # pragma: no cover
+    def automorphisms(self):
         """
-        Construct a version of the lattice with nicer looking node labels.
+        Find automorphisms of the lattice.
+
+        These are the symmetries given at construction or, if there were none,
+        the automorphisms found during the canonical labeling of the lattice,
+        which are then used by the property checks as well. Either way they need
+        not generate the whole automorphism group.
 
         Returns
         -------
-        pretty_lattice : nx.DiGraph
-            A topologically-equivalent, but more nicely labeled, lattice.
+        automorphisms : [dict]
+            Each automorphism, as a mapping from nodes to their images.
         """
-        edges = [(self._stringify(a), self._stringify(b)) for a, b in self._lattice.edges()]
-        return nx.from_edgelist(edges, nx.DiGraph)
+        if not self._symmetries:
+            self.canonical_form()
+            self._symmetries = self._canonical[1]
+        return [{node: self._ts[i] for node, i in zip(self._ts, permutation)} for permutation in self._symmetries]
 
-    def draw(self):  # pragma: no cover
-        """
-        Draw a pretty version of the lattice.
+    def _pair_representatives(self, ordered=True):
         """
-        from nxpd import draw
+        Choose one pair of distinct nodes from each orbit of pairs under the
+        recorded symmetries.
 
-        draw(self._pretty_lattice())
+        The pairs are generated lazily. With symmetries, a pair is chosen when
+        it is the least, by position, in its orbit. Only pairs whose first node
+        is the least in its own orbit can be, and the orbit of each of those is
+        searched only until a lesser pair turns up, so memory is bounded by the
+        size of an orbit rather than the number of pairs.
 
-    def _repr_png_(self):  # pragma: no cover
-        """
+        Parameters
+        ----------
+        ordered : bool
+            Whether (a, b) and (b, a) are to be distinguished. Defaults to True.
+
+        Yields
+        ------
+        pair : (node, node)
+            The representative pairs.
+        """
+        n = len(self._ts)
+        pairs = permutations(range(n), 2) if ordered else combinations(range(n), 2)
+        if not self._symmetries:
+            for i, j in pairs:
+                yield self._ts[i], self._ts[j]
+            return
+
+        # The least node in the orbit of each node.
+        least = list(range(n))
+
+        def find(i):
+            """
+            Find the least node in the orbit of node `i`.
+            """
+            while least[i] != i:
+                least[i] = least[least[i]]
+                i = least[i]
+            return i
+
+        for permutation in self._symmetries:
+            for i in range(n):
+                a, b = find(i), find(permutation[i])
+                least[max(a, b)] = min(a, b)
+
+        def images(i, j):
+            """
+            The pairs one symmetry away from (i, j).
+            """
+            for permutation in self._symmetries:
+                yield permutation[i], permutation[j]
+            if not ordered:
+                yield j, i
+
+        for i, j in pairs:
+            if find(i) != i or not ordered and find(j) < i:
+                continue
+            seen = {(i, j)}
+            stack = [(i, j)]
+            while stack:
+                for image in images(*stack.pop()):
+                    if not ordered:
+                        image = min(image), max(image)
+                    if image < (i, j):
+                        break
+                    if image not in seen:
+                        seen.add(image)
+                        stack.append(image)
+                else:
+                    continue
+                break
+            else:
+                yield self._ts[i], self._ts[j]
+
+    def add_node(self, node):
+        """
+        Add `node` to the lattice, comparing it only against the existing nodes
+        and patching the cover relation and index locally.
+
+        Parameters
+        ----------
+        node : {elements}
+            The node to add. It must be ordered with respect to the existing
+            nodes by the lattice's relationship. Adding a node which is already
+            in the lattice does nothing.
+        """
+        if node in self._index:
+            return
+        self._modifiable()
+
+        compare = counted(self, 'relationship', self._relationship)
+        aboves = {n for n in self._ts if compare(node, n)}
+        belows = {n for n in self._ts if n not in aboves and compare(n, node)}
+        if compare is not self._relationship:
+            compare.flush()
+
+        # `aboves` is an up-set, so its minimal elements are those none of whose
+        # covers lie within it; dually for `belows`.
+        uppers = [n for n in aboves if not any(c in aboves for c in self._lattice[n])]
+        lowers = [n for n in belows if not any(p in belows for p in self._lattice.pred[n])]
+
+        for upper in uppers:
+            for lower in lowers:
+                if self._lattice.has_edge(upper, lower):
+                    self._lattice.remove_edge(upper, lower)
+
+        self._lattice.add_node(node)
+        self._lattice.add_edges_from((upper, node) for upper in uppers)
+        self._lattice.add_edges_from((node, lower) for lower in lowers)
+
+        # Every node above `node` precedes every node below it, so `node` can be
+        # placed directly after the last of its ascendants.
+        position = max((self._index[n] for n in aboves), default=-1) + 1
+        self._ts.insert(position, node)
+        for i in range(position, len(self._ts)):
+            self._index[self._ts[i]] = i
+
+        low = (1 << position) - 1
+
+        def shift(bitset):
+            """
+            Open a zero bit at `position`.
+            """
+            return (bitset & ~low) << 1 | bitset & low
+
+        self._up = [shift(up) for up in self._up]
+        self._down = [shift(down) for down in self._down]
+        self._up.insert(position, 1 << position)
+        self._down.insert(position, 1 << position)
+        for n in aboves:
+            self._up[position] |= self._up[self._index[n]]
+            self._down[self._index[n]] |= 1 << position
+        for n in belows:
+            self._down[position] |= self._down[self._index[n]]
+            self._up[self._index[n]] |= 1 << position
+        self._mask = (1 << len(self._ts)) - 1
+        self._canonical = None
+        self._tables = {}
+        self._symmetries = []
+
+        self.top = self._ts[0]
+        self.bottom = self._ts[-1]
+
+    def remove_node(self, node):
+        """
+        Remove `node` from the lattice, connecting each of its upper covers to
+        each of its lower covers which nothing else lies between.
+
+        Like `add_node`, this is idempotent: removing a node which is not in the
+        lattice does nothing.
+
+        Parameters
+        ----------
+        node : {elements}
+            The node to remove.
+        """
+        if node not in self._index:
+            return
+        self._modifiable()
+
+        position = self._index.pop(node)
+        uppers = [self._index[n] for n in self._lattice.pred[node]]
+        lowers = [self._index[n] for n in self._lattice[node]]
+
+        self._lattice.remove_node(node)
+        del self._ts[position]
+        del self._up[position]
+        del self._down[position]
+        for i in range(position, len(self._ts)):
+            self._index[self._ts[i]] = i
+
+        low = (1 << position) - 1
+
+        def drop(bitset):
+            """
+            Remove the bit at `position`.
+            """
+            return (bitset >> 1) & ~low | bitset & low
+
+        self._up = [drop(up) for up in self._up]
+        self._down = [drop(down) for down in self._down]
+        self._mask = (1 << len(self._ts)) - 1
+        self._canonical = None
+        self._tables = {}
+        self._symmetries = []
+
+        # An upper cover covers a lower cover when the interval between them
+        # holds nothing else.
+        uppers = [i - (i > position) for i in uppers]
+        lowers = [i - (i > position) for i in lowers]
+        for upper in uppers:
+            for lower in lowers:
+                if self._down[upper] & self._up[lower] == 1 << upper | 1 << lower:
+                    self._lattice.add_edge(self._ts[upper], self._ts[lower])
+
+        self.top = self._ts[0]
+        self.bottom = self._ts[-1]
+
+    def _validate(self):
+        """
+        Validate that the elements and partial order form a lattice.
+
+        Returns
+        -------
+        valid : bool
+            True if the partial order is a lattice, False otherwise.
+        """
+        def least_upper_bound(nodes):
+            return any(all(node in self.descendants(ub, include=True) for ub in nodes) for node in nodes)
+
+        def greatest_lower_bound(nodes):
+            return any(all(node in self.ascendants(lb, include=True) for lb in nodes) for node in nodes)
+
+        for a, b in self._pair_representatives(ordered=False):
+            upper_bounds = self.ascendants(a, include=True) & self.ascendants(b, include=True)
+            if not least_upper_bound(upper_bounds):
+                return False
+            lower_bounds = self.descendants(a, include=True) & self.descendants(b, include=True)
+            if not greatest_lower_bound(lower_bounds):
+                return False
+        else:
+            return True
+
+    @property
+    def distributive(self):
+        """
+        Determine whether the lattice is distributive or not:
+            a ∨ (b ∧ c) = (a ∨ b) ∧ (a ∨ c)
+
+        Returns
+        -------
+        distributed : bool
+            Whether the lattice is distributive or not.
+        """
+        for a, b in self._pair_representatives():
+            for c in self:
+                if c == a or c == b:
+                    continue
+                left = self.join(a, self.meet(b, c))
+                right = self.meet(self.join(a, b), self.join(a, c))
+                if not left == right:
+                    return False
+        else:
+            return True
+
+    @property
+    def modular(self):
+        """
+        Determine whether the lattice is modular or not:
+            (a ∧ c) ∨ (b ∧ c) = ((a ∧ c) ∨ b) ∧ c.
+
+        Returns
+        -------
+        distributed : bool
+            Whether the lattice is modular or not.
+        """
+        for a, b in self._pair_representatives():
+            for c in self:
+                if c == a or c == b:
+                    continue
+                left = self.join(self.meet(a, c), self.meet(b, c))
+                right = self.meet(self.join(self.meet(a, c), b), c)
+                if not left == right:
+                    return False
+        else:
+            return True
+
+    def dual(self):
+        """
+        Construct the dual of the lattice, in which the order is reversed.
+
+        Returns
+        -------
+        dual : Lattice
+            The lattice dual.
+        """
+        dual = Lattice._from_hasse(self._lattice.reverse(), lambda a, b: self._relationship(b, a), ts=self._ts[::-1])
+        dual._stringify = self._stringify
+
+        return dual
+
+    def inverse(self):
+        """
+        Construct the inverse of the lattice.
+
+        Returns
+        -------
+        inverse : Lattice
+            The lattice inverse; the same as `dual`.
+        """
+        return self.dual()
+
+    def ascendants(self, node, include=False):
+        """
+        Returns the nodes greater than `node`.
+
+        Parameters
+        ----------
+        node : {{elements}}
+            The node in the lattice.
+        include : bool
+            Whether `node` should be included or not.
+
+        Returns
+        -------
+        nodes : {{{elements}}}
+            A list of nodes greater than `node` in the lattice.
+        """
+        if _recorders.stack:
+            count(self, 'traversal')
+        i = self._index[node]
+        ups = self._up[i] & self._mask
+        if not include:
+            ups &= ~(1 << i)
+        return {self._nodes[j] for j in _bits(ups)}
+
+    def descendants(self, node, include=False):
+        """
+        Returns the nodes less than `node`.
+
+        Parameters
+        ----------
+        node : {{elements}}
+            The node in the lattice.
+        include : bool
+            Whether `node` should be included or not.
+
+        Returns
+        -------
+        nodes : {{{elements}}}
+            A list of nodes less than `node` in the lattice.
+        """
+        if _recorders.stack:
+            count(self, 'traversal')
+        i = self._index[node]
+        downs = self._down[i] & self._mask
+        if not include:
+            downs &= ~(1 << i)
+        return {self._nodes[j] for j in _bits(downs)}
+
+    def interval(self, a, b):
+        """
+        Return the interval [`a`, `b`]; the nodes both above `a` and below `b`.
+
+        Parameters
+        ----------
+        a : {elements}
+            The bottom of the interval.
+        b : {elements}
+            The top of the interval.
+
+        Returns
+        -------
+        interval : LatticeView
+            A view of the interval, sharing this lattice's index.
+
+        Raises
+        ------
+        ValueError
+            If `a` is not below `b`.
+        """
+        mask = self._up[self._index[a]] & self._down[self._index[b]] & self._mask
+        if not mask:
+            msg = "The interval is empty; {!r} is not below {!r}.".format(a, b)
+            raise ValueError(msg)
+        return LatticeView(self, mask, convex=self._convex, closed=self._closed)
+
+    def upset(self, a):
+        """
+        Return the principal filter of `a`; the nodes above `a`.
+
+        Parameters
+        ----------
+        a : {elements}
+            The bottom of the filter.
+
+        Returns
+        -------
+        upset : LatticeView
+            A view of the filter, sharing this lattice's index.
+        """
+        return LatticeView(self, self._up[self._index[a]] & self._mask, convex=self._convex, closed=self._closed)
+
+    def downset(self, b):
+        """
+        Return the principal ideal of `b`; the nodes below `b`.
+
+        Parameters
+        ----------
+        b : {elements}
+            The top of the ideal.
+
+        Returns
+        -------
+        downset : LatticeView
+            A view of the ideal, sharing this lattice's index.
+        """
+        return LatticeView(self, self._down[self._index[b]] & self._mask, convex=self._convex, closed=self._closed)
+
+    def sublattice(self, nodes):
+        """
+        Return the sublattice generated by `nodes`; the smallest set of nodes
+        containing `nodes` and closed under join and meet.
+
+        Parameters
+        ----------
+        nodes : {{elements}}
+            The generators of the sublattice.
+
+        Returns
+        -------
+        sublattice : LatticeView
+            A view of the sublattice, sharing this lattice's index.
+        """
+        members = list({self._index[node] for node in nodes})
+        mask = 0
+        for i in members:
+            mask |= 1 << i
+
+        frontier = members
+        while frontier:
+            found = []
+            for i in frontier:
+                for j in members:
+                    join = (self._up[i] & self._up[j] & self._mask).bit_length() - 1
+                    meet = self._down[i] & self._down[j] & self._mask
+                    meet = (meet & -meet).bit_length() - 1
+                    for k in (join, meet):
+                        if not mask >> k & 1:
+                            mask |= 1 << k
+                            found.append(k)
+            members.extend(found)
+            frontier = found
+
+        return LatticeView(self, mask, convex=False, closed=self._closed)
+
+    def restrict(self, predicate):
+        """
+        Return a view of the nodes satisfying `predicate`, evaluating it once
+        per node.
+
+        The join and meet of the view accept any nodes of this lattice, and
+        agree with `join` and `meet` given `predicate`: the satisfying bounds
+        are found by intersecting with the view's mask, and the first of them in
+        topological order is returned without calling `predicate` again.
+
+        Parameters
+        ----------
+        predicate : func
+            A function of a node returning whether it is to be kept.
+
+        Returns
+        -------
+        restricted : LatticeView
+            A view of the satisfying nodes, sharing this lattice's index. It
+            need not be a sublattice.
+
+        Raises
+        ------
+        ValueError
+            Raised if no node satisfies `predicate`.
+        """
+        mask = 0
+        for i in _bits(self._mask):
+            if predicate(self._nodes[i]):
+                mask |= 1 << i
+
+        if not mask:
+            msg = "No node satisfies the predicate."
+            raise ValueError(msg)
+
+        return LatticeView(self, mask, convex=False)
+
+    def _cover_pairs(self, mask):
+        """
+        Find the cover relation of the order restricted to the nodes in `mask`.
+
+        Parameters
+        ----------
+        mask : int
+            A bitset of node indices.
+
+        Yields
+        ------
+        pair : (int, int)
+            The indices of a node in `mask` and of a node it covers within
+            `mask`.
+        """
+        count(self, 'traversal')
+        for i in _bits(mask):
+            downs = self._down[i] & mask & ~(1 << i)
+            # The lowest-indexed remaining descendant is always maximal.
+            while downs:
+                low = downs & -downs
+                j = low.bit_length() - 1
+                yield i, j
+                downs &= ~self._down[j]
+
+    def covers(self, node):
+        """
+        Return the covers of `node`; the elements of the lattice immediately
+        less than `node`.
+
+        Parameters
+        ----------
+        node : {elements}
+            The node of interest.
+
+        Returns
+        -------
+        covers : {{elements}}
+            The covers.
+        """
+        return [self._nodes[j] for j in self._lowers(self._index[node])]
+
+    def join(self, *nodes, predicate=None):
+        """
+        Return the join of `nodes`, that is the least element which is greater
+        than all `nodes`.
+
+        Parameters
+        ----------
+        nodes : {{elements}}
+            The nodes to compute the join of.
+        predicate : func
+            A function for which the found join must satisfy.
+
+        Returns
+        -------
+        join : {{elements}}
+            The join of `nodes`.
+        """
+        if _recorders.stack:
+            count(self, 'join')
+        ups = self._mask
+        for node in nodes:
+            ups &= self._up[self._index[node]]
+
+        # The upper bounds are visited from the least upward, so the first one
+        # satisfying `predicate` is minimal among those which do.
+        while ups:
+            i = ups.bit_length() - 1
+            if predicate is None or predicate(self._nodes[i]):
+                return self._nodes[i]
+            ups ^= 1 << i
+
+        msg = "Join could not be found satisfying the predicate."
+        raise ValueError(msg)
+
+    def meet(self, *nodes, predicate=None):
+        """
+        Return the meet of `nodes`, that is the greatest element which is less
+        than all `nodes`.
+
+        Parameters
+        ----------
+        nodes : {{elements}}
+            The nodes to compute the meet of.
+        predicate : func
+            A function for which the found meet must satisfy.
+
+        Returns
+        -------
+        meet : {{elements}}
+            The meet of `nodes`.
+        """
+        if _recorders.stack:
+            count(self, 'meet')
+        downs = self._mask
+        for node in nodes:
+            downs &= self._down[self._index[node]]
+
+        # The lower bounds are visited from the greatest downward, so the first
+        # one satisfying `predicate` is maximal among those which do.
+        while downs:
+            low = downs & -downs
+            i = low.bit_length() - 1
+            if predicate is None or predicate(self._nodes[i]):
+                return self._nodes[i]
+            downs ^= low
+
+        msg = "Meet could not be found satisfying the predicate."
+        raise ValueError(msg)
+
+    def _bitset_matrix(self, direction):
+        """
+        Pack the up-sets or down-sets of the nodes into a byte matrix.
+
+        Parameters
+        ----------
+        direction : 'up', 'down'
+            Which bitsets to pack.
+
+        Returns
+        -------
+        matrix : np.ndarray
+            An array whose row `i` holds the bitset of node `i` in little-endian
+            bytes.
+        """
+        count(self, 'cache_hit' if direction in self._tables else 'cache_miss')
+        if direction not in self._tables:
+            self._tables[direction] = self._backend.packed(direction)
+        return self._tables[direction]
+
+    def _members(self):
+        """
+        Mark the nodes of the lattice among the nodes of its index.
+
+        Returns
+        -------
+        members : np.ndarray
+            Whether each index is a node of the lattice.
+        """
+        if 'members' not in self._tables:
+            size = (len(self._nodes) + 7) // 8
+            mask = np.frombuffer(self._mask.to_bytes(size, 'little'), dtype=np.uint8)
+            self._tables['members'] = np.unpackbits(mask, bitorder='little')[:len(self._nodes)].astype(bool)
+        return self._tables['members']
+
+    def _operation_table(self, operation):
+        """
+        Tabulate the join or meet of every pair of nodes.
+
+        The join of i and j is i when j lies below i, and otherwise it is the
+        least of the joins of j with the upper covers of i. Since the least of
+        those has the greatest index, each row is the elementwise maximum of
+        rows already computed. The meet table is found dually.
+
+        Parameters
+        ----------
+        operation : 'join', 'meet'
+            The operation to tabulate.
+
+        Returns
+        -------
+        table : np.ndarray
+            The index of the join or meet of each pair of indices.
+        """
+        count(self, 'cache_hit' if operation in self._tables else 'cache_miss')
+        if operation not in self._tables:
+            n = len(self._nodes)
+            table = np.empty((n, n), dtype=np.int32)
+            if operation == 'join':
+                order, neighbors, reduce = range(n), self._uppers, np.maximum.reduce
+                below = self._bitset_matrix('down')
+            else:
+                order, neighbors, reduce = reversed(range(n)), self._lowers, np.minimum.reduce
+                below = self._bitset_matrix('up')
+            for i in order:
+                covers = list(neighbors(i))
+                table[i] = reduce(table[covers], axis=0) if covers else i
+                table[i, np.unpackbits(below[i], bitorder='little')[:n].astype(bool)] = i
+            self._tables[operation] = table
+        return self._tables[operation]
+
+    def _many(self, operation, pairs, indices, chunksize, memory):
+        """
+        Compute the join or meet of many pairs of nodes.
+
+        Parameters
+        ----------
+        operation : 'join', 'meet'
+            The operation to compute.
+        pairs : iterable
+            Pairs of nodes, or of indices if `indices`.
+        indices : bool
+            Whether `pairs` holds indices rather than nodes.
+        chunksize : int, None
+            The number of pairs to process at once. If None, as many as fit in
+            `memory`.
+        memory : int
+            The number of bytes the temporaries of each chunk may take.
+
+        Returns
+        -------
+        results : np.ndarray
+            The result for each pair.
+        """
+        if not indices:
+            pairs = [(self._index[a], self._index[b]) for a, b in pairs]
+        pairs = np.asarray(pairs, dtype=np.intp).reshape(-1, 2)
+
+        n = len(self._nodes)
+        results = np.empty(len(pairs), dtype=np.intp)
+        # Within a sublattice, joins and meets are those of the whole lattice.
+        tabulated = self._closed and n <= _TABLE_SIZE and self._members()[pairs].all()
+        streamed = not tabulated and self._backend.streamed
+        if chunksize is None:
+            # Each pair of a chunk takes a few words of indices and, on the
+            # bitset path, a few rows of packed bitsets.
+            rows = 0 if tabulated else _PAIR_ROWS + (_STREAM_ROWS if streamed else 0)
+            per_pair = 8 * _PAIR_WORDS + rows * ((n + 7) // 8)
+            chunksize = max(1, memory // per_pair)
+        if tabulated:
+            table = self._operation_table(operation)
+            for start in range(0, len(pairs), chunksize):
+                chunk = pairs[start:start + chunksize]
+                results[start:start + chunksize] = table[chunk[:, 0], chunk[:, 1]]
+        else:
+            direction = 'up' if operation == 'join' else 'down'
+            # A streamed backend packs only the bitsets each chunk uses.
+            matrix = None if streamed else self._bitset_matrix(direction)
+            mask = np.frombuffer(self._mask.to_bytes((n + 7) // 8, 'little'), dtype=np.uint8)
+            for start in range(0, len(pairs), chunksize):
+                chunk = pairs[start:start + chunksize]
+                if streamed:
+                    rows, inverse = np.unique(chunk, return_inverse=True)
+                    inverse = inverse.reshape(chunk.shape)
+                    packed = self._backend.packed(direction, rows)
+                    bounds = packed[inverse[:, 0]] & packed[inverse[:, 1]] & mask
+                else:
+                    bounds = matrix[chunk[:, 0]] & matrix[chunk[:, 1]] & mask
+                nonzero = bounds != 0
+                if not nonzero.any(axis=1).all():
+                    msg = "{} could not be found satisfying the predicate.".format(operation.capitalize())
+                    raise ValueError(msg)
+                # The join is the highest set bit of the common up-set, and the
+                # meet the lowest set bit of the common down-set.
+                if operation == 'join':
+                    byte = bounds.shape[1] - 1 - np.argmax(nonzero[:, ::-1], axis=1)
+                    bits = _HIGH_BITS
+                else:
+                    byte = np.argmax(nonzero, axis=1)
+                    bits = _LOW_BITS
+                results[start:start + chunksize] = 8 * byte + bits[bounds[np.arange(len(chunk)), byte]]
+
+        if indices:
+            return results
+        return self._node_array()[results]
+
+    def _node_array(self):
+        """
+        Gather the nodes of the index into an array.
+
+        Returns
+        -------
+        nodes : np.ndarray
+            An object array of the node at each index.
+        """
+        if 'nodes' not in self._tables:
+            self._tables['nodes'] = np.empty(len(self._nodes), dtype=object)
+            for i, node in enumerate(self._nodes):
+                self._tables['nodes'][i] = node
+        return self._tables['nodes']
+
+    def join_many(self, pairs, indices=False, chunksize=None, memory=2**24):
+        """
+        Compute the join of each of many pairs of nodes at once.
+
+        Lattices with up to a few thousand nodes look the joins up in a table
+        computed on first use, which their sublattice views share; larger
+        lattices and other views intersect packed up-sets. Either way the pairs
+        are processed in chunks sized so that their temporaries fit in
+        `memory`, beyond the table or packed bitsets themselves. Lattices with
+        the 'csr' backend, such as out-of-core ones, never pack every bitset,
+        only those of the nodes in each chunk.
+
+        Parameters
+        ----------
+        pairs : iterable
+            Pairs of nodes. If `indices`, an array of shape (k, 2) of the
+            positions of the nodes in the underlying lattice's topological
+            order; that is, in `list(lattice)` for a lattice which is not a view.
+        indices : bool
+            Whether `pairs` holds indices rather than nodes. Defaults to False.
+        chunksize : int, None
+            The number of pairs to process at once. If None, as many as fit in
+            `memory`.
+        memory : int
+            The number of bytes the temporaries of each chunk may take, when
+            `chunksize` is None. Defaults to 16 MiB.
+
+        Returns
+        -------
+        joins : np.ndarray
+            The join of each pair; an array of nodes, or of indices if
+            `indices`.
+
+        Raises
+        ------
+        ValueError
+            Raised if a pair has no join within a view.
+        """
+        return self._many('join', pairs, indices, chunksize, memory)
+
+    def meet_many(self, pairs, indices=False, chunksize=None, memory=2**24):
+        """
+        Compute the meet of each of many pairs of nodes at once.
+
+        Parameters
+        ----------
+        pairs : iterable
+            Pairs of nodes, or an array of shape (k, 2) of their indices; see
+            `join_many`.
+        indices : bool
+            Whether `pairs` holds indices rather than nodes. Defaults to False.
+        chunksize : int, None
+            The number of pairs to process at once; see `join_many`.
+        memory : int
+            The number of bytes the temporaries of each chunk may take, when
+            `chunksize` is None. Defaults to 16 MiB.
+
+        Returns
+        -------
+        meets : np.ndarray
+            The meet of each pair; an array of nodes, or of indices if
+            `indices`.
+
+        Raises
+        ------
+        ValueError
+            Raised if a pair has no meet within a view.
+        """
+        return self._many('meet', pairs, indices, chunksize, memory)
+
+    def complement(self, node):
+        """
+        Find the complement(s) of `node`.
+
+        Parameters
+        ----------
+        node : {{elements}}
+            The node to find the complement(s) of.
+
+        Returns
+        -------
+        complement : {{{elements}}}
+            The complement(s) of `node`.
+        """
+        return {n for n in self._lattice if (self.join(n, node) == self.top) and
+                                            (self.meet(n, node) == self.bottom)}
+
+    def join_irreducibles(self):
+        """
+        The join-irreducible elements of the lattice.
+
+        Returns
+        -------
+        jis : {{{elements}}}
+            The list of join-irreducible elements of the lattice.
+        """
+        return {self._nodes[i] for i in _bits(self._mask) if len(self._lowers(i)) == 1}
+
+    def meet_irreducibles(self):
+        """
+        The meet-irreducible elements of the lattice.
+
+        Returns
+        -------
+        mis : {{{elements}}}
+            The list of meet-irreducible elements of the lattice.
+        """
+        return {self._nodes[i] for i in _bits(self._mask) if len(self._uppers(i)) == 1}
+
+    def irreducibles(self):
+        """
+        The irreducible elements of the lattice.
+
+        Returns
+        -------
+        irrs : {{{elements}}}
+
+        """
+        return self.join_irreducibles() & self.meet_irreducibles()
+
+    def _dependencies(self):
+        """
+        Compute the dependency relation among join-irreducible elements which
+        governs the congruences of the lattice.
+
+        For join-irreducibles j and k, with lower covers j_* and k_*, collapsing
+        k onto k_* forces j onto j_* exactly when j is reachable from k along
+        the relation: j ≤ k ∨ m and j ≰ m for some meet-irreducible m ≥ k_*.
+
+        Returns
+        -------
+        jis : [int]
+            The indices of the join-irreducibles, whose positions in this list
+            are used in the bitsets below.
+        reach : [int]
+            For each join-irreducible, a bitset over join-irreducibles of those
+            it forces, including itself.
+        needs : [(int, int, int)]
+            For each cover, the indices of its endpoints and a bitset over join-irreducibles
+            of those which must collapse for the cover to collapse; that is,
+            those below its top but not its bottom.
+        """
+        jis = [i for i in _bits(self._mask) if len(self._lowers(i)) == 1]
+        mis = [i for i in _bits(self._mask) if len(self._uppers(i)) == 1]
+        position = {i: p for p, i in enumerate(jis)}
+        ji_mask = sum(1 << i for i in jis)
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(range(len(jis)))
+        for k in jis:
+            lower = self._lowers(k)[0]
+            forced = 0
+            for m in mis:
+                if self._up[lower] >> m & 1:
+                    join = (self._up[k] & self._up[m] & self._mask).bit_length() - 1
+                    forced |= ji_mask & self._down[join] & ~self._down[m]
+            graph.add_edges_from((position[k], position[j]) for j in _bits(forced) if j != k)
+
+        reach = [0] * len(jis)
+        for p in range(len(jis)):
+            for q in nx.descendants(graph, p) | {p}:
+                reach[p] |= 1 << q
+
+        needs = []
+        for upper in _bits(self._mask):
+            for lower in self._lowers(upper):
+                news = self._down[upper] & ~self._down[lower] & ji_mask
+                needs.append((upper, lower, sum(1 << position[j] for j in _bits(news))))
+
+        return jis, reach, needs
+
+    def _congruence_blocks(self, needs, collapsed):
+        """
+        Construct the partition of the congruence collapsing `collapsed`.
+
+        A cover collapses exactly when every join-irreducible below its top but
+        not its bottom is collapsed, and the blocks are connected by collapsed
+        covers.
+
+        Parameters
+        ----------
+        needs : [(int, int, int)]
+            The covers and their join-irreducibles, as from `_dependencies`.
+        collapsed : int
+            A bitset over join-irreducibles of those collapsed.
+
+        Returns
+        -------
+        partition : frozenset
+            The blocks of the congruence.
+        """
+        parent = {i: i for i in _bits(self._mask)}
+
+        def find(i):
+            """
+            Find the representative of the block of `i`, halving paths.
+            """
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for upper, lower, need in needs:
+            if need & ~collapsed == 0:
+                parent[find(upper)] = find(lower)
+
+        blocks = {}
+        for i in parent:
+            blocks.setdefault(find(i), []).append(self._nodes[i])
+        return frozenset(frozenset(block) for block in blocks.values())
+
+    def principal_congruence(self, a, b):
+        """
+        Construct the smallest congruence in which `a` and `b` are equivalent.
+
+        Parameters
+        ----------
+        a : {elements}
+            A node.
+        b : {elements}
+            Another node.
+
+        Returns
+        -------
+        congruence : frozenset
+            The blocks of the congruence.
+        """
+        jis, reach, needs = self._dependencies()
+        join = self._index[self.join(a, b)]
+        meet = self._index[self.meet(a, b)]
+        collapsed = 0
+        for p, j in enumerate(jis):
+            if self._down[join] >> j & 1 and not self._down[meet] >> j & 1:
+                collapsed |= reach[p]
+        return self._congruence_blocks(needs, collapsed)
+
+    def congruences(self):
+        """
+        Construct the congruence lattice of the lattice.
+
+        Congruences are determined by the join-irreducibles they collapse, and
+        those sets are exactly the sets closed under the dependency relation,
+        so the congruence lattice is built from them without examining any
+        partitions of the nodes directly.
+
+        Returns
+        -------
+        congruences : Lattice
+            The lattice of congruences, each a partition of the nodes, ordered
+            by refinement.
+        """
+        _, reach, needs = self._dependencies()
+
+        # A closed set covers another when they differ by a single strongly
+        # connected component of the dependency relation.
+        hasse = nx.DiGraph()
+        blocks = {0: self._congruence_blocks(needs, 0)}
+        hasse.add_node(blocks[0])
+        frontier = [0]
+        while frontier:
+            found = []
+            for collapsed in frontier:
+                for p in range(len(reach)):
+                    if collapsed >> p & 1:
+                        continue
+                    new = reach[p] & ~collapsed
+                    if any(not reach[q] >> p & 1 for q in _bits(new)):
+                        continue
+                    upper = collapsed | new
+                    if upper not in blocks:
+                        blocks[upper] = self._congruence_blocks(needs, upper)
+                        found.append(upper)
+                    hasse.add_edge(blocks[upper], blocks[collapsed])
+            frontier = found
+
+        return Lattice._from_hasse(hasse, refinement_le(), symbols='|')
+
+    def quotient(self, congruence):
+        """
+        Construct the quotient of the lattice by `congruence`.
+
+        The blocks of a congruence are intervals, and they are ordered as their
+        bottoms are, so the quotient is read off the order among the bottoms.
+
+        Parameters
+        ----------
+        congruence : {{elements}}
+            The blocks of a congruence of the lattice, such as returned by
+            `principal_congruence` or found in `congruences`.
+
+        Returns
+        -------
+        quotient : Lattice
+            The lattice of blocks of `congruence`.
+        """
+        bottoms = {}
+        for block in congruence:
+            bottoms[max(self._index[node] for node in block)] = frozenset(block)
+        mask = sum(1 << i for i in bottoms)
+
+        hasse = nx.DiGraph()
+        hasse.add_nodes_from(bottoms[i] for i in _bits(mask))
+        hasse.add_edges_from((bottoms[i], bottoms[j]) for i, j in self._cover_pairs(mask))
+
+        index = {block: i for i, block in bottoms.items()}
+
+        def block_le(a, b):
+            """
+            a <= b --> the bottom of a is below the bottom of b.
+            """
+            return bool(self._down[index[b]] >> index[a] & 1)
+
+        return Lattice._from_hasse(hasse, block_le, ts=[bottoms[i] for i in _bits(mask)])
+
+    def chains(self):
+        """
+        Yield all the maximal chains of the lattice.
+
+        Yields
+        ------
+        chain : list
+            A maximal chain from bottom to top.
+        """
+        count(self, 'traversal')
+        yield from nx.all_simple_paths(self._lattice.reverse(), self.bottom, self.top)
+
+    async def ajoin(self, *nodes, predicate=None, executor=None):
+        """
+        Await the join of `nodes`, computed in `executor`; see `join`.
+
+        Parameters
+        ----------
+        nodes : {{elements}}
+            The nodes to compute the join of.
+        predicate : func
+            A function for which the found join must satisfy.
+        executor : concurrent.futures.Executor, None
+            The executor in which to compute the join. If None, the event
+            loop's default.
+
+        Returns
+        -------
+        join : {{elements}}
+            The join of `nodes`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(self.join, *nodes, predicate=predicate))
+
+    async def ameet(self, *nodes, predicate=None, executor=None):
+        """
+        Await the meet of `nodes`, computed in `executor`; see `meet`.
+
+        Parameters
+        ----------
+        nodes : {{elements}}
+            The nodes to compute the meet of.
+        predicate : func
+            A function for which the found meet must satisfy.
+        executor : concurrent.futures.Executor, None
+            The executor in which to compute the meet. If None, the event
+            loop's default.
+
+        Returns
+        -------
+        meet : {{elements}}
+            The meet of `nodes`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(self.meet, *nodes, predicate=predicate))
+
+    async def achains(self, executor=None, chunksize=64):
+        """
+        Asynchronously yield the maximal chains of the lattice; see `chains`.
+
+        The chains are found in chunks by `executor`, and the event loop is free
+        between chunks. Closing the generator stops the search after the chunk
+        in progress.
+
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor, None
+            The executor in which to find the chains. If None, the event loop's
+            default.
+        chunksize : int
+            The number of chains to find in each call to `executor`.
+
+        Yields
+        ------
+        chain : list
+            A maximal chain from bottom to top.
+        """
+        loop = asyncio.get_running_loop()
+        chains = self.chains()
+        while True:
+            chunk = await loop.run_in_executor(executor, list, islice(chains, chunksize))
+            if not chunk:
+                return
+            for chain in chunk:
+                yield chain
+
+    def hasse_layout(self, sweeps=4):
+        """
+        Lay out the Hasse diagram in layers by height, ordering each layer to
+        reduce crossings; see `lattices.export.hasse_layout`.
+
+        Parameters
+        ----------
+        sweeps : int
+            The number of downward and upward sweeps of crossing reduction.
+
+        Returns
+        -------
+        layout : dict
+            The position (x, y) of each node.
+        """
+        return hasse_layout(self, sweeps=sweeps)
+
+    def to_dot(self, f, layout=None):
+        """
+        Write the Hasse diagram to a file in the DOT language; see
+        `lattices.export.to_dot`.
+
+        Parameters
+        ----------
+        f : file
+            A text file handle to write to.
+        layout : dict, None
+            The position of each node, as from `hasse_layout`.
+        """
+        to_dot(self, f, layout=layout)
+
+    def to_graphml(self, f):
+        """
+        Write the Hasse diagram to a file as GraphML; see
+        `lattices.export.to_graphml`.
+
+        Parameters
+        ----------
+        f : file
+            A text file handle to write to.
+        """
+        to_graphml(self, f)
+
+    def to_json_lines(self, f):
+        """
+        Write the nodes and the cover relation to a file as JSON lines; see
+        `lattices.export.to_json_lines`.
+
+        Parameters
+        ----------
+        f : file
+            A text file handle to write to.
+        """
+        to_json_lines(self, f)
+
+    def to_edgelist(self, f, delimiter='\t', labels=True):
+        """
+        Write the cover relation to a file as an edge list; see
+        `lattices.export.to_edgelist`.
+
+        Parameters
+        ----------
+        f : file
+            A text file handle to write to.
+        delimiter : str
+            The separator of the two nodes on each line.
+        labels : bool
+            Whether to write the labels of the nodes, or their numbers.
+        """
+        to_edgelist(self, f, delimiter=delimiter, labels=labels)
+
+    def _pretty_lattice(self):  # pragma: no cover
+        """
+        Construct a version of the lattice with nicer looking node labels.
+
+        Returns
+        -------
+        pretty_lattice : nx.DiGraph
+            A topologically-equivalent, but more nicely labeled, lattice.
+        """
+        labels = self.labels
+        edges = [(labels[a], labels[b]) for a, b in self._lattice.edges()]
+        return nx.from_edgelist(edges, nx.DiGraph)
+
+    def draw(self):  # pragma: no cover
+        """
+        Draw a pretty version of the lattice.
+        """
+        from nxpd import draw
+
+        draw(self._pretty_lattice())
+
+    def _repr_png_(self):  # pragma: no cover
+        """
         Use an image as repr if in IPython.
 
         Returns
@@ -423,3 +2067,180 @@ class Lattice(object):
         from nxpd import draw
 
         return draw(self._pretty_lattice(), show='ipynb').data
+
+
+class LatticeView(Lattice):
+    """
+    A lattice restricted to some of the nodes of another.
+
+    The view shares the index, reachability bitsets and relationship of the
+    lattice it was taken from, and records its own nodes as a bitmask over that
+    index. Views of views share the same index. The packed bitsets, node arrays
+    and labels are taken from the underlying lattice and masked to the view,
+    as are its join and meet tables when the view is a sublattice. Modifying the
+    underlying lattice with `add_node` or `remove_node` invalidates its views.
+    """
+
+    def __init__(self, lattice, mask, convex=False, closed=False):
+        """
+        Construct a view of `lattice` restricted to the nodes in `mask`.
+
+        Parameters
+        ----------
+        lattice : Lattice
+            The lattice to view.
+        mask : int
+            A bitset over the index of `lattice` of the nodes in the view.
+        convex : bool
+            Whether the nodes in `mask` are convex in the underlying lattice,
+            in which case the covers of the view are those of the underlying
+            lattice among the nodes in `mask`.
+        closed : bool
+            Whether the nodes in `mask` are closed under the join and meet of
+            the underlying lattice, in which case the view shares its join and
+            meet tables.
+        """
+        self._base = getattr(lattice, '_base', lattice)
+        self._backend = self._base._backend
+        self._relationship = lattice._relationship
+        self._stringify = lattice._stringify
+        self._nodes = lattice._nodes
+        self._index = lattice._index
+        self._up = lattice._up
+        self._down = lattice._down
+        self._mask = mask
+        self._convex = convex
+        self._closed = closed
+        self._hasse = None
+        self._canonical = None
+        self._tables = {}
+        self._symmetries = []
+
+        self._ts = [self._nodes[i] for i in _bits(mask)]
+
+        self.top = self._ts[0]
+        self.bottom = self._ts[-1]
+
+    @property
+    def _lattice(self):
+        """
+        The cover relation of the view, constructed when first needed.
+
+        Returns
+        -------
+        hasse : nx.DiGraph
+            The cover relation among the nodes of the view.
+        """
+        if self._hasse is None:
+            if self._convex:
+                self._hasse = self._base._lattice.subgraph(self._ts)
+            else:
+                self._hasse = nx.DiGraph()
+                self._hasse.add_nodes_from(self._ts)
+                self._hasse.add_edges_from((self._nodes[i], self._nodes[j]) for i, j in self._cover_pairs(self._mask))
+        return self._hasse
+
+    @property
+    def labels(self):
+        """
+        The string label of each node of the view, taken from the underlying
+        lattice's labels.
+
+        Returns
+        -------
+        labels : dict
+            The label of each node, in topological order from the top.
+        """
+        if 'labels' not in self._tables:
+            labels = self._base.labels
+            self._tables['labels'] = {node: labels[node] for node in self}
+        return self._tables['labels']
+
+    def _bitset_matrix(self, direction):
+        """
+        Share the packed up-sets or down-sets of the underlying lattice, which
+        are masked to the view as they are read.
+
+        Parameters
+        ----------
+        direction : 'up', 'down'
+            Which bitsets to pack.
+
+        Returns
+        -------
+        matrix : np.ndarray
+            The underlying lattice's packed bitsets.
+        """
+        return self._base._bitset_matrix(direction)
+
+    def _operation_table(self, operation):
+        """
+        Share the join or meet table of the underlying lattice; only used when
+        the view is a sublattice.
+
+        Parameters
+        ----------
+        operation : 'join', 'meet'
+            The operation to tabulate.
+
+        Returns
+        -------
+        table : np.ndarray
+            The underlying lattice's table.
+        """
+        return self._base._operation_table(operation)
+
+    def _node_array(self):
+        """
+        Share the node array of the underlying lattice.
+
+        Returns
+        -------
+        nodes : np.ndarray
+            An object array of the node at each index.
+        """
+        return self._base._node_array()
+
+    def _lowers(self, i):
+        if self._convex:
+            return [j for j in self._base._lowers(i) if self._mask >> j & 1]
+        return [self._index[node] for node in self._lattice[self._nodes[i]]]
+
+    def _uppers(self, i):
+        if self._convex:
+            return [j for j in self._base._uppers(i) if self._mask >> j & 1]
+        return [self._index[node] for node in self._lattice.pred[self._nodes[i]]]
+
+    def add_node(self, node):
+        """
+        Views cannot be modified.
+
+        Parameters
+        ----------
+        node : {elements}
+            The node to add.
+
+        Raises
+        ------
+        TypeError
+            Always.
+        """
+        msg = "Lattice views cannot be modified."
+        raise TypeError(msg)
+
+    def remove_node(self, node):
+        """
+        Views cannot be modified.
+
+        Parameters
+        ----------
+        node : {elements}
+            The node to remove.
+
+        Raises
+        ------
+        TypeError
+            Always.
+        """
+        msg = "Lattice views cannot be modified."
+        raise TypeError(msg)
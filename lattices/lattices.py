@@ -2,11 +2,14 @@
 Several specific types of lattices.
 """
 
+from functools import partial
 from operator import le
 
 from .constraints import is_antichain, is_connected, is_cover, is_partition
 from .lattice import Lattice
 from .orderings import antichain_le, refinement_le
+from .presentations import finitely_presented_lattice
+from .progress import _Monitor
 from .utils import powerset
 
 
@@ -23,7 +26,103 @@ __all__ = [
 ]
 
 
-def powerset_lattice(elements):
+def _relabel(thing, mapping):
+    """
+    Replace the elements within a set (of sets [of sets {...}]).
+
+    Parameters
+    ----------
+    thing : (frozen)set, element
+        The set (of sets [of sets {...}]) to relabel.
+    mapping : dict
+        The new label of each element.
+
+    Returns
+    -------
+    relabeled : (frozen)set, element
+        `thing`, with its elements replaced according to `mapping`.
+    """
+    if isinstance(thing, frozenset):
+        return frozenset(_relabel(t, mapping) for t in thing)
+    return mapping.get(thing, thing)
+
+
+def _symmetric_group(elements):
+    """
+    Construct the action of the symmetric group of `elements` on sets (of sets
+    [of sets {...}]) of them, by a transposition and a cycle which generate it.
+
+    Parameters
+    ----------
+    elements : collection
+        The elements to permute.
+
+    Returns
+    -------
+    generators : [func]
+        Functions relabeling a node by each generator.
+    """
+    elements = list(elements)
+    mappings = []
+    if len(elements) > 1:
+        mappings.append({elements[0]: elements[1], elements[1]: elements[0]})
+    if len(elements) > 2:
+        mappings.append(dict(zip(elements, elements[1:] + elements[:1])))
+    return [partial(_relabel, mapping=mapping) for mapping in mappings]
+
+
+def _nonempty_subsets(n):
+    """
+    Count the nonempty subsets of `n` things.
+
+    Parameters
+    ----------
+    n : int
+        The number of things.
+
+    Returns
+    -------
+    count : int
+        The number of nonempty subsets.
+    """
+    return 2**n - 1
+
+
+def _dependencies(elements, cover, connected, monitor):
+    """
+    Find the antichains of nonempty subsets of `elements`, reporting progress
+    through `monitor`.
+
+    Parameters
+    ----------
+    elements : list
+        The elements.
+    cover : bool
+        Whether the antichains should be covers.
+    connected : bool
+        Whether the antichains should represent a connected component.
+    monitor : _Monitor
+        The monitor of the construction.
+
+    Returns
+    -------
+    dependencies : list
+        The antichains.
+    """
+    def keep(dep):
+        """
+        Whether `dep` is a dependency.
+        """
+        if not is_antichain(dep):
+            return False
+        if cover and not is_cover(dep, elements):
+            return False
+        return not connected or is_connected(dep)
+
+    return monitor.select(powerset(powerset(elements, 1)), 2**_nonempty_subsets(len(elements)), keep)
+
+
+def powerset_lattice(elements, progress=None, token=None):
     """
     Construct the powerset lattice, representing all subsets of `elements`
     ordered by inclusion.
@@ -32,16 +131,28 @@ def powerset_lattice(elements):
     ----------
     elements : collection
         The elements to use to construct the lattice.
+    progress : func, None
+        Called as `progress(phase, done, total)` as the construction proceeds;
+        see `lattices.progress`.
+    token : CancellationToken, None
+        A token through which to cancel the construction.
 
     Returns
     -------
     lattice : Lattice
         The corresponding lattice.
+
+    Raises
+    ------
+    Cancelled
+        Raised if `token` cancels the construction.
     """
-    return Lattice(powerset(elements), le)
+    elements = list(elements)
+    subsets = _Monitor(progress, token).select(powerset(elements), 2**len(elements))
+    return Lattice(subsets, le, symmetries=_symmetric_group(elements), progress=progress, token=token)
 
 
-def partition_lattice(elements):
+def partition_lattice(elements, progress=None, token=None):
     """
     Construct the partition lattice, representing all partitions of `elements`
     ordered by refinement.
@@ -50,17 +161,33 @@ def partition_lattice(elements):
     ----------
     elements : collection
         The elements to use to construct the lattice.
+    progress : func, None
+        Called as `progress(phase, done, total)` as the construction proceeds;
+        see `lattices.progress`.
+    token : CancellationToken, None
+        A token through which to cancel the construction.
 
     Returns
     -------
     lattice : Lattice
         The corresponding lattice.
+
+    Raises
+    ------
+    Cancelled
+        Raised if `token` cancels the construction.
     """
-    partitions = [part for part in powerset(powerset(elements, 1), 1) if is_partition(part, elements)]
-    return Lattice(partitions, refinement_le(), symbols='|')
+    elements = list(elements)
+    monitor = _Monitor(progress, token)
+    partitions = monitor.select(powerset(powerset(elements, 1), 1), _nonempty_subsets(_nonempty_subsets(len(elements))),
+                                lambda part: is_partition(part, elements))
+    order = refinement_le(interned=True)
+    partitions = [order.table.node(part) for part in partitions]
+    return Lattice(partitions, order, symbols='|', symmetries=_symmetric_group(elements), progress=progress,
+                   token=token)
 
 
-def free_distributive_lattice(elements):
+def free_distributive_lattice(elements, progress=None, token=None):
     """
     Construct the free distributive lattice over `elements`, that is the lattice
     of antichains of the powerset of `elements`, ordered by containment.
@@ -69,17 +196,32 @@ def free_distributive_lattice(elements):
     ----------
     elements : collection
         The elements to use to construct the lattice.
+    progress : func, None
+        Called as `progress(phase, done, total)` as the construction proceeds;
+        see `lattices.progress`.
+    token : CancellationToken, None
+        A token through which to cancel the construction.
 
     Returns
     -------
     lattice : Lattice
         The corresponding lattice.
+
+    Raises
+    ------
+    Cancelled
+        Raised if `token` cancels the construction.
     """
-    antichains = [ac for ac in powerset(powerset(elements, 1), 1) if is_antichain(ac)]
-    return Lattice(antichains, antichain_le())
+    elements = list(elements)
+    monitor = _Monitor(progress, token)
+    antichains = monitor.select(powerset(powerset(elements, 1), 1), _nonempty_subsets(_nonempty_subsets(len(elements))),
+                                is_antichain)
+    order = antichain_le(interned=True)
+    antichains = [order.table.node(antichain) for antichain in antichains]
+    return Lattice(antichains, order, symmetries=_symmetric_group(elements), progress=progress, token=token)
 
 
-def dependency_lattice(elements, cover=True, connected=False):
+def dependency_lattice(elements, cover=True, connected=False, progress=None, token=None):
     """
     Construct the lattice of antichains of the powerset of `elements`, ordered
     by refinement.
@@ -93,21 +235,31 @@ def dependency_lattice(elements, cover=True, connected=False):
     connected : bool
         Whether the antichains should represent a connected component. Defaults
         to False.
+    progress : func, None
+        Called as `progress(phase, done, total)` as the construction proceeds;
+        see `lattices.progress`.
+    token : CancellationToken, None
+        A token through which to cancel the construction.
 
     Returns
     -------
     lattice : Lattice
         The corresponding lattice.
+
+    Raises
+    ------
+    Cancelled
+        Raised if `token` cancels the construction.
     """
-    dependencies = [dep for dep in powerset(powerset(elements, 1)) if is_antichain(dep)]
-    if cover:
-        dependencies = [dep for dep in dependencies if is_cover(dep, elements)]
-    if connected:
-        dependencies = [dep for dep in dependencies if is_connected(dep)]
-    return Lattice(dependencies, refinement_le(), '•꞉⋮')
+    elements = list(elements)
+    monitor = _Monitor(progress, token)
+    dependencies = _dependencies(elements, cover, connected, monitor)
+    order = refinement_le(interned=True)
+    dependencies = [order.table.node(dep) for dep in dependencies]
+    return Lattice(dependencies, order, '•꞉⋮', symmetries=_symmetric_group(elements), progress=progress, token=token)
 
 
-def dependency_antichain_lattice(elements, cover=True, connected=False):
+def dependency_antichain_lattice(elements, cover=True, connected=False, progress=None, token=None):
     """
     Construct the lattice of antichains of dependencies of the powerset of
     `elements`, ordered by containment.
@@ -121,22 +273,35 @@ def dependency_antichain_lattice(elements, cover=True, connected=False):
     connected : bool
         Whether the dependencies should represent a connected component. Defaults
         to False.
+    progress : func, None
+        Called as `progress(phase, done, total)` as the construction proceeds;
+        see `lattices.progress`.
+    token : CancellationToken, None
+        A token through which to cancel the construction.
 
     Returns
     -------
     lattice : Lattice
         The corresponding lattice.
-    """
-    dependencies = [dep for dep in powerset(powerset(elements, 1)) if is_antichain(dep)]
-    if cover:
-        dependencies = [dep for dep in dependencies if is_cover(dep, elements)]
-    if connected:
-        dependencies = [dep for dep in dependencies if is_connected(dep)]
-    dependency_acs = [dep_ac for dep_ac in powerset(dependencies, 1) if is_antichain(dep_ac, refinement_le())]
-    return Lattice(dependency_acs, antichain_le(refinement_le()))
-
 
-def partition_antichain_lattice(elements):
+    Raises
+    ------
+    Cancelled
+        Raised if `token` cancels the construction.
+    """
+    elements = list(elements)
+    monitor = _Monitor(progress, token)
+    dependencies = _dependencies(elements, cover, connected, monitor)
+    order = refinement_le(interned=True)
+    dependencies = [order.table.node(dep) for dep in dependencies]
+    dependency_acs = monitor.select(powerset(dependencies, 1), _nonempty_subsets(len(dependencies)),
+                                    lambda dep_ac: is_antichain(dep_ac, order))
+    ac_order = antichain_le(order, interned=True)
+    dependency_acs = [ac_order.table.node(dep_ac) for dep_ac in dependency_acs]
+    return Lattice(dependency_acs, ac_order, symmetries=_symmetric_group(elements), progress=progress, token=token)
+
+
+def partition_antichain_lattice(elements, progress=None, token=None):
     """
     Construct the lattice of antichains of partitions of the powerset of
     `elements`, ordered by refinement.
@@ -145,21 +310,62 @@ def partition_antichain_lattice(elements):
     ----------
     elements : collection
         The elements to use to construct the lattice.
+    progress : func, None
+        Called as `progress(phase, done, total)` as the construction proceeds;
+        see `lattices.progress`.
+    token : CancellationToken, None
+        A token through which to cancel the construction.
 
     Returns
     -------
     lattice : Lattice
         The corresponding lattice.
+
+    Raises
+    ------
+    Cancelled
+        Raised if `token` cancels the construction.
     """
-    partitions = [part for part in powerset(powerset(elements, 1), 1) if is_partition(part, elements)]
-    partitions_acs = [part_ac for part_ac in powerset(partitions, 1) if is_antichain(part_ac, refinement_le())]
-    return Lattice(partitions_acs, antichain_le(refinement_le()))
+    elements = list(elements)
+    monitor = _Monitor(progress, token)
+    partitions = monitor.select(powerset(powerset(elements, 1), 1), _nonempty_subsets(_nonempty_subsets(len(elements))),
+                                lambda part: is_partition(part, elements))
+    order = refinement_le(interned=True)
+    partitions = [order.table.node(part) for part in partitions]
+    partitions_acs = monitor.select(powerset(partitions, 1), _nonempty_subsets(len(partitions)),
+                                    lambda part_ac: is_antichain(part_ac, order))
+    ac_order = antichain_le(order, interned=True)
+    partitions_acs = [ac_order.table.node(part_ac) for part_ac in partitions_acs]
+    return Lattice(partitions_acs, ac_order, symmetries=_symmetric_group(elements), progress=progress, token=token)
+
+
+def free_modular_lattice(elements, budget=100000):
+    """
+    Construct the free modular lattice over `elements`.
 
+    Parameters
+    ----------
+    elements : collection
+        The generators of the lattice; at most three, since the free modular
+        lattice on four or more generators is infinite.
+    budget : int, None
+        The largest number of elements to construct. None for no limit.
 
-def free_modular_lattice(elements):
-    """
+    Returns
+    -------
+    lattice : Lattice
+        The corresponding lattice, whose nodes are `Term`s.
+
+    Raises
+    ------
+    ValueError
+        Raised if there are no elements or more than three.
     """
-    raise NotImplementedError
+    elements = list(elements)
+    if len(elements) > 3:
+        msg = "The free modular lattice on more than three generators is infinite."
+        raise ValueError(msg)
+    return finitely_presented_lattice(elements, budget=budget)
 
 
 ################################################################################
@@ -4,6 +4,8 @@ A collection of potential orderings among nodes.
 
 from operator import le
 
+from .interning import InternTable
+
 
 __all__ = [
     'antichain_le',
@@ -11,7 +13,7 @@ __all__ = [
 ]
 
 
-def antichain_le(le=le):
+def antichain_le(le=le, interned=False):
     """
     Construct an order based on antichain containment.
 
@@ -20,12 +22,30 @@ def antichain_le(le=le):
     le : func
         A function representing the "less than or equal" operator.
         Defaults to <=.
+    interned : bool
+        Whether to compare nodes through an `InternTable`, kept as the `table`
+        attribute of the order, so each pair of distinct members is compared
+        with `le` once and each comparison of nodes is a test on bitsets. Nodes
+        built with `table.node` have their members looked up by identity;
+        others must have hashable members. Defaults to False.
 
     Returns
     -------
     ac_le : func
         Function implementing antichain ordering with the specified `le`.
     """
+    if interned:
+        table = InternTable(le)
+
+        def ac_le(alpha, beta):
+            """
+            a <= b --> every member of beta is above some member of alpha.
+            """
+            return not table.encode(beta) & ~table.upset(alpha)
+
+        ac_le.table = table
+        return ac_le
+
     def ac_le(alpha, beta):
         """
         a <= b --> for all b in beta, there exists an a in alpha such that a <= b.
@@ -38,7 +58,7 @@ def antichain_le(le=le):
     return ac_le
 
 
-def refinement_le(le=le):
+def refinement_le(le=le, interned=False):
     """
     Construct an order based on refinement.
 
@@ -47,12 +67,30 @@ def refinement_le(le=le):
     le : func
         A function representing the "less than or equal" operator.
         Defaults to <=.
+    interned : bool
+        Whether to compare nodes through an `InternTable`, kept as the `table`
+        attribute of the order, so each pair of distinct members is compared
+        with `le` once and each comparison of nodes is a test on bitsets. Nodes
+        built with `table.node` have their members looked up by identity;
+        others must have hashable members. Defaults to False.
 
     Returns
     -------
     r_le : func
         Function implementing refinement ordering with the specified `le`.
     """
+    if interned:
+        table = InternTable(le)
+
+        def r_le(alpha, beta):
+            """
+            a <= b --> every member of alpha is below some member of beta.
+            """
+            return not table.encode(alpha) & ~table.downset(beta)
+
+        r_le.table = table
+        return r_le
+
     def r_le(alpha, beta):
         """
         a <= b --> for all a in alpha, there exists a b in beta such that a <= b.
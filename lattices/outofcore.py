@@ -0,0 +1,295 @@
+"""
+Construction of lattices too large for their order relation to fit in memory.
+
+The comparability relation is written block by block to a memory-mapped bit
+matrix, which is then permuted into a topological order, and the cover relation
+is found greedily from it row by row and written to memory-mapped compressed
+sparse rows. Only the nodes themselves and a few arrays linear in their number
+are held in memory, besides blocks of rows whose size is bounded by `memory`.
+The resulting lattice uses the 'csr' backend over the memory-mapped rows.
+"""
+
+import os
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from .backends import CSRBackend
+from .lattice import Lattice, stringify
+from .progress import _Monitor
+
+
+__all__ = [
+    'out_of_core_lattice',
+]
+
+
+def _memmap(directory, name, shape, dtype, mode='w+'):
+    """
+    Open a memory-mapped array in `directory`.
+
+    Parameters
+    ----------
+    directory : str
+        The directory holding the file.
+    name : str
+        The name of the file.
+    shape : tuple
+        The shape of the array.
+    dtype : np.dtype
+        The type of its entries.
+    mode : str
+        The mode in which to open the file.
+
+    Returns
+    -------
+    array : np.memmap
+        The array. Empty arrays are held in memory, since they cannot be
+        mapped.
+    """
+    if not np.prod(shape):
+        return np.zeros(shape, dtype=dtype)
+    return np.memmap(os.path.join(directory, name), dtype=dtype, mode=mode, shape=shape)
+
+
+def _compare(nodes, relationship, directory, rows, monitor):
+    """
+    Write the down-set of each node as a row of a bit matrix.
+
+    Parameters
+    ----------
+    nodes : list
+        The nodes.
+    relationship : func
+        A function implementing the ordering among `nodes`.
+    directory : str
+        The directory in which to write the matrix.
+    rows : int
+        The number of rows to compute at once.
+    monitor : _Monitor
+        The monitor of the construction.
+
+    Returns
+    -------
+    downs : np.memmap
+        The bit matrix whose row `i` has bit `j` set when `nodes[j]` lies below
+        `nodes[i]`, in little-endian bytes.
+    counts : np.ndarray
+        The number of nodes below each node.
+    """
+    n = len(nodes)
+    downs = _memmap(directory, 'comparisons.bin', (n, (n + 7) // 8), np.uint8)
+    counts = np.zeros(n, dtype=np.intp)
+    for start in range(0, n, rows):
+        stop = min(start + rows, n)
+        block = np.zeros((stop - start, n), dtype=bool)
+        for i in range(start, stop):
+            b = nodes[i]
+            block[i - start] = [relationship(a, b) for a in nodes]
+            block[i - start, i] = True
+        counts[start:stop] = block.sum(axis=1)
+        downs[start:stop] = np.packbits(block, axis=1, bitorder='little')
+        monitor.update(stop)
+    return downs, counts
+
+
+def _permute(downs, order, directory, rows):
+    """
+    Permute the rows and columns of a bit matrix.
+
+    Parameters
+    ----------
+    downs : np.memmap
+        The bit matrix.
+    order : np.ndarray
+        The original index of each new index.
+    directory : str
+        The directory in which to write the permuted matrix.
+    rows : int
+        The number of rows to permute at once.
+
+    Returns
+    -------
+    permuted : np.memmap
+        The bit matrix with row and column `k` being the original row and
+        column `order[k]`.
+    """
+    n = len(order)
+    permuted = _memmap(directory, 'downs.bin', downs.shape, np.uint8)
+    for start in range(0, n, rows):
+        stop = min(start + rows, n)
+        block = np.unpackbits(downs[order[start:stop]], axis=1, count=n, bitorder='little').view(bool)
+        permuted[start:stop] = np.packbits(block[:, order], axis=1, bitorder='little')
+    return permuted
+
+
+def _reduce(downs, directory, monitor):
+    """
+    Find the cover relation from the down-sets of nodes in topological order.
+
+    Parameters
+    ----------
+    downs : np.memmap
+        The bit matrix of down-sets, in topological order from the top.
+    directory : str
+        The directory in which to write the covers.
+    monitor : _Monitor
+        The monitor of the construction.
+
+    Returns
+    -------
+    indptr : np.memmap
+        The offsets of the lower covers of each index in `indices`.
+    indices : np.memmap
+        The lower covers of every index, concatenated.
+    """
+    n = len(downs)
+    indptr = _memmap(directory, 'lower_indptr.bin', (n + 1,), np.intp)
+
+    def row(j):
+        """
+        The down-set of index `j`, as an int bitset.
+        """
+        return int.from_bytes(downs[j].tobytes(), 'little')
+
+    path = os.path.join(directory, 'lower_indices.bin')
+    with open(path, 'wb') as f:
+        # The lowest-indexed descendant not yet accounted for is always
+        # maximal, so the covers are found greedily.
+        for k in range(n):
+            down = row(k) & ~(1 << k)
+            lowers = []
+            while down:
+                low = down & -down
+                j = low.bit_length() - 1
+                lowers.append(j)
+                down &= ~row(j)
+            np.array(lowers, dtype=np.intp).tofile(f)
+            indptr[k + 1] = indptr[k] + len(lowers)
+            if not (k + 1) % 1024:
+                monitor.update(k + 1)
+
+    indices = _memmap(directory, 'lower_indices.bin', (int(indptr[-1]),), np.intp, mode='r+')
+    return indptr, indices
+
+
+def _transpose(indptr, indices, directory, rows):
+    """
+    Transpose compressed sparse rows, a block of rows at a time.
+
+    Parameters
+    ----------
+    indptr : np.memmap
+        The offsets of each index's neighbors in `indices`.
+    indices : np.memmap
+        The neighbors of every index, concatenated.
+    directory : str
+        The directory in which to write the transpose.
+    rows : int
+        The number of entries to place at once; each takes a few dozen bytes.
+
+    Returns
+    -------
+    indptr : np.memmap
+        The offsets of each index's neighbors in the transpose.
+    indices : np.memmap
+        The neighbors of every index in the transpose, concatenated.
+    """
+    n = len(indptr) - 1
+    t_indptr = _memmap(directory, 'upper_indptr.bin', (n + 1,), np.intp)
+    t_indices = _memmap(directory, 'upper_indices.bin', indices.shape, np.intp)
+    counts = np.zeros(n, dtype=np.intp)
+    for start in range(0, len(indices), rows):
+        counts += np.bincount(indices[start:start + rows], minlength=n)
+    np.cumsum(counts, out=t_indptr[1:])
+
+    # Each block of sources is placed after those of earlier blocks, so the
+    # neighbors of each index in the transpose are sorted.
+    cursor = np.array(t_indptr[:-1])
+    for start in range(0, len(indices), rows):
+        positions = np.arange(start, min(start + rows, len(indices)))
+        sources = np.searchsorted(indptr, positions, side='right') - 1
+        targets = np.asarray(indices[start:start + rows])
+        order = np.argsort(targets, kind='stable')
+        targets = targets[order]
+        rank = np.arange(len(targets)) - np.searchsorted(targets, targets)
+        t_indices[cursor[targets] + rank] = sources[order]
+        cursor += np.bincount(targets, minlength=n)
+    return t_indptr, t_indices
+
+
+def out_of_core_lattice(nodes, relationship, directory=None, memory=2**28, symbols='•꞉⋮', progress=None,
+                        token=None):
+    """
+    Construct a lattice whose order relation is kept in memory-mapped files.
+
+    Parameters
+    ----------
+    nodes : collection
+        A collection of elements which are ordered by `relationship`.
+    relationship : func
+        A function implementing the ordering among `nodes`.
+    directory : str, None
+        The directory in which to write the files; the compressed sparse rows
+        of the cover relation remain there for the life of the lattice. If
+        None, a temporary directory is used, which is removed along with the
+        lattice.
+    memory : int
+        The number of bytes of blocks of rows to work with at once.
+    symbols : str
+        The symbols to use to separate elements of each node.
+    progress : func, None
+        Called as `progress(phase, done, total)` as the 'comparison', 'sort'
+        and 'reduction' phases proceed; see `lattices.progress`.
+    token : CancellationToken, None
+        A token through which to cancel the construction.
+
+    Returns
+    -------
+    lattice : Lattice
+        The lattice representing `relationship` over `nodes`, with the 'csr'
+        backend.
+
+    Raises
+    ------
+    Cancelled
+        Raised if `token` cancels the construction, with no partial result.
+    """
+    nodes = list(dict.fromkeys(nodes))
+    n = len(nodes)
+    rows = max(1, memory // max(1, n))
+
+    temporary = TemporaryDirectory() if directory is None else None
+    directory = temporary.name if directory is None else directory
+
+    monitor = _Monitor(progress, token)
+    monitor.start('comparison', n, elements=n)
+    comparisons, counts = _compare(nodes, relationship, directory, rows, monitor)
+    monitor.finish()
+
+    # A node lies above more nodes than anything below it does, so sorting by
+    # the number of descendants gives a topological order.
+    monitor.start('sort', n)
+    order = np.argsort(-counts, kind='stable')
+    downs = _permute(comparisons, order, directory, rows)
+    del comparisons
+    os.remove(os.path.join(directory, 'comparisons.bin'))
+    monitor.finish()
+
+    monitor.start('reduction', n)
+    lower = _reduce(downs, directory, monitor)
+    del downs
+    os.remove(os.path.join(directory, 'downs.bin'))
+    upper = _transpose(*lower, directory, max(1, memory // 32))
+    monitor.finish()
+
+    ts = [nodes[i] for i in order]
+    index = {node: i for i, node in enumerate(ts)}
+    backend = CSRBackend.from_rows(ts, index, lower, upper, cache_size=max(1, memory // max(1, (n + 7) // 8)))
+    backend._directory = temporary
+
+    lattice = Lattice.__new__(Lattice)
+    lattice._relationship = relationship
+    lattice._stringify = stringify(symbols=symbols)
+    lattice._set_covers(ts, backend=backend)
+    return lattice
@@ -0,0 +1,284 @@
+"""
+Algebraic operations on partitions, and a partition lattice which is never
+constructed.
+
+Partitions are frozensets of frozensets, as in `partition_lattice`. Their meet
+is the set of nonempty pairwise intersections of blocks, and their join is the
+connected components of the union of their blocks, found by union-find; both
+take time near linear in the number of elements.
+"""
+
+from functools import reduce
+
+from .constraints import is_partition
+
+
+__all__ = [
+    'partition_join',
+    'partition_meet',
+    'PartitionLattice',
+]
+
+
+def partition_join(a, b):
+    """
+    Compute the join of two partitions; the finest partition coarser than both.
+
+    Parameters
+    ----------
+    a : frozenset
+        A partition.
+    b : frozenset
+        A partition of the same elements.
+
+    Returns
+    -------
+    join : frozenset
+        The blocks of the connected components of the union of `a` and `b`.
+    """
+    parent = {}
+
+    def find(x):
+        """
+        Find the representative of the block of `x`.
+        """
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for block in a:
+        first = next(iter(block))
+        for x in block:
+            parent[x] = first
+
+    for block in b:
+        block = iter(block)
+        root = find(next(block))
+        for x in block:
+            other = find(x)
+            if other != root:
+                parent[other] = root
+
+    blocks = {}
+    for x in parent:
+        blocks.setdefault(find(x), []).append(x)
+
+    return frozenset(frozenset(block) for block in blocks.values())
+
+
+def partition_meet(a, b):
+    """
+    Compute the meet of two partitions; the coarsest partition finer than both.
+
+    Parameters
+    ----------
+    a : frozenset
+        A partition.
+    b : frozenset
+        A partition of the same elements.
+
+    Returns
+    -------
+    meet : frozenset
+        The nonempty intersections of a block of `a` with a block of `b`.
+    """
+    index = {x: i for i, block in enumerate(b) for x in block}
+    blocks = []
+    for block in a:
+        parts = {}
+        for x in block:
+            parts.setdefault(index[x], []).append(x)
+        blocks.extend(parts.values())
+
+    return frozenset(frozenset(block) for block in blocks)
+
+
+def _bell(n):
+    """
+    Compute the n-th Bell number by the Bell triangle.
+
+    Parameters
+    ----------
+    n : int
+        The number of elements.
+
+    Returns
+    -------
+    bell : int
+        The number of partitions of `n` elements.
+    """
+    row = [1]
+    for _ in range(n):
+        new = [row[-1]]
+        for value in row:
+            new.append(new[-1] + value)
+        row = new
+    return row[0]
+
+
+class PartitionLattice(object):
+    """
+    The lattice of partitions of some elements ordered by refinement, computing
+    its operations directly on the partitions instead of through a Hasse
+    diagram.
+    """
+
+    def __init__(self, elements):
+        """
+        Parameters
+        ----------
+        elements : collection
+            The elements being partitioned.
+        """
+        self.elements = list(dict.fromkeys(elements))
+        self.top = frozenset([frozenset(self.elements)]) if self.elements else frozenset()
+        self.bottom = frozenset(frozenset([x]) for x in self.elements)
+
+    def __len__(self):
+        """
+        Returns
+        -------
+        size : int
+            The number of partitions; a Bell number.
+        """
+        return _bell(len(self.elements))
+
+    def __contains__(self, node):
+        """
+        Parameters
+        ----------
+        node : frozenset
+            A potential partition.
+
+        Returns
+        -------
+        contains : bool
+            Whether `node` partitions the elements.
+        """
+        return is_partition(node, self.elements) and all(node)
+
+    def __iter__(self):
+        """
+        Iterate over the partitions, as given by restricted growth strings in
+        lexicographic order. A partition's string is never greater than that of
+        any refinement, so this is a topological order from top to bottom.
+
+        Yields
+        ------
+        partition : frozenset
+            Each partition of the elements.
+        """
+        n = len(self.elements)
+        if not n:
+            yield self.top
+            return
+        growth = [0] * n
+        while True:
+            blocks = [[] for _ in range(max(growth) + 1)]
+            for x, b in zip(self.elements, growth):
+                blocks[b].append(x)
+            yield frozenset(frozenset(block) for block in blocks)
+
+            # Increment the last position which may grow past its prefix.
+            i = n - 1
+            while i > 0 and growth[i] > max(growth[:i]):
+                i -= 1
+            if i == 0:
+                return
+            growth[i] += 1
+            growth[i + 1:] = [0] * (n - i - 1)
+
+    def le(self, a, b):
+        """
+        Determine whether `a` refines `b`.
+
+        Parameters
+        ----------
+        a : frozenset
+            A partition.
+        b : frozenset
+            A partition.
+
+        Returns
+        -------
+        le : bool
+            Whether every block of `a` lies within a block of `b`.
+        """
+        index = {x: i for i, block in enumerate(b) for x in block}
+        return all(len({index[x] for x in block}) == 1 for block in a)
+
+    def join(self, *nodes):
+        """
+        Find the join of `nodes`.
+
+        Parameters
+        ----------
+        nodes : frozenset
+            The partitions to join.
+
+        Returns
+        -------
+        join : frozenset
+            The finest partition coarser than each of `nodes`.
+        """
+        return reduce(partition_join, nodes) if nodes else self.bottom
+
+    def meet(self, *nodes):
+        """
+        Find the meet of `nodes`.
+
+        Parameters
+        ----------
+        nodes : frozenset
+            The partitions to meet.
+
+        Returns
+        -------
+        meet : frozenset
+            The coarsest partition finer than each of `nodes`.
+        """
+        return reduce(partition_meet, nodes) if nodes else self.top
+
+    def covers(self, node):
+        """
+        Find the partitions covered by `node`; those splitting one of its
+        blocks in two.
+
+        Parameters
+        ----------
+        node : frozenset
+            The partition.
+
+        Yields
+        ------
+        cover : frozenset
+            Each lower cover of `node`.
+        """
+        for block in node:
+            rest = node - {block}
+            first, *others = block
+            # Fixing the side of `first` enumerates each split once.
+            for mask in range(1, 2 ** len(others)):
+                outside = frozenset(x for i, x in enumerate(others) if mask >> i & 1)
+                yield rest | {block - outside, outside}
+
+    def upper_covers(self, node):
+        """
+        Find the partitions which cover `node`; those merging two of its
+        blocks.
+
+        Parameters
+        ----------
+        node : frozenset
+            The partition.
+
+        Yields
+        ------
+        cover : frozenset
+            Each upper cover of `node`.
+        """
+        blocks = list(node)
+        for i, a in enumerate(blocks):
+            for b in blocks[i + 1:]:
+                yield node - {a, b} | {a | b}
@@ -0,0 +1,264 @@
+"""
+Lattices given by generators and relations.
+
+A finitely presented lattice is grown from its generators by taking joins and
+meets until no new elements appear. Elements are told apart by their values
+under every assignment of the generators into some finite model lattices which
+satisfies the relations, so two terms are identified exactly when the models
+cannot distinguish them. Each element is stored once, as the first term found
+to represent it.
+"""
+
+from operator import le
+
+import networkx as nx
+
+from .lattice import Lattice, _bits
+
+
+__all__ = [
+    'Term',
+    'finitely_presented_lattice',
+]
+
+
+class Term(object):
+    """
+    An element of a finitely presented lattice, represented by a word in its
+    generators.
+    """
+
+    __slots__ = ('word', 'signature')
+
+    def __init__(self, word, signature):
+        """
+        Parameters
+        ----------
+        word : str
+            A word in the generators representing the element.
+        signature : tuple
+            The value of the word under each assignment into the models.
+        """
+        self.word = word
+        self.signature = signature
+
+    def __eq__(self, other):
+        """
+        Terms are equal when their signatures, and so their elements, agree.
+        """
+        return isinstance(other, Term) and self.signature == other.signature
+
+    def __hash__(self):
+        """
+        Hash the term by its signature.
+        """
+        return hash((Term, self.signature))
+
+    def __str__(self):
+        """
+        Represent the term by its word.
+        """
+        return self.word
+
+    def __repr__(self):
+        """
+        Represent the term by its word, as a Term.
+        """
+        return 'Term({!r})'.format(self.word)
+
+
+def _modular_models():
+    """
+    Construct the two element lattice and M3, which together generate the
+    variety of modular lattices on up to three generators.
+
+    Returns
+    -------
+    models : [Lattice]
+        The model lattices.
+    """
+    def m3_le(a, b):
+        """
+        0 <= 1, 2, 3 <= 4.
+        """
+        return a == b or a == 0 or b == 4
+
+    return [Lattice(range(2), le), Lattice(range(5), m3_le)]
+
+
+def _tables(model):
+    """
+    Tabulate the join and meet of a model lattice.
+
+    Parameters
+    ----------
+    model : Lattice
+        The model.
+
+    Returns
+    -------
+    joins : [[int]]
+        The index of the join of each pair of indices.
+    meets : [[int]]
+        The index of the meet of each pair of indices.
+    """
+    nodes = list(model)
+    index = {node: i for i, node in enumerate(nodes)}
+    joins = [[index[model.join(a, b)] for b in nodes] for a in nodes]
+    meets = [[index[model.meet(a, b)] for b in nodes] for a in nodes]
+    return joins, meets
+
+
+def _evaluate(term, assignment, joins, meets):
+    """
+    Evaluate a term in a model.
+
+    Parameters
+    ----------
+    term : generator, tuple
+        Either a generator, or a tuple ('join' or 'meet', term, term, ...).
+    assignment : dict
+        The value of each generator.
+    joins : [[int]]
+        The join table of the model.
+    meets : [[int]]
+        The meet table of the model.
+
+    Returns
+    -------
+    value : int
+        The value of `term`.
+
+    Raises
+    ------
+    ValueError
+        Raised if `term` is malformed.
+    """
+    if not isinstance(term, tuple):
+        return assignment[term]
+    op, *args = term
+    if op not in ('join', 'meet') or not args:
+        msg = "Terms must be generators or tuples ('join' or 'meet', term, ...), not {!r}.".format(term)
+        raise ValueError(msg)
+    table = joins if op == 'join' else meets
+    values = [_evaluate(arg, assignment, joins, meets) for arg in args]
+    value = values[0]
+    for other in values[1:]:
+        value = table[value][other]
+    return value
+
+
+def finitely_presented_lattice(generators, relations=(), models=None, budget=100000):
+    """
+    Construct the lattice generated by `generators` subject to `relations`
+    within the variety generated by `models`.
+
+    The lattice is grown by joining and meeting every pair of known elements
+    until it is closed, and its order is read off the resulting join table, so
+    the nodes are never compared pairwise.
+
+    Parameters
+    ----------
+    generators : collection
+        The generators of the lattice.
+    relations : [(term, term)]
+        Pairs of terms which are to be equal, where a term is either a
+        generator or a tuple ('join' or 'meet', term, term, ...). An inequality
+        a <= b is the relation (a, ('meet', a, b)).
+    models : [Lattice], None
+        Finite lattices generating the variety. Defaults to the two element
+        lattice and M3, which generate the modular lattices on up to three
+        generators.
+    budget : int, None
+        The largest number of elements to construct. None for no limit.
+
+    Returns
+    -------
+    lattice : Lattice
+        The presented lattice, whose nodes are `Term`s.
+
+    Raises
+    ------
+    ValueError
+        Raised if there are no generators, or if the lattice has more than
+        `budget` elements.
+    """
+    generators = list(dict.fromkeys(generators))
+    if not generators:
+        msg = "A lattice needs at least one generator."
+        raise ValueError(msg)
+    if models is None:
+        models = _modular_models()
+
+    # Every assignment of the generators into a model which satisfies the
+    # relations is one coordinate of each element's signature.
+    join_tables, meet_tables, values = [], [], []
+    for model in models:
+        joins, meets = _tables(model)
+        size = len(joins)
+        for k in range(size ** len(generators)):
+            assignment = {generator: k // size ** i % size for i, generator in enumerate(generators)}
+            if all(_evaluate(a, assignment, joins, meets) == _evaluate(b, assignment, joins, meets)
+                   for a, b in relations):
+                join_tables.append(joins)
+                meet_tables.append(meets)
+                values.append([assignment[generator] for generator in generators])
+
+    terms = []
+    index = {}
+
+    def intern(word, signature):
+        """
+        Find the element with `signature`, creating it if it is new.
+        """
+        if signature not in index:
+            if budget is not None and len(terms) >= budget:
+                msg = "The lattice has more than {} elements.".format(budget)
+                raise ValueError(msg)
+            index[signature] = len(terms)
+            terms.append(Term(word, signature))
+        return index[signature]
+
+    for i, generator in enumerate(generators):
+        intern(str(generator), tuple(value[i] for value in values))
+
+    join = {}
+    i = 0
+    while i < len(terms):
+        b = terms[i]
+        for j in range(i + 1):
+            a = terms[j]
+            signature = tuple(table[x][y] for table, x, y in zip(join_tables, a.signature, b.signature))
+            join[i, j] = join[j, i] = intern('({}∨{})'.format(a, b), signature)
+            signature = tuple(table[x][y] for table, x, y in zip(meet_tables, a.signature, b.signature))
+            intern('({}∧{})'.format(a, b), signature)
+        i += 1
+
+    # a <= b exactly when a ∨ b = b; order the elements by how many lie below
+    # them, and find the covers greedily as in the generic constructor.
+    downs = [0] * len(terms)
+    for (a, b), c in join.items():
+        if b == c:
+            downs[b] |= 1 << a
+    order = sorted(range(len(terms)), key=lambda i: bin(downs[i]).count('1'), reverse=True)
+    position = {i: k for k, i in enumerate(order)}
+    downs = [sum(1 << position[j] for j in _bits(downs[i])) for i in order]
+    ts = [terms[i] for i in order]
+
+    hasse = nx.DiGraph()
+    hasse.add_nodes_from(ts)
+    for k, down in enumerate(downs):
+        down &= ~(1 << k)
+        while down:
+            low = down & -down
+            j = low.bit_length() - 1
+            hasse.add_edge(ts[k], ts[j])
+            down &= ~downs[j]
+
+    def term_le(a, b):
+        """
+        a <= b --> a ∨ b = b.
+        """
+        return join[index[a.signature], index[b.signature]] == index[b.signature]
+
+    return Lattice._from_hasse(hasse, term_le, ts=ts)
@@ -0,0 +1,221 @@
+"""
+Progress reporting and cooperative cancellation of long constructions.
+
+Constructions proceed in phases: 'enumeration' of candidate nodes, 'filtering'
+of them, then the 'comparison' of pairs of nodes, the 'sort' into a topological
+order, and the 'reduction' to the cover relation. A progress callback is called
+as `progress(phase, done, total)` as each phase starts, periodically while it
+runs, and once it is done. A `CancellationToken` is consulted at the same
+points, and aborts the construction by raising `Cancelled` carrying whatever
+had been computed so far.
+"""
+
+from threading import Event
+from time import monotonic
+
+
+__all__ = [
+    'Cancelled',
+    'CancellationToken',
+]
+
+
+# The number of steps between successive reports within a phase.
+_REPORT_EVERY = 1024
+
+
+class Cancelled(Exception):
+    """
+    Raised when a construction is cancelled.
+
+    Attributes
+    ----------
+    phase : str
+        The phase during which the construction was cancelled.
+    partial : object
+        What had been computed so far: the list of nodes kept during
+        'enumeration' or 'filtering', and an `nx.DiGraph` of the comparable
+        pairs found so far, with edges from greater to lesser nodes, during the
+        later phases.
+    """
+
+    def __init__(self, msg, phase=None, partial=None):
+        super().__init__(msg, phase, partial)
+        self.phase = phase
+        self.partial = partial
+
+    def __str__(self):
+        """
+        Show only the message.
+        """
+        return str(self.args[0])
+
+
+class CancellationToken(object):
+    """
+    A token through which a construction can be cancelled, either explicitly
+    or by exceeding a budget of time or of nodes.
+    """
+
+    def __init__(self, timeout=None, max_elements=None):
+        """
+        Parameters
+        ----------
+        timeout : float, None
+            The number of seconds, from the creation of the token, after which
+            to cancel. None for no limit.
+        max_elements : int, None
+            The largest number of nodes to construct. None for no limit.
+        """
+        self.deadline = None if timeout is None else monotonic() + timeout
+        self.max_elements = max_elements
+        self._cancelled = Event()
+
+    def cancel(self):
+        """
+        Request that the construction stop at its next check.
+        """
+        self._cancelled.set()
+
+    def wait(self, timeout=None):
+        """
+        Block until `cancel` is called.
+
+        Parameters
+        ----------
+        timeout : float, None
+            The most seconds to wait. None for no limit.
+
+        Returns
+        -------
+        cancelled : bool
+            Whether `cancel` has been called.
+        """
+        return self._cancelled.wait(timeout)
+
+    def reason(self, elements=None):
+        """
+        Determine why the construction should stop, if it should.
+
+        Parameters
+        ----------
+        elements : int, None
+            The number of nodes constructed so far, if known.
+
+        Returns
+        -------
+        reason : str, None
+            A description of the reason to stop, or None to continue.
+        """
+        if self._cancelled.is_set():
+            return "cancelled"
+        if self.deadline is not None and monotonic() > self.deadline:
+            return "out of time"
+        if self.max_elements is not None and elements is not None and elements > self.max_elements:
+            return "more than {} elements".format(self.max_elements)
+        return None
+
+
+class _Monitor(object):
+    """
+    Reports the progress of the phases of a construction, and checks for its
+    cancellation.
+    """
+
+    def __init__(self, progress=None, token=None):
+        """
+        Parameters
+        ----------
+        progress : func, None
+            Called as `progress(phase, done, total)`.
+        token : CancellationToken, None
+            The token to check for cancellation.
+        """
+        self.progress = progress
+        self.token = token
+        self.phase = None
+        self.total = None
+        self.partial = None
+
+    def start(self, phase, total=None, partial=None, elements=None):
+        """
+        Begin a phase.
+
+        Parameters
+        ----------
+        phase : str
+            The phase.
+        total : int, None
+            The number of steps in the phase, if known.
+        partial : func, None
+            Computes the partial result, should the phase be cancelled.
+        elements : int, None
+            The number of nodes constructed so far, if known.
+        """
+        self.phase = phase
+        self.total = total
+        self.partial = partial
+        self.update(0, elements)
+
+    def update(self, done, elements=None):
+        """
+        Report the progress of the current phase, and check for cancellation.
+
+        Parameters
+        ----------
+        done : int
+            The number of steps done.
+        elements : int, None
+            The number of nodes constructed so far, if known.
+
+        Raises
+        ------
+        Cancelled
+            Raised if the token requests cancellation.
+        """
+        if self.progress is not None:
+            self.progress(self.phase, done, self.total)
+        if self.token is not None:
+            reason = self.token.reason(elements)
+            if reason is not None:
+                msg = "Construction stopped during {}: {}.".format(self.phase, reason)
+                partial = self.partial() if self.partial is not None else None
+                raise Cancelled(msg, phase=self.phase, partial=partial)
+
+    def finish(self):
+        """
+        Report that the current phase is done.
+        """
+        if self.progress is not None:
+            self.progress(self.phase, self.total, self.total)
+
+    def select(self, candidates, total=None, predicate=None):
+        """
+        Run an 'enumeration' phase, or a 'filtering' one if `predicate` is
+        given.
+
+        Parameters
+        ----------
+        candidates : iterable
+            The candidate nodes.
+        total : int, None
+            The number of candidates, if known.
+        predicate : func, None
+            Which candidates to keep. If None, all are kept.
+
+        Returns
+        -------
+        kept : list
+            The candidates satisfying `predicate`.
+        """
+        kept = []
+        done = 0
+        self.start('enumeration' if predicate is None else 'filtering', total, partial=lambda: list(kept))
+        for done, candidate in enumerate(candidates, 1):
+            if predicate is None or predicate(candidate):
+                kept.append(candidate)
+            if not done % _REPORT_EVERY:
+                self.update(done, len(kept))
+        self.total = done if self.total is None else self.total
+        self.update(self.total, len(kept))
+        return kept
@@ -4,11 +4,19 @@ Utilities for constructing and working with lattices.
 
 from collections.abc import Iterable
 from itertools import chain, combinations
+from math import comb
+
+import numpy as np
 
 
 __all__ = [
     'flatten',
+    'flatten_ragged',
     'powerset',
+    'subset_masks',
+    'subset_rank',
+    'subset_unrank',
+    'Powerset',
 ]
 
 
@@ -16,29 +24,103 @@ def flatten(l, levels=None):
     """
     Flatten an irregular list of lists.
 
+    The nesting is walked with an explicit stack of iterators, so arbitrarily
+    deep lists can be flattened.
+
     Parameters
     ----------
     l : iterable
        The object to be flattened.
+    levels : int, None
+        The number of levels of nesting to remove. None for all of them.
 
     Yields
     ------
     el : object
-        The non-iterable items in `l`.
+        The non-iterable items in `l`, or the items `levels` deep.
     """
     if levels == 0:
         yield from l
-    else:
-        for el in l:
+        return
+
+    stack = [(iter(l), levels)]
+    while stack:
+        items, depth = stack[-1]
+        for el in items:
             if isinstance(el, Iterable) and not (isinstance(el, str) and len(el) == 1):
-                levels = levels if levels is None else levels - 1
-                for sub in flatten(el, levels):
-                    yield sub
+                inner = depth if depth is None else depth - 1
+                if inner == 0:
+                    yield from el
+                else:
+                    stack.append((iter(el), inner))
+                    break
             else:
                 yield el
+        else:
+            stack.pop()
+
+
+def flatten_ragged(nodes):
+    """
+    Flatten sets (of sets [of sets {...}]) of uniform depth into a ragged
+    array: a flat NumPy array of the innermost elements, and for each level of
+    nesting an array of offsets, as in compressed sparse rows.
+
+    The members of item `i` at level `d` are the items `offsets[d][i]` up to
+    `offsets[d][i + 1]` at level `d + 1`, the last level being `values`.
+
+    Parameters
+    ----------
+    nodes : iterable
+        The sets to flatten, such as the nodes of `partition_lattice`.
+
+    Returns
+    -------
+    elements : list
+        The distinct innermost elements, in order of first appearance.
+    values : np.ndarray
+        The index into `elements` of each innermost element. Those of each
+        innermost set are sorted.
+    offsets : [np.ndarray]
+        The offsets of each level of nesting, from the outermost.
+
+    Raises
+    ------
+    ValueError
+        Raised if the nesting is not of uniform depth.
+    """
+    def nested(item):
+        """
+        Whether `item` is a set to descend into.
+        """
+        return isinstance(item, Iterable) and not isinstance(item, str)
+
+    level = list(nodes)
+    offsets = []
+    while level and nested(level[0]):
+        if not all(map(nested, level)):
+            msg = "The sets are not nested to a uniform depth."
+            raise ValueError(msg)
+        level = [list(item) for item in level]
+        offsets.append(np.cumsum([0] + [len(item) for item in level], dtype=np.intp))
+        level = list(chain.from_iterable(level))
+    if any(map(nested, level)):
+        msg = "The sets are not nested to a uniform depth."
+        raise ValueError(msg)
+
+    index = {}
+    for x in level:
+        index.setdefault(x, len(index))
+    values = np.array([index[x] for x in level], dtype=np.intp)
+
+    if offsets:
+        rows = np.repeat(np.arange(len(offsets[-1]) - 1), np.diff(offsets[-1]))
+        values = values[np.lexsort((values, rows))]
+
+    return list(index), values, offsets
 
 
-def powerset(iterable, size_limit=0):
+def powerset(iterable, size_limit=0, max_size=None):
     """
     powerset([1,2,3]) --> {} {1} {2} {3} {1,2} {1,3} {2,3} {1,2,3}
 
@@ -49,6 +131,8 @@ def powerset(iterable, size_limit=0):
     size_limit : int >= 0
         Yield only subsets of at least this size. For example, if `size_limit`
         is 1, only non-empty subsets are yielded.
+    max_size : int, None
+        Yield only subsets of at most this size. None for no limit.
 
     Yields
     ------
@@ -56,5 +140,325 @@ def powerset(iterable, size_limit=0):
         A subset of `iterable`.
     """
     s = list(iterable)
-    for set_ in chain.from_iterable(combinations(s, r) for r in range(size_limit, len(s) + 1)):
+    sizes = range(size_limit, _max_size(len(s), max_size) + 1)
+    for set_ in chain.from_iterable(combinations(s, r) for r in sizes):
         yield frozenset(set_)
+
+
+def _max_size(n, max_size):
+    """
+    Bound the size of subsets of `n` elements.
+
+    Parameters
+    ----------
+    n : int
+        The number of elements.
+    max_size : int, None
+        The requested maximum size, or None for no limit.
+
+    Returns
+    -------
+    max_size : int
+        The largest size of subset to consider.
+    """
+    return n if max_size is None else min(n, max_size)
+
+
+def _bit_count(mask):
+    """
+    Count the set bits of `mask`.
+
+    Parameters
+    ----------
+    mask : int
+        The bitmask.
+
+    Returns
+    -------
+    count : int
+        The size of the subset `mask` represents.
+    """
+    return bin(mask).count('1')
+
+
+def subset_masks(n, size_limit=0, max_size=None, gray=False):
+    """
+    Iterate over the subsets of `n` elements as int bitmasks, bit `i` standing
+    for element `i`.
+
+    By default, subsets are ordered by size, and those of equal size by colex
+    order, which is increasing numeric order of the bitmasks; this is the order
+    `subset_rank` numbers. In Gray code order, each bitmask differs from the
+    previous one in a single bit, so that an aggregate over the subset can be
+    updated incrementally, as long as no sizes are excluded.
+
+    Parameters
+    ----------
+    n : int
+        The number of elements.
+    size_limit : int >= 0
+        Yield only subsets of at least this size.
+    max_size : int, None
+        Yield only subsets of at most this size. None for no limit.
+    gray : bool
+        Whether to yield the subsets in Gray code order.
+
+    Yields
+    ------
+    mask : int
+        The bitmask of each subset.
+    """
+    max_size = _max_size(n, max_size)
+    if gray:
+        for i in range(1 << n):
+            mask = i ^ (i >> 1)
+            if size_limit <= _bit_count(mask) <= max_size:
+                yield mask
+        return
+
+    for k in range(size_limit, max_size + 1):
+        yield from _masks_of_size(n, (1 << k) - 1)
+
+
+def _masks_of_size(n, mask):
+    """
+    Iterate over the bitmasks of `n` bits with as many set bits as `mask`, from
+    `mask` up in numeric order, by Gosper's hack.
+
+    Parameters
+    ----------
+    n : int
+        The number of bits.
+    mask : int
+        The first bitmask.
+
+    Yields
+    ------
+    mask : int
+        Each bitmask of the same size, from `mask` up.
+    """
+    if not mask:
+        yield mask
+        return
+    while mask < 1 << n:
+        yield mask
+        low = mask & -mask
+        ripple = mask + low
+        mask = (((ripple ^ mask) >> 2) // low) | ripple
+
+
+def subset_rank(mask, n, size_limit=0):
+    """
+    Find the position of a subset in the order of `subset_masks`: by size,
+    then colex.
+
+    Parameters
+    ----------
+    mask : int
+        The bitmask of the subset.
+    n : int
+        The number of elements.
+    size_limit : int >= 0
+        The size of the smallest subsets being ranked.
+
+    Returns
+    -------
+    rank : int
+        The number of subsets preceding `mask`.
+    """
+    k = _bit_count(mask)
+    rank = sum(comb(n, j) for j in range(size_limit, k))
+    i = 0
+    while mask:
+        low = mask & -mask
+        i += 1
+        rank += comb(low.bit_length() - 1, i)
+        mask ^= low
+    return rank
+
+
+def subset_unrank(rank, n, size_limit=0):
+    """
+    Find the subset at a position in the order of `subset_masks`: by size, then
+    colex.
+
+    Parameters
+    ----------
+    rank : int
+        The position of the subset.
+    n : int
+        The number of elements.
+    size_limit : int >= 0
+        The size of the smallest subsets being ranked.
+
+    Returns
+    -------
+    mask : int
+        The bitmask of the subset.
+
+    Raises
+    ------
+    IndexError
+        Raised if there are not that many subsets.
+    """
+    k = size_limit
+    while k <= n and rank >= comb(n, k):
+        rank -= comb(n, k)
+        k += 1
+    if rank < 0 or k > n:
+        msg = "Subset rank out of range."
+        raise IndexError(msg)
+
+    # The largest element c of a k-subset of colex rank r is the largest with
+    # comb(c, k) <= r, and the rest is the (k - 1)-subset of rank r - comb(c, k).
+    mask = 0
+    c = n
+    for i in range(k, 0, -1):
+        c -= 1
+        while comb(c, i) > rank:
+            c -= 1
+        mask |= 1 << c
+        rank -= comb(c, i)
+    return mask
+
+
+class Powerset(object):
+    """
+    The subsets of some elements, as a sequence ordered by size and then colex,
+    which is never materialized. Subsets are enumerated as bitmasks, and are
+    converted to frozensets only when accessed; any slice of the sequence is
+    again a `Powerset`, so that workers can each enumerate a range of it.
+    """
+
+    def __init__(self, elements, size_limit=0, max_size=None, start=0, stop=None):
+        """
+        Parameters
+        ----------
+        elements : iterable
+            The elements of the set from which the powerset is to be computed.
+        size_limit : int >= 0
+            Include only subsets of at least this size.
+        max_size : int, None
+            Include only subsets of at most this size. None for no limit.
+        start : int
+            The rank of the first subset included.
+        stop : int, None
+            The rank after the last subset included. None for the end.
+        """
+        self.elements = list(elements)
+        self._bytes = [None] * ((len(self.elements) + 7) // 8)
+        self.size_limit = size_limit
+        self.max_size = _max_size(len(self.elements), max_size)
+        end = sum(comb(len(self.elements), k) for k in range(size_limit, self.max_size + 1))
+        self.start = min(start, end)
+        self.stop = end if stop is None else max(self.start, min(stop, end))
+
+    def __len__(self):
+        """
+        The number of subsets in the range.
+        """
+        return self.stop - self.start
+
+    def __getitem__(self, i):
+        """
+        Parameters
+        ----------
+        i : int, slice
+            The position of a subset, or a contiguous range of positions.
+
+        Returns
+        -------
+        subset : frozenset, Powerset
+            The subset at position `i`, or the subsets in the range.
+
+        Raises
+        ------
+        IndexError
+            Raised if `i` is out of range.
+        ValueError
+            Raised if the slice has a step other than 1.
+        """
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                msg = "Slices of a powerset must be contiguous."
+                raise ValueError(msg)
+            return Powerset(self.elements, self.size_limit, self.max_size, self.start + start, self.start + stop)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            msg = "Powerset index out of range."
+            raise IndexError(msg)
+        return self.subset(subset_unrank(self.start + i, len(self.elements), self.size_limit))
+
+    def __iter__(self):
+        """
+        Iterate over the subsets, in order.
+        """
+        return map(self.subset, self.masks())
+
+    def masks(self):
+        """
+        Iterate over the subsets as bitmasks over `elements`.
+
+        Yields
+        ------
+        mask : int
+            The bitmask of each subset, in order.
+        """
+        if not len(self):
+            return
+        n = len(self.elements)
+        first = subset_unrank(self.start, n, self.size_limit)
+        remaining = len(self)
+        while remaining:
+            for mask in _masks_of_size(n, first):
+                yield mask
+                remaining -= 1
+                if not remaining:
+                    return
+            first = (1 << (_bit_count(first) + 1)) - 1
+
+    def subset(self, mask):
+        """
+        Convert a bitmask to the subset it represents.
+
+        Parameters
+        ----------
+        mask : int
+            A bitmask over `elements`.
+
+        Returns
+        -------
+        subset : frozenset
+            The elements whose bits are set in `mask`.
+        """
+        members = []
+        chunk = 0
+        while mask:
+            if mask & 255:
+                members.extend(self._byte_members(chunk)[mask & 255])
+            mask >>= 8
+            chunk += 1
+        return frozenset(members)
+
+    def _byte_members(self, chunk):
+        """
+        Tabulate the elements of each byte of a bitmask, when first needed.
+
+        Parameters
+        ----------
+        chunk : int
+            The position of the byte within the bitmask.
+
+        Returns
+        -------
+        table : [tuple]
+            The elements whose bits are set in each value of the byte.
+        """
+        table = self._bytes[chunk]
+        if table is None:
+            elements = self.elements[8 * chunk:8 * chunk + 8]
+            table = self._bytes[chunk] = [tuple(x for i, x in enumerate(elements) if byte >> i & 1)
+                                          for byte in range(256)]
+        return table
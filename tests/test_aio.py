@@ -0,0 +1,110 @@
+"""
+Tests for lattices.aio
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import le
+
+import pytest
+
+from lattices.aio import build_lattice, run
+from lattices.lattice import Lattice
+from lattices.lattices import free_distributive_lattice, powerset_lattice
+from lattices.progress import CancellationToken, Cancelled
+from lattices.utils import powerset
+
+
+def test_build_lattice():
+    """
+    Test that a lattice is constructed in the executor.
+    """
+    nodes = list(powerset(range(3)))
+    with ThreadPoolExecutor(1) as executor:
+        lattice = asyncio.run(build_lattice(nodes, le, executor=executor))
+    assert lattice.isomorphic(Lattice(nodes, le))
+
+
+def test_build_lattice_constructor():
+    """
+    Test that any constructor accepting a token can be used.
+    """
+    lattice = asyncio.run(build_lattice(range(3), constructor=free_distributive_lattice))
+    assert len(list(lattice)) == 18
+
+
+def test_build_lattice_cancel():
+    """
+    Test that cancelling the awaiting task cancels the construction.
+    """
+    token = CancellationToken()
+    started = threading.Event()
+
+    def progress(phase, done, total):
+        """
+        Signal that the construction has started, then wait to be cancelled.
+        """
+        started.set()
+        token.wait(5)
+
+    async def main(executor):
+        """
+        Start the construction and cancel it.
+        """
+        task = asyncio.ensure_future(build_lattice(range(4), constructor=powerset_lattice, executor=executor,
+                                                   progress=progress, token=token))
+        assert await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with ThreadPoolExecutor(1) as executor:
+        asyncio.run(main(executor))
+    assert token.wait(0)
+
+
+def test_build_lattice_cancelled_token():
+    """
+    Test that a cancelled token raises through the coroutine.
+    """
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(Cancelled):
+        asyncio.run(build_lattice(range(2), constructor=powerset_lattice, token=token))
+
+
+@pytest.mark.parametrize('operation', ['join', 'meet'])
+def test_aoperations(operation):
+    """
+    Test that the awaitable join and meet agree with the blocking ones.
+    """
+    lattice = powerset_lattice(range(3))
+    a, b = frozenset([0]), frozenset([1, 2])
+    result = asyncio.run(getattr(lattice, 'a' + operation)(a, b))
+    assert result == getattr(lattice, operation)(a, b)
+
+
+@pytest.mark.parametrize('chunksize', [1, 4, 100])
+def test_achains(chunksize):
+    """
+    Test that the asynchronous chains are the chains.
+    """
+    lattice = powerset_lattice(range(3))
+
+    async def collect():
+        """
+        Collect the chains.
+        """
+        return [chain async for chain in lattice.achains(chunksize=chunksize)]
+
+    chains = asyncio.run(collect())
+    assert sorted(map(tuple, chains), key=repr) == sorted(map(tuple, lattice.chains()), key=repr)
+
+
+def test_run():
+    """
+    Test that a blocking query can be awaited.
+    """
+    lattice = powerset_lattice(range(2))
+    assert asyncio.run(run(lambda: lattice.distributive))
@@ -0,0 +1,106 @@
+"""
+Tests for lattices.backends
+"""
+
+import networkx as nx
+import pytest
+
+from lattices.backends import BACKENDS, select_backend
+from lattices.lattice import Lattice
+from lattices.lattices import free_distributive_lattice
+
+
+def chain(size):
+    """
+    A chain of `size` nodes, constructed from its covers.
+    """
+    return Lattice._from_hasse(nx.path_graph(size, create_using=nx.DiGraph), lambda a, b: a >= b)
+
+
+@pytest.mark.parametrize('backend', sorted(BACKENDS))
+def test_backend_agree(backend):
+    """
+    Test that each backend stores the same covers and bitsets.
+    """
+    reference = free_distributive_lattice(range(3))
+    lattice = Lattice(list(reference), reference._relationship, backend=backend)
+    assert lattice.backend == backend
+    assert list(lattice) == list(reference)
+    assert set(lattice._lattice.edges()) == set(reference._lattice.edges())
+    assert list(lattice._up) == list(reference._up)
+    assert list(lattice._down) == list(reference._down)
+    for node in lattice:
+        assert set(lattice.covers(node)) == set(reference.covers(node))
+    assert lattice.join_irreducibles() == reference.join_irreducibles()
+    assert lattice.meet_irreducibles() == reference.meet_irreducibles()
+    assert len(lattice.congruences()._lattice) == len(reference.congruences()._lattice)
+
+
+@pytest.mark.parametrize('backend', ['bitmatrix', 'csr'])
+def test_backend_modify(backend):
+    """
+    Test that modifying a lattice moves it to the networkx backend.
+    """
+    lattice = Lattice(range(4), lambda a, b: a <= b, backend=backend)
+    lattice.remove_node(2)
+    lattice.add_node(5)
+    assert lattice.backend == 'networkx'
+    assert set(lattice._lattice.edges()) == {(5, 3), (3, 1), (1, 0)}
+
+
+@pytest.mark.parametrize(('size', 'backend'), [
+    (10, 'networkx'),
+    (10000, 'bitmatrix'),
+    (100000, 'csr'),
+])
+def test_select_backend(size, backend):
+    """
+    Test the automatic choice of backend.
+    """
+    assert select_backend(size) == backend
+
+
+def test_backend_large(monkeypatch):
+    """
+    Test that a large lattice is stored sparsely, and computes bitsets lazily.
+    """
+    monkeypatch.setattr('lattices.backends.NETWORKX_SIZE', 2**8)
+    monkeypatch.setattr('lattices.backends.BITMATRIX_SIZE', 2**10)
+    lattice = Lattice.product(chain(40), chain(30))
+    assert lattice.backend == 'csr'
+    assert lattice.join((5, 7), (9, 3)) == (5, 3)
+    assert lattice.meet((5, 7), (9, 3)) == (9, 7)
+    assert set(lattice.covers((5, 7))) == {(6, 7), (5, 8)}
+    assert len(lattice._down._rows) < 100
+
+
+@pytest.mark.parametrize('backend', ['bitmatrix', 'csr'])
+def test_backend_graph_uncached(backend):
+    """
+    Test that backends other than networkx do not keep the graphs they build.
+    """
+    lattice = Lattice(range(4), lambda a, b: a <= b, backend=backend)
+    assert lattice._lattice is not lattice._lattice
+    assert not any(isinstance(value, nx.DiGraph) for value in vars(lattice._backend).values())
+
+
+def test_backend_packed():
+    """
+    Test that the bitmatrix backend's packed bitsets are used directly, and
+    agree with packing the bitsets of the other backends.
+    """
+    reference = free_distributive_lattice(range(3))
+    lattices = {backend: Lattice(list(reference), reference._relationship, backend=backend)
+                for backend in sorted(BACKENDS)}
+    assert lattices['bitmatrix']._bitset_matrix('up') is lattices['bitmatrix']._backend.up_matrix
+    for direction in ['up', 'down']:
+        for lattice in lattices.values():
+            assert (lattice._bitset_matrix(direction) == reference._bitset_matrix(direction)).all()
+
+
+def test_backend_unknown():
+    """
+    Test that an unknown backend is rejected.
+    """
+    with pytest.raises(ValueError):
+        Lattice(range(3), lambda a, b: a <= b, backend='sparse')
@@ -0,0 +1,66 @@
+"""
+Tests for lattices.birkhoff
+"""
+
+from itertools import combinations
+
+import pytest
+
+from lattices.birkhoff import BirkhoffLattice
+from lattices.lattices import M3, N5, free_distributive_lattice, powerset_lattice
+
+
+@pytest.mark.parametrize('lattice', [
+    powerset_lattice(range(3)),
+    free_distributive_lattice(range(3)),
+])
+def test_birkhoff_from_lattice(lattice):
+    """
+    Test that the representation is isomorphic, and preserves join and meet.
+    """
+    birkhoff = BirkhoffLattice.from_lattice(lattice)
+    assert sorted(birkhoff) == sorted(birkhoff.encode(node) for node in lattice)
+    assert birkhoff.to_lattice().isomorphic(lattice)
+    for a, b in combinations(lattice, 2):
+        x, y = birkhoff.encode(a), birkhoff.encode(b)
+        assert birkhoff.decode(birkhoff.join(x, y)) == lattice.join(a, b)
+        assert birkhoff.decode(birkhoff.meet(x, y)) == lattice.meet(a, b)
+        assert birkhoff.le(x, y) == lattice._relationship(a, b)
+
+
+@pytest.mark.parametrize('lattice', [M3, N5])
+def test_birkhoff_not_distributive(lattice):
+    """
+    Test that non-distributive lattices are rejected.
+    """
+    with pytest.raises(ValueError):
+        BirkhoffLattice.from_lattice(lattice)
+
+
+def test_birkhoff_large():
+    """
+    Test a lattice with a billion elements, given by an antichain of thirty.
+    """
+    birkhoff = BirkhoffLattice(range(30), lambda a, b: a == b)
+    a, b = 0b1010, 0b0110
+    assert birkhoff.join(a, b) == 0b1110
+    assert birkhoff.meet(a, b) == 0b0010
+    assert birkhoff.join() == birkhoff.bottom
+    assert birkhoff.meet() == birkhoff.top
+    assert len(birkhoff.covers(birkhoff.top)) == 30
+    assert len(birkhoff.join_irreducibles()) == 30
+
+
+def test_birkhoff_covers():
+    """
+    Test covers in the down-sets of a two element chain beside a point.
+    """
+    birkhoff = BirkhoffLattice('abc', lambda a, b: (a, b) == ('a', 'b'))
+    elements = list(birkhoff)
+    assert len(elements) == 6
+    assert all(element in birkhoff for element in elements)
+    b = 1 << birkhoff.irreducibles.index('b')
+    assert b not in birkhoff
+    for element in elements:
+        for cover in birkhoff.covers(element):
+            assert element in birkhoff.upper_covers(cover)
@@ -0,0 +1,36 @@
+"""
+Tests for lattices.closure
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+import pytest
+
+from lattices.closure import closure
+
+
+def test_closure_streams():
+    """
+    Test that the generators come first, and that elements are found lazily.
+    """
+    def join(a, b):
+        """
+        An unbounded join.
+        """
+        return max(a, b) + 1
+
+    assert list(islice(closure([0, 1], join, min), 5)) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize('chunksize', [1, 3, 1024])
+def test_closure_executor(chunksize):
+    """
+    Test that closing with an executor finds the same elements.
+    """
+    generators = [frozenset({i}) for i in range(4)]
+    serial = set(closure(generators, frozenset.union, frozenset.intersection))
+    with ThreadPoolExecutor(2) as executor:
+        parallel = set(closure(generators, frozenset.union, frozenset.intersection, executor, chunksize))
+    assert serial == parallel
+    assert len(serial) == 16
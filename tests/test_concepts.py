@@ -0,0 +1,48 @@
+"""
+Tests for lattices.concepts
+"""
+
+import numpy as np
+import pytest
+
+from lattices.concepts import Concept, concept_lattice
+from lattices.lattice import Lattice
+
+
+context = [[1, 0, 1, 0],
+           [1, 1, 0, 0],
+           [0, 1, 1, 1],
+           [0, 0, 1, 1],
+           ]
+
+
+@pytest.mark.parametrize('size', range(1, 6))
+def test_concept_lattice_1(size):
+    """
+    Test that a contranominal context yields a boolean lattice.
+    """
+    lattice = concept_lattice(1 - np.eye(size, dtype=int))
+    assert len(lattice._lattice) == 2**size
+    assert lattice._lattice.number_of_edges() == size * 2**(size - 1)
+    assert all(set(lattice.covers(atom)) == {lattice.bottom} for atom in lattice._lattice.pred[lattice.bottom])
+
+
+def test_concept_lattice_2():
+    """
+    Test that the covers agree with the generic constructor.
+    """
+    lattice = concept_lattice(context)
+    generic = Lattice(lattice, lambda a, b: a.extent <= b.extent)
+    assert set(lattice._lattice.edges()) == set(generic._lattice.edges())
+
+
+def test_concept_lattice_3():
+    """
+    Test labels, top and bottom.
+    """
+    lattice = concept_lattice(context, objects='wxyz', attributes='abcd')
+    assert lattice.top == Concept(frozenset('wxyz'), frozenset())
+    assert lattice.bottom == Concept(frozenset(), frozenset('abcd'))
+    assert Concept(frozenset('wyz'), frozenset('c')) in lattice
+    assert lattice.join(Concept(frozenset('x'), frozenset('ab')),
+                        Concept(frozenset('y'), frozenset('bcd'))) == Concept(frozenset('xy'), frozenset('b'))
@@ -0,0 +1,119 @@
+"""
+Tests for lattices.export
+"""
+
+import io
+import json
+from itertools import combinations
+from xml.etree import ElementTree
+
+import networkx as nx
+import pytest
+
+from lattices.lattices import M3, N5, free_distributive_lattice, partition_lattice, powerset_lattice
+
+
+def crossings(lattice, layout):
+    """
+    Count the pairs of cover edges between adjacent layers which cross.
+    """
+    edges = [(layout[a], layout[b]) for a, b in lattice._lattice.edges() if layout[a][1] == layout[b][1] + 1]
+    return sum(1 for (a, b), (c, d) in combinations(edges, 2) if a[1] == c[1] and (a[0] - c[0]) * (b[0] - d[0]) < 0)
+
+
+@pytest.mark.parametrize('lattice', [M3, N5, free_distributive_lattice(range(3)), partition_lattice(range(3))])
+def test_to_json_lines(lattice):
+    """
+    Test that the JSON lines describe the Hasse diagram.
+    """
+    f = io.StringIO()
+    lattice.to_json_lines(f)
+    records = [json.loads(line) for line in f.getvalue().splitlines()]
+    labels = {record['node']: record['label'] for record in records if 'node' in record}
+    edges = {(labels[record['source']], labels[record['target']]) for record in records if 'source' in record}
+    assert len(labels) == len(list(lattice))
+    assert edges == {(lattice.labels[a], lattice.labels[b]) for a, b in lattice._lattice.edges()}
+
+
+@pytest.mark.parametrize('labels', [True, False])
+def test_to_edgelist(labels):
+    """
+    Test that the edge list is the cover relation.
+    """
+    lattice = powerset_lattice(range(3))
+    f = io.StringIO()
+    lattice.to_edgelist(f, labels=labels)
+    graph = nx.parse_edgelist(f.getvalue().splitlines(), delimiter='\t', create_using=nx.DiGraph)
+    assert nx.is_isomorphic(graph, lattice._lattice)
+    if labels:
+        assert ('012', '01') in graph.edges()
+
+
+def test_to_dot():
+    """
+    Test that every node and edge is written, with positions if laid out.
+    """
+    lattice = free_distributive_lattice(range(3))
+    f = io.StringIO()
+    lattice.to_dot(f, layout=lattice.hasse_layout())
+    lines = f.getvalue().splitlines()
+    assert lines[0] == 'digraph lattice {'
+    assert lines[-1] == '}'
+    assert sum('->' in line for line in lines) == lattice._lattice.number_of_edges()
+    assert sum('pos=' in line for line in lines) == len(list(lattice))
+
+
+def test_to_dot_escape():
+    """
+    Test that quotes in labels are escaped.
+    """
+    lattice = powerset_lattice(['"'])
+    f = io.StringIO()
+    lattice.to_dot(f)
+    assert r'label="\""' in f.getvalue()
+
+
+def test_to_graphml():
+    """
+    Test that the GraphML can be read back.
+    """
+    lattice = partition_lattice(range(3))
+    f = io.StringIO()
+    lattice.to_graphml(f)
+    ElementTree.fromstring(f.getvalue().encode())
+    graph = nx.parse_graphml(f.getvalue())
+    assert nx.is_isomorphic(graph, lattice._lattice)
+    assert set(nx.get_node_attributes(graph, 'label').values()) == set(lattice.labels.values())
+
+
+def test_export_view():
+    """
+    Test that views export only their own nodes and covers.
+    """
+    lattice = powerset_lattice(range(3))
+    view = lattice.upset(frozenset([0]))
+    f = io.StringIO()
+    view.to_edgelist(f)
+    assert len(f.getvalue().splitlines()) == 4
+
+
+@pytest.mark.parametrize('lattice', [N5, free_distributive_lattice(range(3)), powerset_lattice(range(4))])
+def test_hasse_layout(lattice):
+    """
+    Test that each node lies on the layer of its height, above its covers.
+    """
+    layout = lattice.hasse_layout()
+    assert set(layout) == set(lattice)
+    assert layout[lattice.bottom][1] == 0
+    for a, b in lattice._lattice.edges():
+        assert layout[a][1] > layout[b][1]
+    positions = list(layout.values())
+    assert len(set(positions)) == len(positions)
+
+
+def test_hasse_layout_crossings():
+    """
+    Test that crossing reduction does not add crossings.
+    """
+    lattice = powerset_lattice(range(4))
+    assert crossings(lattice, lattice.hasse_layout(sweeps=4)) <= crossings(lattice, lattice.hasse_layout(sweeps=0))
@@ -0,0 +1,137 @@
+"""
+Tests for lattices.instrumentation
+"""
+
+from threading import Event, Thread
+
+import pytest
+
+from lattices.instrumentation import _recorders, instrument
+from lattices.lattice import Lattice
+from lattices.lattices import powerset_lattice
+
+
+def subset_le(a, b):
+    """
+    a <= b --> a is a subset of b.
+    """
+    return a <= b
+
+
+@pytest.mark.parametrize('size', [2, 3])
+def test_relationship_count(size):
+    """
+    Test that each pair of nodes is compared at most twice.
+    """
+    nodes = list(powerset_lattice(range(size)))
+    with instrument() as stats:
+        lattice = Lattice(nodes, subset_le)
+    n = len(nodes)
+    calls = lattice.stats()['counters']['relationship']
+    assert n * (n - 1) // 2 <= calls <= n * (n - 1)
+    assert stats.counters['relationship'] == calls
+
+
+def test_spans():
+    """
+    Test that the phases of construction are timed.
+    """
+    with instrument() as stats:
+        lattice = powerset_lattice(range(3))
+    assert {'compare', 'order', 'covers', 'index'} <= set(stats.spans)
+    assert all(seconds >= 0 for seconds in lattice.stats()['spans'].values())
+
+
+def test_cache():
+    """
+    Test that cache hits and misses are counted.
+    """
+    lattice = powerset_lattice(range(2))
+    with instrument():
+        lattice.canonical_form()
+        lattice.canonical_form()
+    counters = lattice.stats()['counters']
+    assert counters['cache_miss'] == 1
+    assert counters['cache_hit'] == 1
+
+
+def test_queries():
+    """
+    Test that joins, meets and traversals are counted.
+    """
+    lattice = powerset_lattice(range(2))
+    a, b = frozenset([0]), frozenset([1])
+    with instrument() as stats:
+        lattice.join(a, b)
+        lattice.meet(a, b)
+        lattice.ascendants(a)
+        list(lattice.chains())
+    assert stats.counters['join'] == 1
+    assert stats.counters['meet'] == 1
+    assert stats.counters['traversal'] == 2
+
+
+def test_callback():
+    """
+    Test that the callback sees every event.
+    """
+    events = []
+    with instrument(lambda *event: events.append(event)) as stats:
+        powerset_lattice(range(2))
+    assert sum(value for kind, name, value in events if kind == 'count') == sum(stats.counters.values())
+    assert {name for kind, name, _ in events if kind == 'span'} == set(stats.spans)
+
+
+def test_disabled():
+    """
+    Test that nothing is recorded outside an instrumented block.
+    """
+    with instrument():
+        pass
+    assert not _recorders.stack
+    lattice = powerset_lattice(range(2))
+    lattice.join(*lattice)
+    lattice.canonical_form()
+    assert lattice.stats() == {'counters': {}, 'spans': {}}
+
+
+def test_nested():
+    """
+    Test that nested blocks each record their own events.
+    """
+    lattice = powerset_lattice(range(2))
+    with instrument() as outer:
+        lattice.join(lattice.top)
+        with instrument() as inner:
+            lattice.meet(lattice.top)
+    assert outer.counters == {'join': 1, 'meet': 1}
+    assert inner.counters == {'meet': 1}
+
+
+def test_threads():
+    """
+    Test that a block only records the events of the thread which opened it.
+    """
+    lattice = powerset_lattice(range(2))
+    opened, done = Event(), Event()
+
+    def other():
+        """
+        Record a meet while the main thread's block is open.
+        """
+        with instrument() as stats:
+            opened.set()
+            done.wait(5)
+            lattice.meet(lattice.top)
+        results.append(stats)
+
+    results = []
+    thread = Thread(target=other)
+    thread.start()
+    assert opened.wait(5)
+    with instrument() as stats:
+        lattice.join(lattice.top)
+    done.set()
+    thread.join(5)
+    assert stats.counters == {'join': 1}
+    assert results[0].counters == {'meet': 1}
@@ -0,0 +1,110 @@
+"""
+Tests for lattices.interning
+"""
+
+from itertools import product
+
+import pytest
+
+from lattices.interning import InternTable
+from lattices.lattices import (dependency_antichain_lattice, dependency_lattice, free_distributive_lattice,
+                               partition_lattice)
+from lattices.orderings import antichain_le, refinement_le
+
+
+def test_intern():
+    """
+    Test that each distinct item is numbered once, and the first one seen is
+    canonical.
+    """
+    table = InternTable()
+    items = [frozenset(s) for s in [{0}, {1}, {0}, {0, 1}]]
+    assert [table.intern(item) is items[i] for item, i in zip(items, [0, 1, 0, 3])] == [True] * 4
+    assert [table.number(item) for item in items] == [0, 1, 0, 2]
+    assert len(table) == 3
+    assert table.below == [0b001, 0b010, 0b111]
+    assert table.above == [0b101, 0b110, 0b100]
+
+
+def test_node():
+    """
+    Test that nodes are built from shared canonical members, and decode to
+    equal nodes.
+    """
+    table = InternTable()
+    a = table.node([frozenset([0]), frozenset([1, 2])])
+    b = table.node([frozenset([1, 2]), frozenset([3])])
+    assert a == {frozenset([0]), frozenset([1, 2])}
+    assert len({id(member) for member in a | b}) == 3
+    assert table.decode(table.encode(a)) == a
+    assert bin(table.encode(a) & table.encode(b)).count('1') == 1
+
+
+def test_closure():
+    """
+    Test that downsets and upsets account for items interned later.
+    """
+    table = InternTable()
+    top = table.node([frozenset([0, 1])])
+    assert table.downset(top) == 0b1
+    bottom = table.node([frozenset([0])])
+    assert table.downset(top) == 0b11
+    assert table.upset(bottom) == 0b11
+
+
+@pytest.mark.parametrize(('a', 'b'), [
+    ([{1}, {2}, {3}], [{1, 2}, {3}]),
+    ([{1, 2}, {3}], [{1, 2, 3}]),
+])
+def test_antichain_le_interned(a, b):
+    """
+    Test the interned antichain order on nodes built from its table.
+    """
+    order = antichain_le(interned=True)
+    a, b = (order.table.node(frozenset(member) for member in node) for node in (a, b))
+    assert order(a, b)
+    assert not order(b, a)
+
+
+@pytest.mark.parametrize(('a', 'b'), [
+    ([{1}, {2}, {3}], [{1, 2}, {3}]),
+    ([{1, 2}, {3}], [{1, 2, 3}]),
+])
+def test_refinement_le_interned(a, b):
+    """
+    Test the interned refinement order on nodes built from its table.
+    """
+    order = refinement_le(interned=True)
+    a, b = (order.table.node(frozenset(member) for member in node) for node in (a, b))
+    assert order(a, b)
+    assert not order(b, a)
+
+
+@pytest.mark.parametrize(('constructor', 'order'), [
+    (partition_lattice, refinement_le),
+    (dependency_lattice, refinement_le),
+    (free_distributive_lattice, antichain_le),
+])
+def test_interned_agrees(constructor, order):
+    """
+    Test that the interned orders agree with the plain ones on every pair,
+    including nodes not built from their table.
+    """
+    nodes = list(constructor(range(3)))
+    plain, interned = order(), order(interned=True)
+    assert all(plain(a, b) == interned(a, b) for a, b in product(nodes, repeat=2))
+
+
+@pytest.mark.parametrize('constructor', [
+    partition_lattice,
+    dependency_lattice,
+    free_distributive_lattice,
+    dependency_antichain_lattice,
+])
+def test_shared_members(constructor):
+    """
+    Test that the nodes of the constructed lattices share their members.
+    """
+    lattice = constructor(range(3))
+    members = [member for node in lattice for member in node]
+    assert len({id(member) for member in members}) == len(set(members))
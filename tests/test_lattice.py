@@ -2,10 +2,15 @@
 Tests for lattices.lattice
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import combinations, product
+
+import numpy as np
 import pytest
 
-from lattices.lattice import Lattice, stringify
-from lattices.lattices import M3, N5, free_distributive_lattice, powerset_lattice
+from lattices.lattice import Cut, Lattice, stringify
+from lattices.lattices import M3, N5, free_distributive_lattice, partition_lattice, powerset_lattice
 
 
 @pytest.mark.parametrize(('a', 'b', 'c'), [
@@ -21,6 +26,35 @@ def test_stringify(a, b, c):
     assert f(a) == b
 
 
+def test_stringify_deep():
+    """
+    Test that sets nested beyond the recursion limit can be stringified.
+    """
+    depth = 5000
+    thing = frozenset([0])
+    for _ in range(depth):
+        thing = frozenset([thing])
+    assert stringify(symbols='|' * depth)(thing) == '0'
+
+
+def test_lattice_labels():
+    """
+    Test that labels are computed once and dropped when the nodes change.
+    """
+    lattice = partition_lattice(range(3))
+    labels = lattice.labels
+    assert labels is lattice.labels
+    assert list(labels) == list(lattice)
+    assert labels[lattice.top] == '012'
+    assert labels[lattice.bottom] == '0|1|2'
+    view = lattice.upset(lattice.bottom)
+    assert view.labels == labels
+    bottom = lattice.bottom
+    lattice.remove_node(bottom)
+    assert bottom not in lattice.labels
+    assert len(lattice.labels) == 4
+
+
 @pytest.mark.parametrize(('lattice', 'node', 'parents'), [
     (M3, frozenset({0}), {frozenset({'a'}), frozenset({'b'}), frozenset({'c'}), frozenset({1})}),
     (M3, frozenset({'a'}), {frozenset({1})}),
@@ -266,6 +300,8 @@ bad_c = Lattice(bad_c_nodes, bad_c_order)
     (bad_a, False),
     (bad_b, False),
     (bad_c, False),
+    (powerset_lattice(range(2)), True),
+    (Lattice(range(4), lambda a, b: a <= b), True),
 ])
 def test_lattice_validate(lattice, truth):
     """
@@ -311,3 +347,481 @@ def test_lattice_chains(lattice, total):
     Test the enumeration of chains.
     """
     assert len(list(lattice.chains())) == total
+
+
+@pytest.mark.parametrize('node', [
+    frozenset(),
+    frozenset({1}),
+    frozenset({0, 2}),
+    frozenset({0, 1, 2}),
+])
+def test_lattice_add_node(node):
+    """
+    Test that adding a node matches constructing the full lattice.
+    """
+    full = powerset_lattice(range(3))
+    lattice = powerset_lattice(range(3))
+    lattice.remove_node(node)
+    lattice.add_node(node)
+    assert set(lattice._lattice.edges()) == set(full._lattice.edges())
+    assert lattice.top == full.top
+    assert lattice.bottom == full.bottom
+    assert all(lattice._ts.index(node) < lattice._ts.index(n) for n in lattice.descendants(node))
+    assert all(lattice._ts.index(node) > lattice._ts.index(n) for n in lattice.ascendants(node))
+
+
+@pytest.mark.parametrize(('node', 'top', 'bottom'), [
+    (2, 4, 0),
+    (5, 5, 0),
+    (-1, 4, -1),
+])
+def test_lattice_add_node_chain(node, top, bottom):
+    """
+    Test adding new elements to a chain, including a new top and bottom.
+    """
+    lattice = Lattice([0, 1, 3, 4], lambda a, b: a <= b)
+    lattice.add_node(node)
+    assert lattice._ts == sorted([0, 1, 3, 4, node], reverse=True)
+    assert set(lattice._lattice.edges()) == set(zip(lattice._ts, lattice._ts[1:]))
+    assert lattice.top == top
+    assert lattice.bottom == bottom
+
+
+def test_lattice_add_node_n5():
+    """
+    Test inserting the middle element of N5 into the four element lattice.
+    """
+    nodes = [n for n in N5 if n != frozenset({'a'})]
+    lattice = Lattice(nodes, N5._relationship)
+    lattice.add_node(frozenset({'a'}))
+    assert set(lattice._lattice.edges()) == set(N5._lattice.edges())
+    assert lattice.top == N5.top
+    assert lattice.bottom == N5.bottom
+
+
+def test_lattice_add_remove_idempotent():
+    """
+    Test that adding a present node and removing a missing node do nothing.
+    """
+    lattice = Lattice(N5, N5._relationship)
+    lattice.add_node(frozenset({'a'}))
+    lattice.remove_node(frozenset({'z'}))
+    assert set(lattice._lattice.edges()) == set(N5._lattice.edges())
+
+
+@pytest.mark.parametrize(('node', 'edges'), [
+    (frozenset({'a'}), {(frozenset({1}), frozenset({'b'})), (frozenset({'b'}), frozenset({0}))}),
+    (frozenset({'b'}), {(frozenset({1}), frozenset({'a'})), (frozenset({'a'}), frozenset({0}))}),
+    (frozenset({1}), {(frozenset({'b'}), frozenset({'a'})), (frozenset({'a'}), frozenset({0}))}),
+])
+def test_lattice_remove_node(node, edges):
+    """
+    Test that removing a node reconnects its covers.
+    """
+    lattice = Lattice(N5, N5._relationship)
+    lattice.remove_node(node)
+    assert node not in lattice._lattice
+    assert edges <= set(lattice._lattice.edges())
+    assert len(lattice._ts) == 4
+
+
+@pytest.mark.parametrize(('nodes', 'order', 'size'), [
+    (bad_a_nodes, bad_a_order, 7),
+    (bad_b_nodes, bad_b_order, 7),
+    (bad_c_nodes, bad_c_order, 18),
+    (list(M3), M3._relationship, 5),
+    (list(N5), N5._relationship, 5),
+])
+def test_lattice_completion_1(nodes, order, size):
+    """
+    Test that the completion of a partial order is a lattice containing it.
+    """
+    lattice = Lattice.completion(nodes, order)
+    assert len(lattice._lattice) == size
+    assert set(nodes) <= set(lattice)
+    assert lattice._validate()
+
+
+def test_lattice_completion_2():
+    """
+    Test that completion preserves the order among the original nodes.
+    """
+    lattice = Lattice.completion(bad_a_nodes, bad_a_order)
+    assert lattice.join('a', 'b') == Cut({'a', 'b'})
+    assert lattice.meet('c', 'd') == Cut({'a', 'b'})
+    assert lattice.top == Cut(bad_a_nodes)
+    assert lattice.bottom == Cut(set())
+    assert lattice.descendants('c') == {'a', 'b', Cut({'a', 'b'}), Cut(set())}
+
+
+def test_lattice_completion_3():
+    """
+    Test that new cuts cannot collide with original nodes which are sets.
+    """
+    nodes = ['x', 'y', frozenset({'x', 'y'}), 'd']
+
+    def order(a, b):
+        """
+        x and y lie below both of the others.
+        """
+        return a in ['x', 'y'] and b in [frozenset({'x', 'y'}), 'd']
+
+    lattice = Lattice.completion(nodes, order)
+    assert len(lattice._lattice) == 7
+    assert lattice.join('x', 'y') == Cut({'x', 'y'})
+    assert lattice.join('x', 'y') != frozenset({'x', 'y'})
+    assert lattice.ascendants(Cut({'x', 'y'})) == {frozenset({'x', 'y'}), 'd', Cut(nodes)}
+
+
+def test_lattice_interval():
+    """
+    Test that intervals share the index and restrict the order.
+    """
+    lattice = powerset_lattice(range(4))
+    interval = lattice.interval(frozenset({0}), frozenset({0, 1, 2}))
+    assert set(interval) == {frozenset({0}), frozenset({0, 1}), frozenset({0, 2}), frozenset({0, 1, 2})}
+    assert interval._index is lattice._index
+    assert interval.top == frozenset({0, 1, 2})
+    assert interval.bottom == frozenset({0})
+    assert interval.descendants(frozenset({0, 1})) == {frozenset({0})}
+    assert interval.meet(frozenset({0, 1}), frozenset({0, 2})) == frozenset({0})
+    assert interval._lattice.number_of_edges() == 4
+    assert interval.distributive
+
+
+def test_lattice_interval_empty():
+    """
+    Test that an interval between incomparable nodes is an error.
+    """
+    with pytest.raises(ValueError):
+        N5.interval(frozenset({'c'}), frozenset({'b'}))
+
+
+@pytest.mark.parametrize(('node', 'up', 'down'), [
+    (frozenset({'a'}), 3, 2),
+    (frozenset({'c'}), 2, 2),
+    (frozenset({0}), 5, 1),
+])
+def test_lattice_upset_downset(node, up, down):
+    """
+    Test principal filters and ideals.
+    """
+    assert len(N5.upset(node)._lattice) == up
+    assert len(N5.downset(node)._lattice) == down
+    assert N5.upset(node).bottom == node
+    assert N5.downset(node).top == node
+
+
+def test_lattice_sublattice():
+    """
+    Test that the generated sublattice is closed, with its own covers.
+    """
+    lattice = powerset_lattice(range(3))
+    sub = lattice.sublattice([frozenset({0}), frozenset({1, 2})])
+    assert set(sub) == {frozenset(), frozenset({0}), frozenset({1, 2}), frozenset({0, 1, 2})}
+    assert set(sub.covers(frozenset({0, 1, 2}))) == {frozenset({0}), frozenset({1, 2})}
+    assert sub.join(frozenset({0}), frozenset({1, 2})) == frozenset({0, 1, 2})
+    with pytest.raises(TypeError):
+        sub.add_node(frozenset({1}))
+
+
+@pytest.mark.parametrize('size', [1, 2])
+def test_lattice_restrict(size):
+    """
+    Test that a restricted view agrees with join and meet under the predicate.
+    """
+    lattice = powerset_lattice(range(4))
+
+    def predicate(node):
+        """
+        Keep the nodes of a certain size, and the top and bottom.
+        """
+        return len(node) in (0, size, 4)
+
+    restricted = lattice.restrict(predicate)
+    assert len(restricted._lattice) == 2 + (4 if size == 1 else 6)
+    for a, b in combinations(lattice, 2):
+        assert restricted.join(a, b) == lattice.join(a, b, predicate=predicate)
+        assert restricted.meet(a, b) == lattice.meet(a, b, predicate=predicate)
+
+
+def test_lattice_restrict_empty():
+    """
+    Test restrictions without satisfying nodes.
+    """
+    with pytest.raises(ValueError):
+        N5.restrict(lambda node: False)
+    restricted = N5.restrict(lambda node: node == n5_a)
+    with pytest.raises(ValueError):
+        restricted.join(n5_b)
+
+
+def test_lattice_product():
+    """
+    Test that the product of chains matches the powerset lattice.
+    """
+    chain = Lattice([0, 1], lambda a, b: a <= b)
+    lattice = Lattice.product(chain, chain, chain)
+    powerset = powerset_lattice(range(3))
+    assert len(lattice._lattice) == 8
+    assert lattice._lattice.number_of_edges() == powerset._lattice.number_of_edges()
+    assert lattice.top == (1, 1, 1)
+    assert lattice.bottom == (0, 0, 0)
+    assert lattice.join((1, 0, 0), (0, 0, 1)) == (1, 0, 1)
+    assert lattice._relationship((0, 1, 0), (1, 1, 0))
+    assert not lattice._relationship((0, 1, 0), (1, 0, 0))
+
+
+def test_lattice_product_generic():
+    """
+    Test that the product agrees with the generic constructor.
+    """
+    lattice = Lattice.product(N5, M3)
+    generic = Lattice(lattice, lattice._relationship)
+    assert set(lattice._lattice.edges()) == set(generic._lattice.edges())
+
+
+def test_lattice_ordinal_sum():
+    """
+    Test stacking lattices.
+    """
+    chain = Lattice(['x', 'y'], lambda a, b: a <= b)
+    lattice = Lattice.ordinal_sum(chain, M3)
+    assert len(lattice._lattice) == 7
+    assert lattice.bottom == 'x'
+    assert lattice.top == frozenset({1})
+    assert set(lattice.covers(frozenset({0}))) == {'y'}
+    assert lattice.join('y', frozenset({'a'})) == frozenset({'a'})
+    assert lattice._relationship('x', frozenset({'b'}))
+    with pytest.raises(ValueError):
+        Lattice.ordinal_sum(M3, N5)
+
+
+def test_lattice_dual():
+    """
+    Test that the dual reverses the order.
+    """
+    dual = N5.dual()
+    assert dual.top == N5.bottom
+    assert dual.bottom == N5.top
+    assert dual.join(frozenset({'a'}), frozenset({'b'})) == frozenset({'a'})
+    assert dual.ascendants(frozenset({'c'})) == {frozenset({0})}
+
+
+@pytest.mark.parametrize(('lattice', 'total'), [
+    (M3, 2),
+    (N5, 5),
+    (powerset_lattice(range(3)), 8),
+    (free_distributive_lattice(range(3)), 64),
+    (Lattice.product(N5, Lattice(range(3), lambda a, b: a <= b)), 20),
+])
+def test_lattice_congruences(lattice, total):
+    """
+    Test the size of congruence lattices.
+    """
+    congruences = lattice.congruences()
+    assert len(congruences._lattice) == total
+    assert congruences.bottom == frozenset(frozenset({node}) for node in lattice)
+    assert congruences.top == frozenset({frozenset(lattice)})
+
+
+n5_0, n5_a, n5_b, n5_c, n5_1 = (frozenset({x}) for x in [0, 'a', 'b', 'c', 1])
+
+
+@pytest.mark.parametrize(('a', 'b', 'blocks'), [
+    (n5_a, n5_b, {frozenset({n5_0}), frozenset({n5_a, n5_b}), frozenset({n5_c}), frozenset({n5_1})}),
+    (n5_0, n5_c, {frozenset({n5_0, n5_c}), frozenset({n5_a, n5_b, n5_1})}),
+    (n5_0, n5_a, {frozenset({n5_0, n5_a, n5_b}), frozenset({n5_c, n5_1})}),
+    (n5_c, n5_1, {frozenset({n5_0, n5_a, n5_b}), frozenset({n5_c, n5_1})}),
+    (n5_a, n5_c, {frozenset({n5_0, n5_a, n5_b, n5_c, n5_1})}),
+])
+def test_lattice_principal_congruence(a, b, blocks):
+    """
+    Test principal congruences of N5.
+    """
+    assert N5.principal_congruence(a, b) == blocks
+
+
+def test_lattice_quotient():
+    """
+    Test the quotient by a congruence.
+    """
+    quotient = N5.quotient(N5.principal_congruence(n5_a, n5_b))
+    assert len(quotient._lattice) == 4
+    assert quotient.top == frozenset({n5_1})
+    assert quotient.join(frozenset({n5_a, n5_b}), frozenset({n5_c})) == frozenset({n5_1})
+    assert quotient.distributive
+
+
+@pytest.mark.parametrize(('a', 'b', 'truth'), [
+    (N5, N5.dual(), True),
+    (M3, N5, False),
+    (powerset_lattice(range(3)), Lattice.product(*[Lattice([0, 1], lambda a, b: a <= b)] * 3), True),
+    (powerset_lattice(range(3)), Lattice(range(8), lambda a, b: a <= b), False),
+    (Lattice.product(N5, M3), Lattice.product(M3, N5), True),
+])
+def test_lattice_isomorphic(a, b, truth):
+    """
+    Test isomorphism through canonical forms.
+    """
+    assert a.isomorphic(b) == truth
+    assert (a.canonical_form() == b.canonical_form()) == truth
+
+
+def test_lattice_canonical_form_relabel():
+    """
+    Test that relabeling the nodes does not change the canonical form.
+    """
+    lattice = free_distributive_lattice(range(3))
+    relabeled = Lattice(reversed(list(lattice)), lattice._relationship)
+    assert relabeled.canonical_form() == lattice.canonical_form()
+    assert len({lattice.canonical_form(), relabeled.canonical_form(), N5.canonical_form()}) == 2
+
+
+@pytest.mark.parametrize('lattice', [
+    powerset_lattice(range(3)),
+    partition_lattice(range(4)),
+    free_distributive_lattice(range(3)),
+])
+def test_lattice_symmetries(lattice):
+    """
+    Test that checking one pair per orbit agrees with checking every pair.
+    """
+    pairs = list(lattice._pair_representatives())
+    assert len(pairs) < len(lattice._ts) * (len(lattice._ts) - 1)
+    checks = (lattice.distributive, lattice.modular, lattice._validate())
+    lattice._symmetries = []
+    assert (lattice.distributive, lattice.modular, lattice._validate()) == checks
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_lattice_pair_representatives(ordered):
+    """
+    Test that each orbit of pairs has exactly one representative.
+    """
+    lattice = powerset_lattice(range(3))
+    assert lattice._symmetries
+    images = [[lattice._ts[i] for i in permutation] for permutation in lattice._symmetries]
+    maps = [dict(zip(lattice._ts, image)) for image in images]
+    representatives = list(lattice._pair_representatives(ordered=ordered))
+    pairs = list(product(lattice, repeat=2)) if ordered else list(combinations(lattice, 2))
+    for a, b in pairs:
+        if a == b:
+            continue
+        orbit, stack = {(a, b)}, [(a, b)]
+        while stack:
+            c, d = stack.pop()
+            for image in [(m[c], m[d]) for m in maps] + ([] if ordered else [(d, c)]):
+                if image not in orbit:
+                    orbit.add(image)
+                    stack.append(image)
+        assert len(orbit & set(representatives)) == 1
+
+
+def test_lattice_automorphisms():
+    """
+    Test the detection of automorphisms.
+    """
+    assert N5.automorphisms() == []
+    for automorphism in M3.automorphisms():
+        assert automorphism[M3.top] == M3.top
+        assert automorphism[M3.bottom] == M3.bottom
+    assert len(list(M3._pair_representatives())) == 7
+
+
+def test_lattice_symmetries_invalid():
+    """
+    Test that symmetries which are not automorphisms are rejected.
+    """
+    with pytest.raises(ValueError):
+        Lattice(range(3), lambda a, b: a <= b, symmetries=[lambda n: n + 1])
+    with pytest.raises(ValueError):
+        Lattice(range(3), lambda a, b: a <= b, symmetries=[lambda n: 2 - n])
+
+
+@pytest.mark.parametrize('workers', [None, 2])
+def test_lattice_generate(workers):
+    """
+    Test generating a lattice from singletons under union and intersection.
+    """
+    generators = [frozenset({i}) for i in range(3)]
+    with ThreadPoolExecutor(workers) if workers else nullcontext() as executor:
+        lattice = Lattice.generate(generators, frozenset.union, frozenset.intersection, executor=executor)
+    assert lattice.isomorphic(powerset_lattice(range(3)))
+    assert lattice.top == frozenset(range(3))
+    assert lattice.bottom == frozenset()
+
+
+def test_lattice_generate_sublattice():
+    """
+    Test generating a sublattice of a partition lattice.
+    """
+    lattice = partition_lattice(range(4))
+    generators = [frozenset({frozenset({0, 1}), frozenset({2}), frozenset({3})}),
+                  frozenset({frozenset({0}), frozenset({1}), frozenset({2, 3})})]
+    generated = Lattice.generate(generators, lattice.join, lattice.meet)
+    assert len(generated._lattice) == 4
+    assert set(generated) == set(lattice.sublattice(generators))
+
+
+@pytest.mark.parametrize('table_size', [0, 2048])
+@pytest.mark.parametrize('lattice', [N5, free_distributive_lattice(range(3)), partition_lattice(range(4))])
+def test_lattice_join_meet_many(lattice, table_size, monkeypatch):
+    """
+    Test that batched joins and meets agree with the scalar ones, whether
+    tabulated or computed from bitsets.
+    """
+    monkeypatch.setattr('lattices.lattice._TABLE_SIZE', table_size)
+    pairs = list(product(lattice, repeat=2))
+    joins = lattice.join_many(pairs, chunksize=7)
+    meets = lattice.meet_many(pairs, chunksize=7)
+    assert list(joins) == [lattice.join(a, b) for a, b in pairs]
+    assert list(meets) == [lattice.meet(a, b) for a, b in pairs]
+    indices = np.array([[lattice._index[a], lattice._index[b]] for a, b in pairs])
+    assert list(lattice.join_many(indices, indices=True)) == [lattice._index[j] for j in joins]
+
+
+@pytest.mark.parametrize('table_size', [0, 2048])
+def test_lattice_join_meet_many_memory(table_size, monkeypatch):
+    """
+    Test that chunks sized by a memory budget give the same results, down to
+    a single pair per chunk.
+    """
+    monkeypatch.setattr('lattices.lattice._TABLE_SIZE', table_size)
+    lattice = free_distributive_lattice(range(3))
+    pairs = list(product(lattice, repeat=2))
+    for memory in [1, 1000, 2**24]:
+        assert list(lattice.join_many(pairs, memory=memory)) == [lattice.join(a, b) for a, b in pairs]
+        assert list(lattice.meet_many(pairs, memory=memory)) == [lattice.meet(a, b) for a, b in pairs]
+
+
+def test_lattice_join_meet_many_view():
+    """
+    Test batched joins and meets within a view.
+    """
+    lattice = powerset_lattice(range(3))
+    restricted = lattice.restrict(lambda node: len(node) != 1)
+    pairs = list(product(lattice, repeat=2))
+    assert list(restricted.join_many(pairs)) == [restricted.join(a, b) for a, b in pairs]
+    assert list(restricted.meet_many(pairs)) == [restricted.meet(a, b) for a, b in pairs]
+    with pytest.raises(ValueError):
+        N5.restrict(lambda node: node == n5_a).join_many([(n5_b, n5_b)])
+
+
+def test_lattice_view_shares_tables():
+    """
+    Test that views reuse the packed bitsets and, when they are sublattices,
+    the operation tables of the underlying lattice.
+    """
+    lattice = powerset_lattice(range(4))
+    interval = lattice.interval(frozenset({0}), frozenset({0, 1, 2}))
+    restricted = lattice.restrict(lambda node: len(node) != 2)
+    pairs = list(product(interval, repeat=2))
+    assert list(interval.join_many(pairs)) == [interval.join(a, b) for a, b in pairs]
+    assert interval._tables.keys() == {'members'}
+    assert lattice._tables['join'] is interval._operation_table('join')
+    pairs = list(product(restricted, repeat=2))
+    assert list(restricted.meet_many(pairs)) == [restricted.meet(a, b) for a, b in pairs]
+    assert restricted._bitset_matrix('down') is lattice._tables['down']
+    assert 'meet' not in lattice._tables
+    assert interval.labels == {node: lattice.labels[node] for node in interval}
@@ -7,6 +7,7 @@ import pytest
 from lattices.lattices import (dependency_antichain_lattice,
                                dependency_lattice,
                                free_distributive_lattice,
+                               free_modular_lattice,
                                partition_antichain_lattice,
                                partition_lattice,
                                powerset_lattice,
@@ -157,3 +158,24 @@ def test_partition_antichain_lattice(size, true):
     """
     lattice = partition_antichain_lattice(range(size))
     assert len(lattice._lattice) == true
+
+
+@pytest.mark.parametrize(('size', 'true'), [
+    (1, 1),
+    (2, 4),
+    (3, 28),
+])
+def test_free_modular_lattice(size, true):
+    """
+    """
+    lattice = free_modular_lattice('abc'[:size])
+    assert len(lattice._lattice) == true
+    assert lattice.modular
+    assert lattice.distributive == (size < 3)
+
+
+def test_free_modular_lattice_infinite():
+    """
+    """
+    with pytest.raises(ValueError):
+        free_modular_lattice(range(4))
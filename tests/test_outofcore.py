@@ -0,0 +1,94 @@
+"""
+Tests for lattices.outofcore
+"""
+
+import os
+from itertools import product
+
+import numpy as np
+import pytest
+
+from lattices.backends import CSRBackend
+from lattices.lattices import free_distributive_lattice, partition_lattice
+from lattices.outofcore import out_of_core_lattice
+from lattices.progress import CancellationToken, Cancelled
+
+
+@pytest.mark.parametrize('memory', [1, 64, 2**20])
+@pytest.mark.parametrize('reference', [free_distributive_lattice(range(3)), partition_lattice(range(4))])
+def test_out_of_core(reference, memory):
+    """
+    Test that the lattice matches one constructed in memory, whatever the block
+    sizes.
+    """
+    lattice = out_of_core_lattice(list(reference)[::-1], reference._relationship, memory=memory)
+    assert lattice.backend == 'csr'
+    assert isinstance(lattice._backend.lower_indices, np.memmap)
+    assert lattice.top == reference.top
+    assert lattice.bottom == reference.bottom
+    assert set(lattice._lattice.edges()) == set(reference._lattice.edges())
+    nodes = list(reference)
+    for a in nodes[::3]:
+        for b in nodes[::2]:
+            assert lattice.join(a, b) == reference.join(a, b)
+            assert lattice.meet(a, b) == reference.meet(a, b)
+
+
+@pytest.mark.parametrize('chunksize', [1, 7, None])
+def test_join_meet_many(monkeypatch, chunksize):
+    """
+    Test that join_many and meet_many pack only the bitsets of each chunk, and
+    agree with the lattice constructed in memory.
+    """
+    monkeypatch.setattr('lattices.lattice._TABLE_SIZE', 0)
+    reference = partition_lattice(range(4))
+    lattice = out_of_core_lattice(reference, reference._relationship)
+    packed = []
+    original = CSRBackend.packed
+
+    def record(backend, direction, rows=None):
+        """
+        Record the number of rows packed.
+        """
+        packed.append(None if rows is None else len(rows))
+        return original(backend, direction, rows)
+
+    monkeypatch.setattr('lattices.backends.CSRBackend.packed', record)
+    pairs = list(product(reference, repeat=2))
+    assert list(lattice.join_many(pairs, chunksize=chunksize)) == [reference.join(a, b) for a, b in pairs]
+    assert list(lattice.meet_many(pairs, chunksize=chunksize)) == [reference.meet(a, b) for a, b in pairs]
+    assert None not in packed
+    if chunksize is not None:
+        assert max(packed) <= 2 * chunksize
+
+
+def test_directory(tmp_path):
+    """
+    Test that the cover relation is left in the given directory, and the
+    comparability matrices removed.
+    """
+    reference = free_distributive_lattice(range(3))
+    lattice = out_of_core_lattice(reference, reference._relationship, directory=str(tmp_path))
+    assert sorted(os.listdir(tmp_path)) == ['lower_indices.bin', 'lower_indptr.bin',
+                                            'upper_indices.bin', 'upper_indptr.bin']
+    assert lattice.distributive
+
+
+def test_reach_cache():
+    """
+    Test that the cache of up-sets and down-sets is bounded by the memory.
+    """
+    reference = free_distributive_lattice(range(3))
+    lattice = out_of_core_lattice(reference, reference._relationship, memory=24)
+    for node in reference:
+        lattice.descendants(node)
+    assert len(lattice._down._rows) <= 8
+
+
+def test_cancel():
+    """
+    Test that the construction can be cancelled.
+    """
+    reference = free_distributive_lattice(range(3))
+    with pytest.raises(Cancelled):
+        out_of_core_lattice(reference, reference._relationship, token=CancellationToken(max_elements=4))
@@ -0,0 +1,77 @@
+"""
+Tests for lattices.partitions
+"""
+
+from itertools import combinations
+
+import pytest
+
+from lattices.lattices import partition_lattice
+from lattices.partitions import PartitionLattice, partition_join, partition_meet
+
+
+def test_partition_operations():
+    """
+    Test that the algebraic join and meet agree with the partition lattice.
+    """
+    lattice = partition_lattice(range(4))
+    for a, b in combinations(lattice, 2):
+        assert partition_join(a, b) == lattice.join(a, b)
+        assert partition_meet(a, b) == lattice.meet(a, b)
+
+
+@pytest.mark.parametrize(('size', 'true'), [
+    (0, 1),
+    (1, 1),
+    (3, 5),
+    (4, 15),
+    (10, 115975),
+])
+def test_partition_lattice_size(size, true):
+    """
+    Test the number of partitions.
+    """
+    assert len(PartitionLattice(range(size))) == true
+
+
+@pytest.mark.parametrize('size', range(1, 5))
+def test_partition_lattice_iter(size):
+    """
+    Test that iteration visits each partition once, in a topological order.
+    """
+    lattice = PartitionLattice(range(size))
+    nodes = list(lattice)
+    assert len(nodes) == len(set(nodes)) == len(lattice)
+    assert set(nodes) == set(partition_lattice(range(size)))
+    assert nodes[0] == lattice.top
+    assert nodes[-1] == lattice.bottom
+    assert all(not lattice.le(a, b) for a, b in combinations(nodes, 2) if a != b)
+    assert all(node in lattice for node in nodes)
+
+
+def test_partition_lattice_covers():
+    """
+    Test the covers against the Hasse diagram.
+    """
+    lattice = PartitionLattice(range(4))
+    hasse = partition_lattice(range(4))._lattice
+    for node in lattice:
+        covers = list(lattice.covers(node))
+        assert len(covers) == len(set(covers))
+        assert set(covers) == set(hasse[node])
+        assert set(lattice.upper_covers(node)) == set(hasse.pred[node])
+
+
+def test_partition_lattice_large():
+    """
+    Test operations on a lattice too large to construct.
+    """
+    lattice = PartitionLattice(range(10))
+    a = frozenset({frozenset(range(5)), frozenset(range(5, 10))})
+    b = frozenset({frozenset({4, 5})} | {frozenset({i}) for i in range(10) if i not in (4, 5)})
+    assert lattice.join(a, b) == lattice.top
+    assert lattice.meet(a, b) == lattice.bottom
+    assert lattice.join() == lattice.bottom
+    assert lattice.meet() == lattice.top
+    assert lattice.le(lattice.bottom, a) and not lattice.le(a, b)
+    assert frozenset({frozenset({1})}) not in lattice
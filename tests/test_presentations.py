@@ -0,0 +1,66 @@
+"""
+Tests for lattices.presentations
+"""
+
+from operator import le
+
+import pytest
+
+from lattices.lattice import Lattice
+from lattices.lattices import free_distributive_lattice
+from lattices.presentations import finitely_presented_lattice
+
+
+def test_finitely_presented_lattice_distributive():
+    """
+    Test that the two element model presents free distributive lattices.
+    """
+    lattice = finitely_presented_lattice('abc', models=[Lattice(range(2), le)])
+    assert lattice.isomorphic(free_distributive_lattice(range(3)))
+
+
+@pytest.mark.parametrize(('relations', 'true'), [
+    ([('a', ('meet', 'a', 'b'))], 8),
+    ([('a', 'b')], 4),
+    ([('a', ('meet', 'a', 'b')), ('b', ('meet', 'b', 'c'))], 3),
+])
+def test_finitely_presented_lattice_relations(relations, true):
+    """
+    Test presentations with relations.
+    """
+    lattice = finitely_presented_lattice('abc', relations)
+    assert len(lattice._lattice) == true
+
+
+def test_finitely_presented_lattice_order():
+    """
+    Test that the order found from the join table matches the generic constructor.
+    """
+    lattice = finitely_presented_lattice('abc', [('a', ('meet', 'a', 'b'))])
+    generic = Lattice(list(lattice), lattice._relationship)
+    assert set(generic._lattice.edges()) == set(lattice._lattice.edges())
+    terms = {str(term): term for term in lattice}
+    assert lattice.join(terms['a'], terms['b']) == terms['b']
+    assert lattice.meet(terms['a'], terms['b']) == terms['a']
+
+
+def test_finitely_presented_lattice_terms():
+    """
+    Test that each element is represented by one term.
+    """
+    lattice = finitely_presented_lattice('ab')
+    assert sorted(map(str, lattice)) == ['(a∧b)', '(a∨b)', 'a', 'b']
+    assert repr(lattice.top) == "Term('(a∨b)')"
+
+
+@pytest.mark.parametrize(('generators', 'relations', 'budget'), [
+    ('', [], None),
+    ('abc', [], 10),
+    ('ab', [('a', ('complement', 'b'))], None),
+])
+def test_finitely_presented_lattice_errors(generators, relations, budget):
+    """
+    Test the errors raised by finitely_presented_lattice.
+    """
+    with pytest.raises(ValueError):
+        finitely_presented_lattice(generators, relations, budget=budget)
@@ -0,0 +1,137 @@
+"""
+Tests for lattices.progress
+"""
+
+import pickle
+
+import networkx as nx
+import pytest
+
+from lattices.lattice import Lattice
+from lattices.lattices import dependency_antichain_lattice, free_distributive_lattice, powerset_lattice
+from lattices.progress import CancellationToken, Cancelled
+
+
+def subset_le(a, b):
+    """
+    a <= b --> a is a subset of b.
+    """
+    return a <= b
+
+
+@pytest.mark.parametrize('constructor', [powerset_lattice, free_distributive_lattice])
+def test_progress_phases(constructor):
+    """
+    Test that each phase is reported from start to finish.
+    """
+    reports = []
+    constructor(range(3), progress=lambda *report: reports.append(report))
+    phases = list(dict.fromkeys(phase for phase, _, _ in reports))
+    assert phases[-3:] == ['comparison', 'sort', 'reduction']
+    assert phases[0] in {'enumeration', 'filtering'}
+    for phase in phases:
+        done = [d for p, d, _ in reports if p == phase]
+        totals = {t for p, _, t in reports if p == phase}
+        assert done[0] == 0
+        assert done == sorted(done)
+        assert totals == {done[-1]}
+
+
+def test_progress_counts():
+    """
+    Test the totals reported for the comparison of nodes.
+    """
+    reports = []
+    powerset_lattice(range(6), progress=lambda *report: reports.append(report))
+    comparisons = [(done, total) for phase, done, total in reports if phase == 'comparison']
+    assert comparisons[-1] == (64 * 63 // 2, 64 * 63 // 2)
+    assert len(comparisons) > 2
+
+
+def test_cancel():
+    """
+    Test that a cancelled token stops the construction with the nodes found.
+    """
+    token = CancellationToken()
+
+    def progress(phase, done, total):
+        """
+        Cancel midway through filtering.
+        """
+        if phase == 'filtering' and done >= 1024:
+            token.cancel()
+
+    with pytest.raises(Cancelled) as error:
+        dependency_antichain_lattice(range(4), progress=progress, token=token)
+    assert error.value.phase == 'filtering'
+    assert isinstance(error.value.partial, list)
+    assert 'cancelled' in str(error.value)
+
+
+def test_cancel_comparison():
+    """
+    Test that the partial order found so far is complete on the nodes compared.
+    """
+    token = CancellationToken()
+    nodes = list(powerset_lattice(range(6)))
+
+    def progress(phase, done, total):
+        """
+        Cancel midway through the comparison.
+        """
+        if phase == 'comparison' and done:
+            token.cancel()
+
+    with pytest.raises(Cancelled) as error:
+        Lattice(nodes, subset_le, progress=progress, token=token)
+    assert error.value.phase == 'comparison'
+    order = error.value.partial
+    assert isinstance(order, nx.DiGraph)
+    compared = [node for node in nodes if order.degree(node)]
+    for a in compared[:10]:
+        for b in compared[:10]:
+            assert order.has_edge(b, a) == (a < b)
+
+
+def test_max_elements():
+    """
+    Test that the element budget stops the construction.
+    """
+    with pytest.raises(Cancelled) as error:
+        powerset_lattice(range(5), token=CancellationToken(max_elements=20))
+    assert len(error.value.partial) <= 32
+
+
+def test_timeout():
+    """
+    Test that an expired token stops the construction.
+    """
+    with pytest.raises(Cancelled) as error:
+        powerset_lattice(range(2), token=CancellationToken(timeout=-1))
+    assert 'out of time' in str(error.value)
+
+
+def test_token_wait():
+    """
+    Test that waiting on a token times out until it is cancelled.
+    """
+    token = CancellationToken()
+    assert not token.wait(0.01)
+    token.cancel()
+    assert token.wait(0)
+
+
+def test_token_unused():
+    """
+    Test that a generous token does not interfere.
+    """
+    lattice = powerset_lattice(range(3), token=CancellationToken(timeout=60, max_elements=8))
+    assert len(list(lattice)) == 8
+
+
+def test_cancelled_pickle():
+    """
+    Test that a Cancelled survives pickling with its phase and partial result.
+    """
+    error = pickle.loads(pickle.dumps(Cancelled('cancelled', phase='sort', partial=[1, 2])))
+    assert (str(error), error.phase, error.partial) == ('cancelled', 'sort', [1, 2])
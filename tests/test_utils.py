@@ -4,7 +4,7 @@ Tests for lattices.utils
 
 import pytest
 
-from lattices.utils import flatten, powerset
+from lattices.utils import Powerset, flatten, flatten_ragged, powerset, subset_masks, subset_rank, subset_unrank
 
 
 @pytest.mark.parametrize(('stuff', 'min_size', 'size'), [
@@ -46,6 +46,89 @@ def test_powerset_3(stuff, min_size, thing):
     assert thing not in list(powerset(stuff, size_limit=min_size))
 
 
+@pytest.mark.parametrize(('min_size', 'max_size', 'size'), [
+    (0, None, 16),
+    (0, 2, 11),
+    (1, 1, 4),
+    (3, 2, 0),
+])
+def test_powerset_max_size(min_size, max_size, size):
+    """
+    Test bounding the size of subsets from both sides.
+    """
+    subsets = list(powerset(range(4), size_limit=min_size, max_size=max_size))
+    assert len(subsets) == size
+    assert all(min_size <= len(subset) <= (max_size or 4) for subset in subsets)
+
+
+@pytest.mark.parametrize('n', range(6))
+@pytest.mark.parametrize('min_size', [0, 1, 2])
+def test_subset_masks(n, min_size):
+    """
+    Test that the bitmasks come by size, then in increasing order, and that
+    they are ranked by position.
+    """
+    masks = list(subset_masks(n, size_limit=min_size))
+    assert masks == sorted(masks, key=lambda mask: (bin(mask).count('1'), mask))
+    assert {frozenset(i for i in range(n) if mask >> i & 1) for mask in masks} == set(powerset(range(n), min_size))
+    for rank, mask in enumerate(masks):
+        assert subset_rank(mask, n, size_limit=min_size) == rank
+        assert subset_unrank(rank, n, size_limit=min_size) == mask
+
+
+def test_subset_unrank_range():
+    """
+    Test that ranks past the end are rejected.
+    """
+    with pytest.raises(IndexError):
+        subset_unrank(8, 3)
+
+
+@pytest.mark.parametrize('n', range(1, 7))
+def test_subset_masks_gray(n):
+    """
+    Test that successive subsets in Gray code order differ by one element.
+    """
+    masks = list(subset_masks(n, gray=True))
+    assert sorted(masks) == list(range(2**n))
+    assert all(bin(a ^ b).count('1') == 1 for a, b in zip(masks, masks[1:]))
+
+
+def test_subset_masks_gray_sizes():
+    """
+    Test that Gray code order respects the bounds on sizes.
+    """
+    masks = list(subset_masks(5, size_limit=2, max_size=3, gray=True))
+    assert sorted(masks) == sorted(subset_masks(5, size_limit=2, max_size=3))
+
+
+def test_powerset_class():
+    """
+    Test the lazy sequence of subsets.
+    """
+    subsets = Powerset('abcd', size_limit=1, max_size=3)
+    assert len(subsets) == 14
+    assert set(subsets) == set(powerset('abcd', 1, 3))
+    assert subsets[0] == frozenset('a')
+    assert subsets[-1] == frozenset('bcd')
+    assert list(subsets[4:6]) == [frozenset('ab'), frozenset('ac')]
+    with pytest.raises(IndexError):
+        subsets[14]
+    with pytest.raises(ValueError):
+        subsets[::2]
+
+
+@pytest.mark.parametrize('workers', [1, 3, 7])
+def test_powerset_split(workers):
+    """
+    Test that slices split the enumeration between workers.
+    """
+    subsets = Powerset(range(9), size_limit=2)
+    bounds = [len(subsets) * k // workers for k in range(workers + 1)]
+    parts = [list(subsets[a:b].masks()) for a, b in zip(bounds, bounds[1:])]
+    assert [mask for part in parts for mask in part] == list(subset_masks(9, size_limit=2))
+
+
 @pytest.mark.parametrize(('nested', 'flat', 'levels'), [
     ([[[1], 2], 3], [1, 2, 3], None),
     ([[[1], 2], 3], [[1], 2, 3], 1),
@@ -56,4 +139,57 @@ def test_flatten_1(nested, flat, levels):
     """
     Test some flattenings.
     """
-    list(flatten(nested, levels=levels)) == flat
+    assert list(flatten(nested, levels=levels)) == flat
+
+
+def test_flatten_deep():
+    """
+    Test flattening lists nested beyond the recursion limit.
+    """
+    nested = [0]
+    for i in range(1, 5000):
+        nested = [nested, i]
+    assert list(flatten(nested)) == list(range(5000))
+    assert list(flatten(nested, levels=4998)) == [[0], *range(1, 5000)]
+
+
+def test_flatten_strings():
+    """
+    Test that strings are split into characters, which are kept.
+    """
+    assert list(flatten(['ab', ['c']])) == ['a', 'b', 'c']
+
+
+def test_flatten_ragged():
+    """
+    Test the ragged layout of sets of sets.
+    """
+    nodes = [frozenset([frozenset([0, 1]), frozenset([2])]), frozenset([frozenset([0, 1, 2])])]
+    elements, values, offsets = flatten_ragged(nodes)
+    assert [len(offset) for offset in offsets] == [3, 4]
+    assert offsets[0].tolist() == [0, 2, 3]
+    for n, node in enumerate(nodes):
+        blocks = range(offsets[0][n], offsets[0][n + 1])
+        rebuilt = frozenset(frozenset(elements[v] for v in values[offsets[1][b]:offsets[1][b + 1]]) for b in blocks)
+        assert rebuilt == node
+    for b in range(3):
+        block = values[offsets[1][b]:offsets[1][b + 1]]
+        assert block.tolist() == sorted(block.tolist())
+
+
+def test_flatten_ragged_flat():
+    """
+    Test that flat elements have no offsets.
+    """
+    elements, values, offsets = flatten_ragged('abca')
+    assert elements == ['a', 'b', 'c']
+    assert values.tolist() == [0, 1, 2, 0]
+    assert offsets == []
+
+
+def test_flatten_ragged_uneven():
+    """
+    Test that uneven nesting is rejected.
+    """
+    with pytest.raises(ValueError):
+        flatten_ragged([frozenset([frozenset([0])]), frozenset([1])])